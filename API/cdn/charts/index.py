@@ -39,7 +39,9 @@ def setup():
                 chart = await methods.Tools.get_chart(difficulty, id, region)
 
                 if mirror == 1:
-                    chart = await to_process_with_timeout(pjsk_chart.mirror, chart)
+                    chart = await to_process_with_timeout(
+                        pjsk_chart.mirrored_chart, chart, id, difficulty, region
+                    )
 
                 return (
                     FileResponse(chart)
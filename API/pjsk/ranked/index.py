@@ -9,6 +9,7 @@ from main import TwitchBot, DiscordBot
 from DATA.game_api import methods
 
 from DATA.helpers.unblock import to_process_with_timeout
+from DATA.helpers import master_index
 
 router = APIRouter()
 
@@ -29,36 +30,28 @@ def setup():
 
         prev_data = cached.get(region, {})
 
-        if prev_data.get("updated", 0) + 300 > time.time():
+        if prev_data.get("next_available_update", 0) > time.time():
             return JSONResponse(content=prev_data)
 
         updated = time.time()
 
-        data = api.get_master_data("rankMatchSeasons.json")
-        current = None
-        for i in range(0, len(data)):
-            startAt = data[i]["startAt"]
-            endAt = data[i]["closedAt"]
-            now = int(round(time.time() * 1000))
-            if startAt < now < endAt:
-                current = data[i]
-
-        if not current:
-            if (
-                len(data) == 1
-            ):  # 如果只有一个数据，有可能是开第一次排位之前，也有可能是第一次排位之后，排除第一个排位之前的
-                if now < data[0]["startAt"]:
-                    current = None
-                else:
-                    current = data[len(data) - 1]
-            else:
-                current = data[len(data) - 1]
+        seasons = master_index.rank_match_seasons(api)
+        now = int(round(updated * 1000))
+        current = seasons.current(now)
+        changes_at = seasons.changes_at(now)
+        changes_at = changes_at / 1000 if changes_at is not None else None
+        if current:
+            next_available_update = min(updated + 300, changes_at or updated + 300)
+        else:
+            # between seasons the last one's leaderboard is final until the next starts
+            current = seasons.previous(now)
+            next_available_update = changes_at or updated + 300
 
         if not current:
             return JSONResponse(
                 content={
                     "updated": updated,
-                    "next_available_update": updated + 300,
+                    "next_available_update": next_available_update,
                     "ranked_season": None,
                 },
                 status_code=404,
@@ -67,7 +60,7 @@ def setup():
         def grab_data():
             data = {
                 "updated": updated,
-                "next_available_update": updated + 300,
+                "next_available_update": next_available_update,
                 "ranked_season": current,
                 "top_100": api.get_ranked_leaderboard(),
             }
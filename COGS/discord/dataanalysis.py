@@ -14,22 +14,23 @@ from io import BytesIO, StringIO
 import typing
 
 import aiohttp
-from PIL import Image, ImageDraw, ImageFont
 
 from DATA.helpers import discord_autocompletes as autocompletes
 from DATA.helpers import tools
 from DATA.helpers import embeds
-from DATA.helpers.unblock import to_process_with_timeout
+from DATA.helpers.unblock import to_process_with_timeout, to_render_process
 from DATA.helpers import converters
+from DATA.helpers import render_cache
+from DATA.helpers import jacket_atlas
+from DATA.helpers import master_index
 
 from DATA.game_api import methods
 
 from COGS.progress_generate import (
-    generate_progress,
     DifficultyCategory,
-    generate_general_progress,
     StrDifficultyCategory,
 )
+from COGS import render_jobs
 
 
 class DataAnalysis(commands.Cog):
@@ -58,32 +59,53 @@ class DataAnalysis(commands.Cog):
             if time.time() - last_ran > 120:  # 2 minutes
                 self.cooldown_summary.pop(uid, None)
 
+    @staticmethod
+    def upload_stamps(data: dict) -> list:
+        """(region, upload time, game user id) of every region's uploaded data in data."""
+        if "now" in data:  # a single region's data
+            regions = {None: data}
+        else:
+            regions = {r: d for r, d in data.items() if isinstance(d, dict)}
+        return [
+            (region, d.get("now"), d.get("userGamedata", {}).get("userId"))
+            for region, d in regions.items()
+        ]
+
+    def render_key(
+        self, kind: str, user: discord.User, private: bool, stamps: list, *options
+    ) -> str:
+        """
+        Render cache key of an image: the uploads it shows, who it's for, its options and
+        the versions of the constants, master data and leak checks it was made with.
+        """
+        return render_cache.key(
+            kind,
+            stamps,
+            user.id,
+            user.name,
+            private,
+            options,
+            self.bot.cache.constants_version,
+            self.bot.pjsk.master_version,
+            self.bot.pjsk.availability.version,
+        )
+
     async def generate_summary(
         self, user_data: dict, region: str, now: int, private: bool, user: discord.User
     ) -> BytesIO:
         difficulty_counts = {}
 
         def _make():
+            availability = self.bot.pjsk.availability
             for music_id, ds in self.bot.pjsk.difficulties.items():
+                song = availability.song(music_id)
+                if song.all_leak:  # Leak on all regions
+                    continue
+                if region not in song.regions:  # It's not found in the region.
+                    continue
                 for difficulty in ds.keys():
-                    check_regions = [region]
-                    leak, song_available_regions = methods.Tools.get_music_regions(
-                        music_id
-                    )
-                    song_has_append_regions = methods.Tools.get_music_append_regions(
-                        music_id
-                    )
-                    if leak:  # Leak on all regions
-                        continue
-                    if not any(
-                        m_ar in check_regions for m_ar in song_available_regions
-                    ):  # It's not found in any of the check regions.
-                        continue
-                    if difficulty == "append" and (
-                        not any(
-                            m_ar in check_regions for m_ar in song_has_append_regions
-                        )
-                    ):  # It's append and append was not found in any of the check regions.
+                    if difficulty == "append" and region not in song.append_regions:
+                        # It's append and append was not found in the region.
                         continue
 
                     difficulty_counts[difficulty] = (
@@ -163,78 +185,27 @@ class DataAnalysis(commands.Cog):
                 ),
             ]
 
-            img = generate_general_progress(data)
-
-            img = Image.open(img)
-
-            SCALE = 2
-            new_height = img.height + (100 * SCALE)
-            new_img = Image.new(
-                "RGBA", (img.width, new_height), (50, 50, 50, 255)
-            )  # Dark gray bar
-            new_img.paste(img, (0, (100 * SCALE)))
-
-            draw = ImageDraw.Draw(new_img)
-            font = ImageFont.truetype("DATA/data/ASSETS/rodinntlg_eb.otf", 30 * SCALE)
-            font_2 = ImageFont.truetype("DATA/data/ASSETS/rodinntlg_m.otf", 30 * SCALE)
-            font_3 = ImageFont.truetype("DATA/data/ASSETS/rodinntlg_m.otf", 20 * SCALE)
-
-            new_height = img.height + 100 * SCALE  # Adjusting for one region
-            new_img = Image.new(
-                "RGBA", (img.width, new_height), (50, 50, 50, 255)
-            )  # Dark gray bar
-            new_img.paste(img, (0, 100 * SCALE))
+            return data
 
-            timestamp = now
-            data_date = datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime(
-                "%Y-%m-%d"
-            )
-            data_time = datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime(
-                "%H:%M"
-            )
-
-            draw = ImageDraw.Draw(new_img)
-            font = ImageFont.truetype("DATA/data/ASSETS/rodinntlg_eb.otf", 30 * SCALE)
-            font_2 = ImageFont.truetype("DATA/data/ASSETS/rodinntlg_m.otf", 30 * SCALE)
-            font_3 = ImageFont.truetype("DATA/data/ASSETS/rodinntlg_m.otf", 20 * SCALE)
-
-            # Draw user information
-            draw.text(
-                (10, 15 * SCALE),
-                (f"{user_data['user']['name']}" if not private else f"{user.name}"),
-                font=font,
-                fill="white",
-            )
-            draw.text(
-                (10, 60 * SCALE),
+        async def _render():
+            categories = await to_process_with_timeout(_make)
+            header = (
+                f"{user_data['user']['name']}" if not private else f"{user.name}",
                 (
                     f"{region.upper()} ID: {user_data['user']['userId']}"
                     if not private
                     else f"{region.upper()} Account"
                 ),
-                font=font_3,
-                fill="white",
-            )
-            draw.text(
-                (img.width - 215 * SCALE, 10 * SCALE),
-                f"{data_date}",
-                font=font_2,
-                fill="white",
+                now,
             )
-            draw.text(
-                (img.width - 200 * SCALE, 50 * SCALE),
-                f"{data_time} UTC",
-                font=font_2,
-                fill="white",
+            return await to_render_process(
+                render_jobs.summary_image, categories, header
             )
-            output = BytesIO()
-            new_img.save(output, format="PNG")
-            output.seek(0)
-            return output
 
-        output = await to_process_with_timeout(_make)
-
-        return output
+        key = self.render_key(
+            "summary", user, private, [(region, now, user_data["user"]["userId"])]
+        )
+        return await render_cache.cached(key, _render)
 
     async def generate_progress(
         self, data: dict, difficulty: str, private: bool, user: discord.User
@@ -254,6 +225,7 @@ class DataAnalysis(commands.Cog):
 
             check_regions = set(data.keys())
             pjsk_diffs = self.bot.pjsk.difficulties
+            availability = self.bot.pjsk.availability
 
             # --- First pass: all available difficulties ---
             for music_id, ds in pjsk_diffs.items():
@@ -261,15 +233,14 @@ class DataAnalysis(commands.Cog):
                 if not diff_data:
                     continue
 
-                leak, song_regions = methods.Tools.get_music_regions(music_id)
-                if leak:
+                song = availability.song(music_id)
+                if song.all_leak:
                     continue
-                if not (check_regions & set(song_regions)):
+                if not (check_regions & set(song.regions)):
                     continue
 
                 if difficulty == "append":
-                    _, append_regions = methods.Tools.get_music_append_regions(music_id)
-                    if not (check_regions & set(append_regions)):
+                    if not (check_regions & set(song.append_regions)):
                         continue
 
                 playlevel = diff_data["playLevel"]
@@ -369,509 +340,30 @@ class DataAnalysis(commands.Cog):
                 for pl, v in sorted(difficulties.items())
             ]
 
-            img = generate_progress(final_results, difficulty)
-
-            img = Image.open(img)
-
-            SCALE = 2
-            new_height = img.height + (
-                len(data) * 100 * SCALE
-            )  # Adjusting for multiple regions
-            new_img = Image.new(
-                "RGBA", (img.width, new_height), (50, 50, 50, 255)
-            )  # Dark gray bar
-            new_img.paste(img, (0, (len(data) * 100 * SCALE)))
+            return final_results
 
-            draw = ImageDraw.Draw(new_img)
-            font = ImageFont.truetype("DATA/data/ASSETS/rodinntlg_eb.otf", 30 * SCALE)
-            font_2 = ImageFont.truetype("DATA/data/ASSETS/rodinntlg_m.otf", 30 * SCALE)
-            font_3 = ImageFont.truetype("DATA/data/ASSETS/rodinntlg_m.otf", 20 * SCALE)
-
-            region_height_offset = 0
-            for region, d in data.items():
-                timestamp = d["now"] / 1000
-
-                data_date = datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime(
-                    "%Y-%m-%d"
-                )
-                data_time = datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime(
-                    "%H:%M"
-                )
-                # Apply font styles
-                draw.text(
-                    (10, region_height_offset + 15 * SCALE),
+        async def _render():
+            final_results = await to_process_with_timeout(_make)
+            headers = [
+                (
                     f"{d['userGamedata']['name']}" if not private else f"{user.name}",
-                    font=font,
-                    fill="white",
-                )
-                draw.text(
-                    (10, region_height_offset + 60 * SCALE),
                     (
                         f"{region.upper()} ID: {d['userGamedata']['userId']}"
                         if not private
                         else f"{region.upper()} Account"
                     ),
-                    font=font_3,
-                    fill="white",
-                )
-                draw.text(
-                    (img.width - 215 * SCALE, region_height_offset + 15 * SCALE),
-                    f"{data_date}",
-                    font=font_2,
-                    fill="white",
-                )
-                draw.text(
-                    (img.width - 200 * SCALE, region_height_offset + 50 * SCALE),
-                    f"{data_time} UTC",
-                    font=font_2,
-                    fill="white",
+                    d["now"] / 1000,
                 )
-
-                # Add a white line separator after each region's section
-                line_y = region_height_offset + 100 * SCALE
-                draw.line((0, line_y, img.width, line_y), fill="white", width=2)
-                region_height_offset += (
-                    100 * SCALE  # Move the offset down by 100px for each region
-                )
-            output = BytesIO()
-            new_img.save(output, format="PNG")
-            output.seek(0)
-            return output
-
-        output = await to_process_with_timeout(_make)
-
-        return output
-
-    def draw_b30(
-        self, songs: list, fc_only: bool, ap_only: bool, song_count: int
-    ) -> BytesIO:
-        """
-        [
-            {
-                "path": "/image.png",
-                "difficulty": "append",
-                "name": "test",
-                "constant": 32.3,
-                "ap_or_fc": "ap"
-            }
-        ]
-        """
-
-        # Local helper that uses horizontal lines (fast) to paint an RGBA gradient
-        def _create_gradient_rgba(start_color, end_color, width, height):
-            grad = Image.new("RGBA", (width, height))
-            draw_grad = ImageDraw.Draw(grad)
-            # support both RGB and RGBA tuples
-            sc = list(start_color) + [255] * (4 - len(start_color))
-            ec = list(end_color) + [255] * (4 - len(end_color))
-            r0, g0, b0, a0 = sc[:4]
-            r1, g1, b1, a1 = ec[:4]
-            h = height or 1
-            for y in range(h):
-                t = y / h
-                r = int(r0 + (r1 - r0) * t)
-                g = int(g0 + (g1 - g0) * t)
-                b = int(b0 + (b1 - b0) * t)
-                a = int(a0 + (a1 - a0) * t)
-                # draw a horizontal line with RGBA fill
-                draw_grad.line([(0, y), (width, y)], fill=(r, g, b, a))
-            return grad
-
-        # text_wrap preserved but micro-optimized: local alias for multiline_textbbox
-        def text_wrap(text, font, drawing: ImageDraw.ImageDraw, max_width, max_height):
-            def textsize_from_bbox(bbox):
-                return (bbox[2] - bbox[0], bbox[3] - bbox[1])
-
-            lines = [[]]
-            words = text.split(" ")
-            mttb = drawing.multiline_textbbox
-
-            for i, word in enumerate(words):
-                test_line = lines[-1] + ([word] if i == len(words) - 1 else [word, " "])
-                test_text = "\n".join(
-                    ["".join(line) for line in lines[:-1]] + ["".join(test_line)]
-                )
-                w, h = textsize_from_bbox(mttb((0, 0), test_text, font=font))
-
-                if w <= max_width:
-                    lines[-1].append(word)
-                    if i != len(words) - 1:
-                        lines[-1].append(" ")
-                else:
-                    if lines[-1]:
-                        lines.append([])
-                    lines[-1].append(word)
-                    if i != len(words) - 1:
-                        lines[-1].append(" ")
-
-                    w, h = textsize_from_bbox(
-                        mttb(
-                            (0, 0),
-                            "\n".join(["".join(line) for line in lines]),
-                            font=font,
-                        )
-                    )
-                    if w > max_width:
-                        # Word still doesn't fit; split by character
-                        lines.pop()
-                        current_line = []
-                        for char in word:
-                            current_line.append(char)
-                            w, h = textsize_from_bbox(
-                                mttb(
-                                    (0, 0),
-                                    "\n".join(["".join(current_line)]),
-                                    font=font,
-                                )
-                            )
-                            if w > max_width:
-                                lines.append(current_line[:-1])
-                                current_line = [current_line[-1]]
-                                w, h = textsize_from_bbox(
-                                    mttb(
-                                        (0, 0),
-                                        "\n".join(["".join(line) for line in lines]),
-                                        font=font,
-                                    )
-                                )
-                                if h > max_height:
-                                    break
-                        if current_line:
-                            lines.append(current_line)
-
-            # Remove empty lines
-            lines = [line for line in lines if "".join(line).strip()]
-
-            trimmed = False
-            while True:
-                bbox = mttb(
-                    (0, 0),
-                    "\n".join(["".join(line).rstrip() for line in lines]),
-                    font=font,
-                )
-                if textsize_from_bbox(bbox)[1] <= max_height:
-                    break
-                trimmed = True
-                if len(lines) > 1:
-                    lines.pop()
-                else:
-                    lines[-1] = lines[-1][: max(0, len(lines[-1]) - 1)]
-                    if lines[-1]:
-                        lines[-1][-1] = lines[-1][-1][:-3] + "..."
-                    else:
-                        lines[-1] = ["..."]
-                    break
-
-            if trimmed and lines:
-                last_line = "".join(lines[-1]).rstrip()
-                while (
-                    textsize_from_bbox(mttb((0, 0), last_line + "...", font=font))[0]
-                    > max_width
-                ):
-                    if len(last_line) > 1:
-                        last_line = last_line[:-1]
-                    else:
-                        last_line = "..."
-                        break
-                lines[-1] = list(last_line + "...")
-
-            return "\n".join(["".join(line).rstrip() for line in lines])
-
-        # Grid determination kept unchanged
-        def determine_grid(song_count: int):
-            column_options = [3, 4, 5, 2]
-            best_fit = None
-            min_gaps = float("inf")
-
-            for columns in column_options:
-                rows = math.ceil(song_count / columns)
-                gaps = (rows * columns) - song_count
-
-                if gaps == 0:  # Perfect fit
-                    return rows, columns
-
-                if gaps < min_gaps:
-                    min_gaps = gaps
-                    best_fit = (rows, columns)
-
-            return best_fit
-
-        amount_rows, amount_columns = determine_grid(song_count)
-
-        base_width = 2000  # Width for 3 columns
-        WIDTH = int(base_width * (amount_columns / 3))
-
-        HEADER_HEIGHT = 100
-        base_height = 2500  # Height for 10 rows
-        HEIGHT = int(base_height * (amount_rows / 10)) + HEADER_HEIGHT
-
-        SCALE = 1
-        WIDTH *= SCALE
-        HEIGHT *= SCALE
-        HEADER_HEIGHT *= SCALE
-
-        FONT_PATH = "DATA/data/ASSETS/rodinntlg_eb.otf"
-        KITTY_PATH = "DATA/data/ASSETS/kitty.png"
-
-        # Create base image
-        image = Image.new("RGBA", (WIDTH, HEIGHT), "#FFFFFF")
-        draw = ImageDraw.Draw(image)
-
-        # background kitty
-        kitty_image = Image.open(KITTY_PATH).resize((WIDTH, HEIGHT), Image.LANCZOS)
-        image.paste(kitty_image, (0, 0))
-
-        # Top bar and text
-        header_font = ImageFont.truetype(FONT_PATH, int(48 * SCALE))
-        watermark_font = ImageFont.truetype(FONT_PATH, int(30 * SCALE))
-        filtered = " - FCs Only" if fc_only else " - APs Only" if ap_only else ""
-        draw.rectangle(
-            [(0, 0), (WIDTH, HEADER_HEIGHT)], fill="#b4ccfa", outline="#00194a"
-        )
-        draw.text(
-            (10, int(14 * SCALE)),
-            f"Your best {song_count} chart{'s' if song_count != 1 else ''}" + filtered,
-            fill="black",
-            font=header_font,
-        )
-        draw.text(
-            (10, int(65 * SCALE)),
-            "Generated by Sbotga",
-            fill="black",
-            font=watermark_font,
-        )
-
-        GUTTER_WIDTH = int(60 * SCALE)
-        GUTTER_HEIGHT = int(70 * SCALE)
-        CARD_WIDTH = int(
-            (WIDTH - (GUTTER_WIDTH * (amount_columns + 1))) / amount_columns
-        )
-        CARD_HEIGHT = int(
-            (HEIGHT - HEADER_HEIGHT - (GUTTER_HEIGHT * (amount_rows + 1))) / amount_rows
-        )
-        JACKET_SIZE = (CARD_HEIGHT - int(20 * SCALE), CARD_HEIGHT - int(20 * SCALE))
-
-        difficulty_colors = {
-            "append": "DATA/data/ASSETS/append_color.jpg",
-            "hard": "DATA/data/ASSETS/hard_color.jpg",
-            "normal": "DATA/data/ASSETS/normal_color.jpg",
-            "easy": "DATA/data/ASSETS/easy_color.jpg",
-            "master": "DATA/data/ASSETS/master_color.jpg",
-            "expert": "DATA/data/ASSETS/expert_color.jpg",
-        }
-        indicator_images = {
-            "append_ap": "DATA/data/ASSETS/append_ap.png",
-            "append_fc": "DATA/data/ASSETS/append_fc.png",
-            "normal_ap": "DATA/data/ASSETS/normal_ap.png",
-            "normal_fc": "DATA/data/ASSETS/normal_fc.png",
-        }
-
-        # Jackets / paths
-        jackets = [song["path"] for song in songs]
-
-        # Preload indicators once (resized)
-        indicators = {
-            key: Image.open(path).resize((72, 72), Image.LANCZOS).convert("RGBA")
-            for key, path in indicator_images.items()
-        }
-
-        # Preload difficulty images sized to CARD_WIDTH x CARD_HEIGHT
-        difficulty_images = {
-            key: Image.open(path)
-            .resize((CARD_WIDTH, CARD_HEIGHT), Image.LANCZOS)
-            .convert("RGBA")
-            for key, path in difficulty_colors.items()
-        }
-
-        # Resize jacket images once (or None)
-        jacket_images = [
-            Image.open(path).resize(JACKET_SIZE, Image.LANCZOS) if path else None
-            for path in jackets
-        ]
-
-        # Precreate some fonts used inside loop with scale-aware sizes
-        difficulty_font_small = ImageFont.truetype(FONT_PATH, int(22 * SCALE))
-        difficulty_font_label = ImageFont.truetype(FONT_PATH, int(20 * SCALE))
-        song_title_font = ImageFont.truetype(FONT_PATH, int(35 * SCALE))
-        big_header_font = header_font  # alias for ranking draw
-
-        total_difficulty = 0.0
-
-        # iterate once (idx used for jacket_images indexing)
-        for idx, song in enumerate(songs):
-            gridX = idx % amount_columns
-            gridY = idx // amount_columns
-
-            xPos = gridX * CARD_WIDTH + (GUTTER_WIDTH * (gridX + 1))
-            yPos = HEADER_HEIGHT + (gridY * CARD_HEIGHT) + (GUTTER_HEIGHT * (gridY + 1))
-
-            difficulty_number = song["constant"]
-            badge_type = song["difficulty"]
-            ap_fc = song["ap_or_fc"].upper()
-
-            # Difficulty background (use preloaded image)
-            difficulty_img = difficulty_images[badge_type]
-            # Slightly larger copy for stroke/background to preserve original visual
-            difficulty_img_resized = difficulty_img.resize(
-                (CARD_WIDTH + 12 * SCALE, CARD_HEIGHT + 12 * SCALE), Image.LANCZOS
-            )
-            image.paste(
-                difficulty_img_resized, (xPos - int(6 * SCALE), yPos - int(6 * SCALE))
-            )
-
-            # sample safe pixel positions
-            w_s, h_s = difficulty_img.size
-            sample_x = min(5, max(0, w_s - 1))
-            sample_y = min(5, max(0, h_s - 1))
-            tl_color = difficulty_img.getpixel((sample_x, sample_y))
-            br_color = difficulty_img.getpixel(
-                (max(0, CARD_WIDTH - 5), max(0, CARD_HEIGHT - 5))
-            )
-
-            # Create gradient stroke around card (fast)
-            STROKE_SIZE = int(20 * SCALE)
-            grad_w = CARD_WIDTH + STROKE_SIZE
-            grad_h = CARD_HEIGHT + STROKE_SIZE
-            gradient = _create_gradient_rgba(tl_color, br_color, grad_w, grad_h)
-
-            # rounded mask for stroke
-            mask = Image.new("L", (grad_w, grad_h), 0)
-            draw_mask = ImageDraw.Draw(mask)
-            draw_mask.rounded_rectangle(
-                [(0, 0), (grad_w, grad_h)], radius=int(12 * SCALE), fill=255
-            )
-
-            image.paste(gradient, (xPos - int(9 * SCALE), yPos - int(9 * SCALE)), mask)
-
-            # base card
-            draw.rounded_rectangle(
-                [(xPos, yPos), (xPos + CARD_WIDTH, yPos + CARD_HEIGHT)],
-                radius=int(8 * SCALE),
-                fill="white",
-            )
-
-            # jacket placement
-            jacket_x = xPos + int(20 * SCALE)
-            jacket_y = yPos + (CARD_HEIGHT - JACKET_SIZE[1]) // 2
-            if jacket_images[idx]:
-                image.paste(jacket_images[idx], (jacket_x, jacket_y))
-
-            # difficulty badge (top-left)
-            difficulty_badge_x = xPos - int(10 * SCALE)
-            difficulty_badge_y = yPos - int(30 * SCALE)
-            difficulty_badge_width = int(120 * SCALE)
-            difficulty_badge_height = int(50 * SCALE)
-            badge_grad = _create_gradient_rgba(
-                tl_color, br_color, difficulty_badge_width, difficulty_badge_height
-            )
-            badge_mask = Image.new(
-                "L", (difficulty_badge_width, difficulty_badge_height), 0
-            )
-            dm = ImageDraw.Draw(badge_mask)
-            dm.rounded_rectangle(
-                [(0, 0), (difficulty_badge_width, difficulty_badge_height)],
-                radius=int(12 * SCALE),
-                fill=255,
-            )
-            image.paste(
-                badge_grad, (difficulty_badge_x, difficulty_badge_y), badge_mask
-            )
-
-            # stroke around badge
-            draw.rounded_rectangle(
-                [
-                    (difficulty_badge_x, difficulty_badge_y),
-                    (
-                        difficulty_badge_x + difficulty_badge_width,
-                        difficulty_badge_y + difficulty_badge_height,
-                    ),
-                ],
-                radius=int(12 * SCALE),
-                outline="#222222",
-                width=int(3 * SCALE),
-            )
-
-            # difficulty number text on badge
-            difficulty_text = f"{math.ceil(difficulty_number * 10) / 10:.1f}"
-            tb = draw.textbbox((0, 0), difficulty_text, font=difficulty_font_small)
-            text_width = tb[2] - tb[0]
-            text_height = tb[3] - tb[1]
-            text_x = difficulty_badge_x + (difficulty_badge_width - text_width) / 2
-            text_y = difficulty_badge_y + (difficulty_badge_height - text_height) / 2
-            draw.text(
-                (text_x, text_y),
-                difficulty_text,
-                fill="white",
-                font=difficulty_font_small,
-            )
-
-            # Title wrapping & drawing
-            song_title = song["name"]
-            max_length_px = CARD_WIDTH - JACKET_SIZE[0] - int(28 * SCALE)
-            wrapped_title = text_wrap(
-                song_title,
-                song_title_font,
-                draw,
-                max_length_px,
-                CARD_HEIGHT - int(50 * SCALE),
-            )
-
-            # difficulty label below title
-            difficulty_label = badge_type.upper()
-            tb_label = draw.textbbox(
-                (0, 0), difficulty_label, font=difficulty_font_label
-            )
-            difficulty_height = tb_label[3] - tb_label[1]
-
-            tb_title = draw.textbbox((0, 0), wrapped_title, font=song_title_font)
-            title_height = tb_title[3] - tb_title[1]
-
-            total_text_height = title_height + difficulty_height + int(10 * SCALE)
-            title_y_position = yPos + (CARD_HEIGHT - total_text_height) // 2
-            title_x = xPos + JACKET_SIZE[0] + int(20 * SCALE)
-
-            draw.text(
-                (title_x + int(10 * SCALE), title_y_position),
-                wrapped_title,
-                fill="black",
-                font=song_title_font,
-            )
-            difficulty_y = title_y_position + title_height + int(10 * SCALE)
-            draw.text(
-                (title_x + int(10 * SCALE), difficulty_y),
-                difficulty_label,
-                fill="black",
-                font=difficulty_font_label,
+                for region, d in data.items()
+            ]
+            return await to_render_process(
+                render_jobs.progress_image, final_results, difficulty, headers
             )
 
-            # accumulate difficulty for ranking
-            total_difficulty += float(difficulty_number)
-
-            # indicator icon bottom-right
-            indicator_key = (
-                f"{'normal' if badge_type != 'append' else 'append'}_{ap_fc.lower()}"
-            )
-            indicator = indicators[indicator_key]
-            indicator_x = xPos + CARD_WIDTH - int(40 * SCALE)
-            indicator_y = yPos + CARD_HEIGHT - int(40 * SCALE)
-            image.paste(indicator, (indicator_x, indicator_y), indicator)
-
-        # final ranking text
-        overall_ranking = total_difficulty / (song_count or 1)
-        ranking_text = f"Ranking: {overall_ranking:.2f}"
-        ranking_bbox = draw.textbbox((0, 0), ranking_text, font=big_header_font)
-        ranking_width = ranking_bbox[2] - ranking_bbox[0]
-        draw.text(
-            (WIDTH - ranking_width - int(10 * SCALE), int(24 * SCALE)),
-            ranking_text,
-            fill="black",
-            font=big_header_font,
+        key = self.render_key(
+            "progress", user, private, self.upload_stamps(data), difficulty
         )
-
-        obj = BytesIO()
-        image.save(obj, "PNG")
-        obj.seek(0)
-        return obj
+        return await render_cache.cached(key, _render)
 
     async def generate_b30(
         self,
@@ -894,8 +386,6 @@ class DataAnalysis(commands.Cog):
 
         from io import BytesIO
         from collections import defaultdict
-        from PIL import Image, ImageDraw, ImageFont
-        from datetime import datetime, timezone
 
         assert not (fc_only and ap_only)
 
@@ -921,8 +411,9 @@ class DataAnalysis(commands.Cog):
                 """
                 candidates = []
                 api = methods.Tools.get_api(region_key)
-                diffs = api.get_master_data("musicDifficulties.json")
-                diff_map = _build_diff_map(diffs)
+                diff_map = master_index.index(api, "musicDifficulties.json").derived(
+                    "b30_levels", _build_diff_map
+                )
 
                 def maybe_append_candidate(music_id, difficulty, result_dict):
                     fc_flag = bool(result_dict.get("fullComboFlg"))
@@ -1075,52 +566,18 @@ class DataAnalysis(commands.Cog):
             songs = sorted(songs, key=lambda s: s["constant"], reverse=True)[
                 :song_count
             ]
+            # new jackets go into the atlas here, the render workers only read it
+            jacket_atlas.update(
+                [song["path"] for song in songs],
+                render_jobs.b30_jacket_size(song_count),
+            )
 
             # ---------------------------------------------------------------------
-            # 6) Build image with header area for region(s) and user info
+            # 6) Header per region with the user info
             # ---------------------------------------------------------------------
-            img = self.draw_b30(
-                songs, fc_only=fc_only, ap_only=ap_only, song_count=song_count
-            )
-            img = Image.open(img)
-
-            SCALE = 2
-            if region == "all":
-                num_regions = len(data)
-                header_height = num_regions * 100 * SCALE
-                new_height = img.height + header_height
-                new_img = Image.new("RGBA", (img.width, new_height), (50, 50, 50, 255))
-                new_img.paste(img, (0, header_height))
-            else:
-                num_regions = 1
-                header_height = 100 * SCALE
-                new_height = img.height + header_height
-                new_img = Image.new("RGBA", (img.width, new_height), (50, 50, 50, 255))
-                new_img.paste(img, (0, header_height))
-
-            draw = ImageDraw.Draw(new_img)
-            font_bold = ImageFont.truetype(
-                "DATA/data/ASSETS/rodinntlg_eb.otf", 30 * SCALE
-            )
-            font_med = ImageFont.truetype(
-                "DATA/data/ASSETS/rodinntlg_m.otf", 30 * SCALE
-            )
-            font_small = ImageFont.truetype(
-                "DATA/data/ASSETS/rodinntlg_m.otf", 20 * SCALE
-            )
-
-            region_height_offset = 0
-
-            def draw_user_info_for_region(region_key, region_obj):
-                nonlocal region_height_offset
+            def user_info_for_region(region_key, region_obj):
                 # region_obj should contain 'now' and 'userGamedata' normally
                 timestamp = region_obj.get("now", 0) / 1000
-                data_date = datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime(
-                    "%Y-%m-%d"
-                )
-                data_time = datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime(
-                    "%H:%M"
-                )
 
                 user_gamedata = (
                     region_obj.get("userGamedata", {})
@@ -1138,41 +595,18 @@ class DataAnalysis(commands.Cog):
                     if (not private and user_gamedata.get("userId"))
                     else f"{region_key.upper()} Account"
                 )
-
-                draw.text(
-                    (10, region_height_offset + 15 * SCALE),
-                    str(name_to_display),
-                    font=font_bold,
-                    fill="white",
-                )
-                draw.text(
-                    (10, region_height_offset + 60 * SCALE),
+                return (
+                    name_to_display,
                     f"{region_key.upper()} ID: {id_to_display}",
-                    font=font_small,
-                    fill="white",
-                )
-                draw.text(
-                    (img.width - 215 * SCALE, region_height_offset + 15 * SCALE),
-                    f"{data_date}",
-                    font=font_med,
-                    fill="white",
+                    timestamp,
                 )
-                draw.text(
-                    (img.width - 200 * SCALE, region_height_offset + 50 * SCALE),
-                    f"{data_time} UTC",
-                    font=font_med,
-                    fill="white",
-                )
-
-                # separator
-                line_y = region_height_offset + 100 * SCALE
-                draw.line((0, line_y, img.width, line_y), fill="white", width=2)
-                region_height_offset += 100 * SCALE
 
             if region == "all":
                 # iterate regions in data order
-                for reg_key, reg_obj in data.items():
-                    draw_user_info_for_region(reg_key, reg_obj)
+                headers = [
+                    user_info_for_region(reg_key, reg_obj)
+                    for reg_key, reg_obj in data.items()
+                ]
             else:
                 # single region: caller may have passed whole data mapping or the single region object
                 region_obj = (
@@ -1180,19 +614,37 @@ class DataAnalysis(commands.Cog):
                     if (region in data and isinstance(data[region], dict))
                     else data
                 )
-                draw_user_info_for_region(region, region_obj)
+                headers = [user_info_for_region(region, region_obj)]
+
+            return songs, headers
+
+        async def _render():
+            # Song selection needs master data and constants, only the drawing is picklable
+            made = await to_process_with_timeout(_make, region, timeout=80)
+            if isinstance(made, BytesIO):
+                return made
+            songs, headers = made
+            return await to_render_process(
+                render_jobs.b30_image,
+                songs,
+                fc_only,
+                ap_only,
+                song_count,
+                headers,
+                timeout=80,
+            )
 
-            # ---------------------------------------------------------------------
-            # 7) Return image BytesIO
-            # ---------------------------------------------------------------------
-            output = BytesIO()
-            new_img.save(output, format="PNG")
-            output.seek(0)
-            return output
-
-        # Run _make in executor/worker (original used to_process_with_timeout wrapper)
-        output = await to_process_with_timeout(_make, region, timeout=80)
-        return output
+        key = self.render_key(
+            "b30",
+            user,
+            private,
+            self.upload_stamps(data),
+            region,
+            fc_only,
+            ap_only,
+            song_count,
+        )
+        return await render_cache.cached(key, _render)
 
     def is_owner():
         async def predicate(ctx: commands.Context):
@@ -20,6 +20,7 @@ from DATA.helpers import views
 from DATA.helpers import embeds
 from DATA.helpers import views
 from DATA.helpers import tools
+from DATA.helpers import master_index
 
 from DATA.helpers.unblock import to_process_with_timeout
 
@@ -63,6 +64,8 @@ class EventsCog(commands.Cog):
         }
 
         self.update_cooldown = 60  # 1 minute
+        # region -> (events index, valid until (unix ms), embed)
+        self.schedule_embeds: dict[str, tuple] = {}
 
         if os.path.exists("DATA/data/ASSETS/events/top100.json"):
             with open("DATA/data/ASSETS/events/top100.json", "r") as f:
@@ -72,13 +75,27 @@ class EventsCog(commands.Cog):
                 for k, v in data["last_updated"].items():
                     self.bot.cache.ranking_last_updated[k] = v
 
+    def rank_data_expires_at(
+        self, events: master_index.IntervalIndex, region: str
+    ) -> float:
+        """
+        When the cached rank data of a region goes stale: update_cooldown after the last
+        update while an event is going, otherwise once the event schedule next changes
+        (the leaderboard doesn't move while counting or between events).
+        """
+        last_updated = self.bot.cache.ranking_last_updated[region]
+        at = int(last_updated * 1000)
+        changes_at = events.changes_at(at)
+        expires_at = changes_at / 1000 if changes_at is not None else math.inf
+        current = events.current(at)
+        if current and events.status(current, at) == "going":
+            expires_at = min(expires_at, last_updated + self.update_cooldown)
+        return expires_at
+
     def update_rank_data(self, region: str, force: bool = False) -> str:
         api = methods.Tools.get_api(region)
-        if (
-            force
-            or self.bot.cache.ranking_last_updated[region] + self.update_cooldown
-            < time.time()
-        ):
+        events = master_index.events(api)
+        if force or self.rank_data_expires_at(events, region) < time.time():
             try:
                 self.bot.cache.ranking_data[region] = api.get_event_leaderboard()
                 self.bot.cache.ranking_data["border"][region] = api.get_event_border()
@@ -96,23 +113,9 @@ class EventsCog(commands.Cog):
             except Exception as e:
                 self.bot.traceback(e)
                 # pass
-        data = api.get_master_data("events.json")
-        for i in range(0, len(data)):
-            startAt = data[i]["startAt"]
-            endAt = data[i]["closedAt"]
-            assetbundleName = data[i]["assetbundleName"]
-            now = int(round(time.time() * 1000))
-            remain = ""
-            if not startAt < now < endAt:
-                continue
-            if data[i]["startAt"] < now < data[i]["aggregateAt"]:
-                status = "going"
-                # remain = timeremain(time=(data[i]['aggregateAt'] - now) / 1000, server=server)
-            elif data[i]["aggregateAt"] < now < data[i]["aggregateAt"] + 600000:
-                status = "counting"
-            else:
-                status = "end"
-            return data[i]["name"]
+        current = events.current(int(round(time.time() * 1000)))
+        if current:
+            return current["name"]
 
     class LeaderboardView(views.SbotgaView):
         def __init__(
@@ -733,31 +736,13 @@ class EventsCog(commands.Cog):
 
         return int(next_reset.timestamp())
 
-    def create_schedule_embed(self, data: dict, region: str):
+    def create_schedule_embed(self, events: master_index.IntervalIndex, region: str):
         """
-        Creates an embed of the current schedule data provided.
+        Creates an embed of the current and next event of the schedule provided.
         """
-        current_date = datetime.now(timezone.utc)
-
-        current_event_idx = -1
-        next_event_idx = -1
-
-        for i, event in enumerate(data):
-            start_at = datetime.fromtimestamp(
-                round(event["startAt"] / 1000), timezone.utc
-            )
-            closed_at = datetime.fromtimestamp(
-                round(event["closedAt"] / 1000), timezone.utc
-            )
-
-            if closed_at > current_date > start_at:
-                current_event_idx = i
-
-            if start_at > current_date:
-                if next_event_idx == -1 or start_at < datetime.fromtimestamp(
-                    round(data[next_event_idx]["startAt"] / 1000), timezone.utc
-                ):
-                    next_event_idx = i
+        now = int(time.time() * 1000)
+        current_event = events.current(now)
+        next_event = events.next(now)
 
         embed = embeds.embed(
             color=discord.Color.dark_blue(),
@@ -765,8 +750,7 @@ class EventsCog(commands.Cog):
             description="",
         )
 
-        if current_event_idx != -1:
-            current_event = data[current_event_idx]
+        if current_event:
             start_time = round(current_event["startAt"] / 1000)
             aggregate_time = round(current_event["aggregateAt"] / 1000)
 
@@ -779,7 +763,11 @@ class EventsCog(commands.Cog):
                 name="Event Started", value=f"<t:{start_time}> - <t:{start_time}:R>"
             )
             embed.add_field(
-                name="Ranking Closes",
+                name=(
+                    "Ranking Closes"
+                    if events.status(current_event, now) == "going"
+                    else "Ranking Closed"
+                ),
                 value=f"<t:{aggregate_time}> - <t:{aggregate_time}:R>",
             )
 
@@ -787,11 +775,10 @@ class EventsCog(commands.Cog):
                 url=f"https://sekai-res.dnaroma.eu/file/sekai-en-assets/event/{current_event['assetbundleName']}/logo_rip/logo.webp"
             )
 
-        if next_event_idx != -1:
-            if current_event_idx != -1:
+        if next_event:
+            if current_event:
                 embed.add_field(name="** **", value="** **", inline=False)
 
-            next_event = data[next_event_idx]
             start_time = round(next_event["startAt"] / 1000)
             aggregate_time = round(next_event["aggregateAt"] / 1000)
 
@@ -808,6 +795,24 @@ class EventsCog(commands.Cog):
                 value=f"<t:{aggregate_time}> - <t:{aggregate_time}:R>",
             )
 
+        return embed
+
+    def schedule_embed(self, region: str):
+        """
+        The schedule embed of a region, only rebuilt when the event schedule changes
+        (an event starts, its ranking closes or it ends) or the master data does.
+        """
+        events = master_index.events(methods.Tools.get_api(region))
+        now = int(time.time() * 1000)
+        cached = self.schedule_embeds.get(region)
+        if cached is None or cached[0] is not events or now >= cached[1]:
+            changes_at = events.changes_at(now)
+            cached = self.schedule_embeds[region] = (
+                events,
+                changes_at if changes_at is not None else math.inf,
+                self.create_schedule_embed(events, region),
+            )
+        embed = cached[2].copy()
         embed.timestamp = discord.utils.utcnow()
         return embed
 
@@ -845,10 +850,7 @@ class EventsCog(commands.Cog):
             region = await self.bot.user_data.discord.get_settings(
                 interaction.user.id, "default_region"
             )
-        api = methods.Tools.get_api(region)
-        events = api.get_master_data("events.json")
-        embed = self.create_schedule_embed(events, region)
-        await interaction.followup.send(embed=embed)
+        await interaction.followup.send(embed=self.schedule_embed(region))
 
     @event.command(
         auto_locale_strings=False,
@@ -1027,7 +1029,7 @@ class EventsCog(commands.Cog):
                 )
                 return await interaction.followup.send(embed=embed)
 
-            world_link_data = api.get_master_data("worldBlooms.json")
+            world_link_data = master_index.index(api, "worldBlooms.json")
             world_link = True
 
         url = f"https://raw.githubusercontent.com/Jiiku831/Jiiku831.github.io/refs/heads/main/{region + '/' if region != 'jp' else ''}data/sekarun_current.json"
@@ -1062,14 +1064,7 @@ class EventsCog(commands.Cog):
             chapters = data["chapters"]
             for _, chapter_data in chapters.items():
                 world_bloom_id = chapter_data["world_bloom_id"]
-                wl_chap_data = next(
-                    (
-                        wl_data
-                        for wl_data in world_link_data
-                        if wl_data["id"] == world_bloom_id
-                    ),
-                    None,
-                )
+                wl_chap_data = world_link_data.get(world_bloom_id)
                 if wl_chap_data["gameCharacterId"] == character["id"]:
                     entries = chapter_data["lines"][tier]["entries"]
                     aggregate = wl_chap_data["aggregateAt"]
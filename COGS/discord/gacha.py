@@ -7,14 +7,15 @@ from COGS.discord_translations import translations
 
 from main import DiscordBot
 
-import time, os, random
+import time, os
 from io import BytesIO
 
-from PIL import Image
-
 from DATA.helpers import discord_autocompletes as autocompletes
 from DATA.helpers import embeds
 from DATA.helpers import tools
+from DATA.helpers.unblock import to_render_process, to_process_with_timeout
+
+from COGS import render_jobs
 
 from DATA.game_api import methods
 
@@ -37,249 +38,60 @@ class GachaCog(commands.Cog):
             if time.time() - last_ran > 120:  # 2 minutes
                 self.cooldown.pop(uid, None)
 
-    def gachacardthumnail(
-        self, card_id: int, trained: bool = False, cards: dict = None
-    ) -> Image:
-        if cards is None:
-            cards = methods.pjsk_game_api_jp.get_master_data("cards.json")
-        if trained:
-            suffix = "after_training"
-        else:
-            suffix = "normal"
-        for card in cards:
-            if card["id"] == card_id:
-                if (
-                    card["cardRarityType"] != "rarity_3"
-                    and card["cardRarityType"] != "rarity_4"
-                ):
-                    suffix = "normal"
-                pic = Image.new("RGBA", (338, 338), (0, 0, 0, 0))
-                card_pic_path = os.path.join(
-                    methods.pjsk_game_api_jp.game_files_path,
-                    "jp",
-                    "character",
-                    "member_cutout",
-                    card["assetbundleName"] + "_ex",
-                    f"{suffix}.png",
-                )
-                cardpic = Image.open(card_pic_path)
-                picmask = Image.open(f"DATA/data/ASSETS/gachacardmask.png")
-                r, g, b, mask = picmask.split()
-                cardpic = cardpic.resize(mask.size, Image.Resampling.LANCZOS)
-                pic.paste(cardpic, (0, 0), mask)
-                cardFrame = Image.open(
-                    f'DATA/data/ASSETS/chara/cardFrame_{card["cardRarityType"]}.png'
-                )
-                cardFrame = cardFrame.resize((338, 338))
-                r, g, b, mask = cardFrame.split()
-
-                pic.paste(cardFrame, (0, 0), mask)
-                if card["cardRarityType"] == "rarity_1":
-                    star = Image.open(f"DATA/data/ASSETS/chara/rarity_star_normal.png")
-                    star = star.resize((61, 61))
-                    r, g, b, mask = star.split()
-                    pic.paste(star, (21, 256), mask)
-                if card["cardRarityType"] == "rarity_2":
-                    star = Image.open(f"DATA/data/ASSETS/chara/rarity_star_normal.png")
-                    star = star.resize((60, 60))
-                    r, g, b, mask = star.split()
-                    pic.paste(star, (21, 256), mask)
-                    pic.paste(star, (78, 256), mask)
-                if card["cardRarityType"] == "rarity_3":
-                    if trained:
-                        star = Image.open(
-                            f"DATA/data/ASSETS/chara/rarity_star_afterTraining.png"
-                        )
-                    else:
-                        star = Image.open(
-                            f"DATA/data/ASSETS/chara/rarity_star_normal.png"
-                        )
-                    star = star.resize((60, 60))
-                    r, g, b, mask = star.split()
-                    pic.paste(star, (21, 256), mask)
-                    pic.paste(star, (78, 256), mask)
-                    pic.paste(star, (134, 256), mask)
-                if card["cardRarityType"] == "rarity_4":
-                    if trained:
-                        star = Image.open(
-                            f"DATA/data/ASSETS/chara/rarity_star_afterTraining.png"
-                        )
-                    else:
-                        star = Image.open(
-                            f"DATA/data/ASSETS/chara/rarity_star_normal.png"
-                        )
-                    star = star.resize((60, 60))
-                    r, g, b, mask = star.split()
-                    pic.paste(star, (21, 256), mask)
-                    pic.paste(star, (78, 256), mask)
-                    pic.paste(star, (134, 256), mask)
-                    pic.paste(star, (190, 256), mask)
-                if card["cardRarityType"] == "rarity_birthday":
-                    star = Image.open(f"DATA/data/ASSETS/chara/rarity_birthday.png")
-                    star = star.resize((60, 60))
-                    r, g, b, mask = star.split()
-                    pic.paste(star, (21, 256), mask)
-                attr = Image.open(
-                    f'DATA/data/ASSETS/chara/icon_attribute_{card["attr"]}.png'
-                )
-                attr = attr.resize((76, 76))
-                r, g, b, mask = attr.split()
-                pic.paste(attr, (1, 1), mask)
-                return pic
-
-    def gachapic(self, charas) -> BytesIO:
-        pic = Image.open(f"DATA/data/ASSETS/gacha.png")
-        cards = methods.pjsk_game_api_jp.get_master_data("cards.json")
-        cover = Image.new("RGB", (1550, 600), (255, 255, 255))
-        pic.paste(cover, (314, 500))
-        for i in range(0, 5):
-            cardpic = self.gachacardthumnail(charas[i], False, cards)
-            cardpic = cardpic.resize((263, 263))
-            r, g, b, mask = cardpic.split()
-            pic.paste(cardpic, (336 + 304 * i, 520), mask)
-        for i in range(0, 5):
-            cardpic = self.gachacardthumnail(charas[i + 5], False, cards)
-            cardpic = cardpic.resize((263, 263))
-            r, g, b, mask = cardpic.split()
-            pic.paste(cardpic, (336 + 304 * i, 825), mask)
-        pic = pic.convert("RGB")
-        obj = BytesIO()
-        pic.save(obj, "JPEG")
-        obj.seek(0)
-        return obj
+    async def gachapic(self, charas, region: str) -> BytesIO:
+        cards = self.bot.pjsk.gacha_indexes[region].cards
+        # only what the thumbnails need, the render runs in another process
+        pulled = [
+            {
+                "cardRarityType": cards[chara]["cardRarityType"],
+                "assetbundleName": cards[chara]["assetbundleName"],
+                "attr": cards[chara]["attr"],
+            }
+            for chara in charas
+        ]
+        return await to_render_process(
+            render_jobs.gacha_image,
+            pulled,
+            methods.pjsk_game_api_jp.game_files_path,
+        )
 
     def getcharaname(self, region: str, character_id: int):
-        api = methods.Tools.get_api(region)
-        data = api.get_master_data("gameCharacters.json")
-        for i in data:
-            if i["id"] == character_id:
-                try:
-                    if region == "jp":
-                        return i["firstName"] + i["givenName"]
-                    else:
-                        return i["givenName"] + i["firstName"]
-                except KeyError:
-                    return i["givenName"]
+        return self.bot.pjsk.gacha_indexes[region].character_names.get(character_id)
 
     def fakegacha(
         self, region: str, gacha_id: int, reverse: bool = False
-    ) -> None | BytesIO:
-        api = methods.Tools.get_api(region)
-        data = api.get_master_data("gachas.json")
-        gacha = None
-        birthday = False
-        for i in range(0, len(data)):
-            if data[i]["id"] == gacha_id:
-                gacha = data[i]
-        if gacha is None:
+    ) -> None | list[int]:
+        pool = self.bot.pjsk.gacha_indexes[region].pool(gacha_id)
+        if pool is None:
             return None
-        rate4 = 0
-        rate3 = 0
-        for i in range(0, len(gacha["gachaCardRarityRates"])):
-            if gacha["gachaCardRarityRates"][i]["cardRarityType"] == "rarity_4":
-                rate4 = gacha["gachaCardRarityRates"][i]["rate"]
-                break
-            if gacha["gachaCardRarityRates"][i]["cardRarityType"] == "rarity_birthday":
-                rate4 = gacha["gachaCardRarityRates"][i]["rate"]
-                birthday = True
-                break
-        for i in range(0, len(gacha["gachaCardRarityRates"])):
-            if gacha["gachaCardRarityRates"][i]["cardRarityType"] == "rarity_3":
-                rate3 = gacha["gachaCardRarityRates"][i]["rate"]
-        if reverse:
-            rate4 = 100 - rate4 - rate3
-        cards = api.get_master_data("cards.json")
-        reality2 = []
-        reality3 = []
-        reality4 = []
-        allweight = 0
-        for detail in gacha["gachaDetails"]:
-            for card in cards:
-                if card["id"] == detail["cardId"]:
-                    if card["cardRarityType"] == "rarity_2":
-                        reality2.append(
-                            {
-                                "id": card["id"],
-                                "prefix": card["prefix"],
-                                "charaid": card["characterId"],
-                            }
-                        )
-                    elif card["cardRarityType"] == "rarity_3":
-                        reality3.append(
-                            {
-                                "id": card["id"],
-                                "prefix": card["prefix"],
-                                "charaid": card["characterId"],
-                            }
-                        )
-                    else:
-                        allweight = allweight + detail["weight"]
-                        reality4.append(
-                            {
-                                "id": card["id"],
-                                "prefix": card["prefix"],
-                                "charaid": card["characterId"],
-                                "weight": detail["weight"],
-                            }
-                        )
-        alltext = ""
-        keytext = ""
-        baodi = True
-        count4 = 0
-        count3 = 0
-        count2 = 0
-        result = []
-        for i in range(1, 11):
-            if i % 10 == 0 and baodi and reverse is not True:
-                baodi = False
-                rannum = random.randint(0, int(rate4 + rate3) * 2) / 2
-            else:
-                rannum = random.randint(0, 100)
-            if rannum < rate4:
-                count4 += 1
-                baodi = False
-                nowweight = 0
-                rannum2 = random.randint(0, allweight - 1)
-                for j in range(0, len(reality4)):
-                    nowweight = nowweight + reality4[j]["weight"]
-                    if nowweight >= rannum2:
-                        if birthday:
-                            alltext = alltext + "🎀"
-                            keytext = keytext + "🎀"
-                        else:
-                            alltext = alltext + "★★★★"
-                            keytext = keytext + "★★★★"
-                        if reality4[j]["weight"] == 400000:
-                            alltext = alltext + "[当期]"
-                            keytext = keytext + "[当期]"
-                        alltext = (
-                            alltext
-                            + f"{reality4[j]['prefix']} - {self.getcharaname(region, reality4[j]['charaid'])}\n"
-                        )
-                        keytext = (
-                            keytext
-                            + f"{reality4[j]['prefix']} - {self.getcharaname(region, reality4[j]['charaid'])}(第{i}抽)\n"
-                        )
-                        result.append(reality4[j]["id"])
-                        break
-            elif rannum < rate4 + rate3:
-                count3 += 1
-                rannum2 = random.randint(0, len(reality3) - 1)
-                alltext = (
-                    alltext
-                    + f"★★★{reality3[rannum2]['prefix']} - {self.getcharaname(region, reality3[rannum2]['charaid'])}\n"
-                )
-                result.append(reality3[rannum2]["id"])
-            else:
-                count2 += 1
-                rannum2 = random.randint(0, len(reality3) - 1)
-                alltext = (
-                    alltext
-                    + f"★★{reality2[rannum2]['prefix']} - {self.getcharaname(region, reality2[rannum2]['charaid'])}\n"
-                )
-                result.append(reality2[rannum2]["id"])
-
-        return self.gachapic(result)
+        return pool.ten_pull(reverse)
+
+    def simulation_embed(self, stats: dict, gacha_name: str) -> discord.Embed:
+        lines = [
+            f"**{stats['pulls']:,}** pulls ({stats['ten_pulls']:,} ten pulls)",
+            f"**4★ cards:** {stats['four_stars']:,} ({stats['four_star_rate']:.2f}% of pulls)",
+            f"**Guaranteed 10th pulls:** {stats['guaranteed']:,} ({stats['guaranteed_four_stars']:,} gave a 4★)",
+        ]
+        rate_up = stats["rate_up"]
+        if rate_up and rate_up["hits"]:
+            lines.append(
+                f"**Rate-up 4★ cards:** {rate_up['hits']:,}, one every "
+                f"**{rate_up['mean_pulls']:.1f}** pulls on average "
+                f"(median {rate_up['median_pulls']:.0f}, 90% within {rate_up['p90_pulls']:.0f})"
+            )
+        elif rate_up:
+            lines.append("**Rate-up 4★ cards:** none pulled")
+
+        distribution = "\n".join(
+            f"{count} 4★: {ten_pulls:,} ({ten_pulls / stats['ten_pulls'] * 100:.2f}%)"
+            for count, ten_pulls in enumerate(stats["distribution"])
+            if ten_pulls
+        )
+        embed = embeds.embed(
+            title=f"Gacha Simulation - {gacha_name}", description="\n".join(lines)
+        )
+        embed.add_field(name="4★ Cards per Ten Pull", value=distribution, inline=False)
+        return embed
 
     @app_commands.command(
         auto_locale_strings=False,
@@ -293,14 +105,23 @@ class GachaCog(commands.Cog):
     @app_commands.describe(
         region=locale_str("general.region"),
         reverse_odds=locale_str("gacha.describes.reverse_odds", file="commands"),
+        simulate=locale_str("gacha.describes.simulate", file="commands"),
     )
     async def gacha(
         self,
         interaction: discord.Interaction,
         region: str = "default",
         reverse_odds: bool = False,
+        simulate: int = 0,
     ):
         region = region.lower().strip()
+        if simulate < 0 or simulate > 100000:
+            return await interaction.response.send_message(
+                embed=embeds.error_embed(
+                    "Invalid amount of ten pulls to simulate. Please choose from 1-100000, or 0 for a normal ten pull."
+                ),
+                ephemeral=True,
+            )
         if region not in ["en", "jp", "tw", "kr", "cn", "default"]:
             return await interaction.response.send_message(
                 embed=embeds.error_embed(
@@ -338,7 +159,25 @@ class GachaCog(commands.Cog):
         api = methods.Tools.get_api(region)
         gacha_data = api.get_current_gacha()
 
-        img = self.fakegacha(region, int(gacha_data["id"]), reverse_odds)
+        pool = self.bot.pjsk.gacha_indexes[region].pool(int(gacha_data["id"]))
+        if pool is None:
+            self.cooldown.pop(interaction.user.id, None)
+            return await interaction.followup.send(
+                embed=embeds.error_embed(
+                    f"Couldn't find the current {region.upper()} gacha."
+                ).set_footer(text="Your cooldown was reset.")
+            )
+
+        if simulate:
+            stats = await to_process_with_timeout(pool.simulate, simulate, reverse_odds)
+            embed = self.simulation_embed(stats, gacha_data["name"])
+            embed.set_footer(text=f"{region.upper()} Current Event Gacha Simulation")
+            await interaction.followup.send(embed=embed)
+            self.cooldown[interaction.user.id] = time.time()
+            return
+
+        charas = pool.ten_pull(reverse_odds)
+        img = await self.gachapic(charas, region)
 
         embed = embeds.embed(title=f"Ten Pull - {gacha_data['name']}")
 
@@ -1,6 +1,6 @@
 import asyncio
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 from discord import app_commands
 
 from discord.app_commands import locale_str
@@ -8,7 +8,7 @@ from COGS.discord_translations import translations
 
 from main import DiscordBot
 
-import time, os, secrets, random, io
+import time, os, random, io
 
 from typing import Tuple, Coroutine, Callable, Any
 
@@ -27,6 +27,7 @@ from DATA.helpers import embeds
 from DATA.helpers.unblock import to_process_with_timeout
 from DATA.helpers import tools
 from DATA.helpers import pjsk_chart
+from DATA.helpers import image_cache
 
 from DATA.game_api import methods
 
@@ -149,17 +150,35 @@ class GuessCog(commands.Cog):
 
         self.max_guess_time = 60  # 60 seconds to guess. Divided by 2 for character guessing, and divided by 3 for chart append.
 
-        self.check_guess_task.start()
+        # Song guesses arriving in the same channel within this window are resolved together.
+        self.song_guess_window = 0.05  # seconds
+        self.pending_song_guesses: dict[int, list[tuple[str, asyncio.Future]]] = {}
+
+        # Ready to serve puzzles per (guess type, mirrored), refilled in the background as they are used.
+        self.puzzle_pool_size = 3
+        self.puzzle_pool: dict[tuple[str, bool], list[dict]] = {}
+        self.puzzle_pool_tasks: dict[tuple[str, bool], asyncio.Task] = {}
+
+        # Guesses left running by a previous instance of this cog
+        for data in self.bot.cache.guess_channels.values():
+            if data["startTime"]:
+                self.schedule_guess_timeout(data)
 
     async def cog_load(self):
         # if self.bot.cache.guess_channels == {}:
         #     await self.download_jackets()
         #     # await self.download_cards()
+        for guessing in TYPE_TO_NAME:
+            self.refill_puzzle_pool((guessing, False))
         return await super().cog_load()
 
     def cog_unload(self):
-        # Prevent orphaned task, where the task still runs while cog is unloaded or destroyed.
-        self.check_guess_task.cancel()
+        # Prevent orphaned tasks, where timeouts still run while cog is unloaded or destroyed.
+        for data in self.bot.cache.guess_channels.values():
+            if data.get("timeout"):
+                data.pop("timeout").cancel()
+        for task in self.puzzle_pool_tasks.values():
+            task.cancel()
         return super().cog_unload()
 
     """
@@ -173,8 +192,8 @@ class GuessCog(commands.Cog):
         self, path, size=250, bw: bool = False
     ) -> io.BytesIO:
         def _make():
-            img = Image.open(path)
-            img_array = np.array(img.convert("L" if bw else "RGB"))
+            img = image_cache.open_image(path, "L" if bw else "RGB", copy=False)
+            img_array = np.array(img)
             height, width = img_array.shape[:2]
 
             ran1 = random.randint(0, width - size)
@@ -191,8 +210,8 @@ class GuessCog(commands.Cog):
 
     async def random_crop(self, path, size=140, bw=False) -> io.BytesIO:
         def _make():
-            img = Image.open(path)
-            img_array = np.array(img.convert("L" if bw else "RGB"))
+            img = image_cache.open_image(path, "L" if bw else "RGB", copy=False)
+            img_array = np.array(img)
             height, width = img_array.shape[:2]
 
             ran1 = random.randint(0, width - size)
@@ -208,45 +227,11 @@ class GuessCog(commands.Cog):
         return await to_process_with_timeout(_make)
 
     def random_event(self, en_only: bool = False) -> dict:
-        choices = self.bot.pjsk.events
-        if en_only:
-            choices = [
-                choice
-                for choice, value in choices.items()
-                if not methods.pjsk_game_api.isleak_event(value["id"])
-            ]
-        else:
-            choices = choices.keys()
-        choice = secrets.choice(choices)
-        r = methods.Tools.isleak_event(choice)
-        if r == None:
-            r = True
-        while r:
-            choice = secrets.choice(choices)
-            r = methods.Tools.isleak_event(choice)
-            if r == None:
-                r = True
+        choice = self.bot.pjsk.availability.random_event(en_only)
         return self.bot.pjsk.events[choice]
 
     def random_song(self, has_append: bool = False) -> Song:
-        choices = list(self.bot.pjsk.songs.keys())
-
-        if has_append:
-            choices = [
-                choice
-                for choice in choices
-                if self.bot.pjsk.difficulties[choice].get("append")
-            ]
-
-        choice = secrets.choice(choices)
-        r = methods.Tools.isleak(choice)
-        if r == None:
-            r = True
-        while r:
-            choice = secrets.choice(choices)
-            r = methods.Tools.isleak(choice)
-            if r == None:
-                r = True
+        choice = self.bot.pjsk.availability.random_song(has_append)
 
         song = Song(self.bot.pjsk.songs[choice], self.bot.pjsk.difficulties[choice])
 
@@ -256,36 +241,36 @@ class GuessCog(commands.Cog):
         """
         Character ID (`1`), assetBundleName (`res001_no001`), card id, rarityType (`rarity_2`)
         """
-        api = methods.pjsk_game_api_jp
-        cards = api.get_master_data("cards.json")
-        rannum = random.randint(0, len(cards) - 1)
-        while (
-            cards[rannum]["releaseAt"] > int(time.time() * 1000)  # leak check
-            or cards[rannum]["cardRarityType"] == "rarity_1"  # oh it's a 1*...
-            or cards[rannum]["cardRarityType"] == "rarity_2"  # oh it's a 2*...
-        ):
-            rannum = random.randint(0, len(cards) - 1)
+        # released 3* and up only
+        card = self.bot.pjsk.availability.random_card()
         return (
-            cards[rannum]["characterId"],
-            cards[rannum]["assetbundleName"],
-            cards[rannum]["id"],
-            cards[rannum]["cardRarityType"],
+            card["characterId"],
+            card["assetbundleName"],
+            card["id"],
+            card["cardRarityType"],
         )
 
     async def random_crop_chart(self, png_path: str | io.BytesIO) -> io.BytesIO:
         def _make():
-            img = Image.open(png_path).convert("RGB")
-            img_array = np.array(img)
-            height, width, _ = img_array.shape
+            # preprocessed lanes, so only the chosen lane is read from disk
+            strips, meta = pjsk_chart.lane_strips(png_path)
+            if strips is not None:
+                row = round((meta["width"] - 80) / 272)
+                rannum = random.randint(2, row - 1)
+                cropped = np.asarray(strips[rannum - 1, 32:])
+            else:
+                img = image_cache.open_image(png_path, "RGB", copy=False)
+                img_array = np.array(img)
+                height, width, _ = img_array.shape
 
-            row = round((width - 80) / 272)
-            rannum = random.randint(2, row - 1)
-            start_x = 80 + 272 * (rannum - 1)
-            end_x = start_x + 192
-            start_y, end_y = 32, height - 287
+                row = round((width - 80) / 272)
+                rannum = random.randint(2, row - 1)
+                start_x = 80 + 272 * (rannum - 1)
+                end_x = start_x + 192
+                start_y, end_y = 32, height - 287
 
-            # crop section
-            cropped = img_array[start_y:end_y, start_x:end_x]
+                # crop section
+                cropped = img_array[start_y:end_y, start_x:end_x]
 
             # split 2 sections
             mid_y = cropped.shape[0] // 2
@@ -314,6 +299,225 @@ class GuessCog(commands.Cog):
 
         return await to_process_with_timeout(_make)
 
+    async def resolve_song_guess(self, channel_id: int, content: str) -> Song | None:
+        """
+        Queue a song guess to be resolved with every other guess sent in the
+        channel during `song_guess_window`, in one batched fuzzy match.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self.pending_song_guesses.setdefault(channel_id, [])
+        pending.append((content, future))
+        if len(pending) == 1:
+            loop.call_later(self.song_guess_window, self.flush_song_guesses, channel_id)
+        return await future
+
+    def flush_song_guesses(self, channel_id: int):
+        pending = self.pending_song_guesses.pop(channel_id, [])
+        if not pending:
+            return
+        try:
+            songs = converters.SongsFromPJSK(
+                self.bot.pjsk, [content for content, _ in pending]
+            )
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), song in zip(pending, songs):
+            if not future.done():
+                future.set_result(song)
+
+    async def random_chart(self, diff: str = "master") -> Tuple[Song, str, str]:
+        for _ in range(10):  # maximum 10 retries
+            try:
+                if diff == "master":
+                    song = self.random_song()
+                else:
+                    song = self.random_song(has_append=True)
+                region = methods.Tools.get_music_region(song.id, "en")
+                png = await methods.Tools.get_chart(
+                    diff,
+                    song.id,
+                    server=region,
+                )
+                break
+            except IndexError:
+                pass
+        return song, png, region
+
+    def random_jacket(self, has_master: bool = False) -> Tuple[Song, str]:
+        song = self.random_song()
+        jacket_path = methods.Tools.get_music_jacket(song.id)
+        for _ in range(10):  # maximum 10 retries
+            if (
+                (not jacket_path)
+                or (not os.path.exists(jacket_path))
+                or (has_master and not song.difficulties.get("master"))
+            ):
+                song = self.random_song()
+                jacket_path = methods.Tools.get_music_jacket(song.id)
+            else:
+                break
+        return song, jacket_path
+
+    def random_card_rare(self) -> Tuple[dict, str, int, bool, int]:
+        """char, card_path, char_id, trained, card_id"""
+        api = methods.pjsk_game_api_jp
+
+        def da_works():
+            char_id, asset_name, card_id, rarity = self.random_card()
+            if rarity == "rarity_birthday":
+                path2 = "normal"
+                trained = False
+            else:
+                trained = not random.randint(0, 1)
+                if trained:
+                    path2 = "after_training"
+                else:
+                    path2 = "normal"
+            card_path = os.path.join(
+                api.game_files_path,
+                api.app_region,
+                "character",
+                "member",
+                f"{asset_name}_ex",
+                f"card_{path2}.png",
+            )
+            return card_path, char_id, asset_name, card_id, rarity, trained
+
+        card_path, char_id, asset_name, card_id, rarity, trained = da_works()
+        for _ in range(10):
+            if (not card_path) or (not os.path.exists(card_path)):
+                card_path, char_id, asset_name, card_id, rarity, trained = da_works()
+            else:
+                break
+        char = self.bot.pjsk.characters_game[char_id - 1]
+        return char, card_path, char_id, trained, card_id
+
+    async def generate_puzzle(self, guessing: str, mirrored: bool = False) -> dict:
+        """
+        Pick the answer of a guess and render its image.
+
+        {"answer_file_path", "answer", "answerName", "data", "image" (PNG bytes or None)}
+        """
+        puzzle = {
+            "answer_file_path": None,
+            "answer": None,
+            "answerName": None,
+            "data": {},
+            "image": None,
+        }
+        edited_image = None
+        match guessing:
+            case "jacket" | "jacket_30px" | "jacket_bw" | "jacket_challenge":
+                song, jacket_path = self.random_jacket()
+
+                puzzle["answer_file_path"] = jacket_path
+                puzzle["answer"] = song.id
+                puzzle["answerName"] = song.title
+
+                edited_image = await self.random_crop(
+                    jacket_path,
+                    size=30 if guessing in ["jacket_30px", "jacket_challenge"] else 140,
+                    bw=guessing in ["jacket_bw", "jacket_challenge"],
+                )
+            case "character" | "character_bw":
+                char, card_path, char_id, trained, card_id = self.random_card_rare()
+
+                puzzle["answer_file_path"] = card_path
+                puzzle["answer"] = char_id
+                puzzle["answerName"] = (
+                    str(char["givenName"]) + " " + str(char["firstName"])
+                    if char.get("firstName") and char.get("unit") != "piapro"
+                    else (
+                        str(char["firstName"]) + " " + str(char["givenName"])
+                        if char.get("firstName")
+                        else char["givenName"]
+                    )
+                )
+                puzzle["data"]["card_id"] = card_id
+                puzzle["data"]["trained"] = trained
+                puzzle["data"]["card_name"] = methods.Tools.get_card_name(
+                    card_id, trained, include_character=True, use_emojis=True
+                )
+
+                edited_image = await self.random_crop_rectangle(
+                    card_path, bw=guessing == "character_bw"
+                )
+            case "chart" | "chart_append":
+                diff = "master" if guessing == "chart" else "append"
+                song, png, region = await self.random_chart(diff)
+                if mirrored:
+                    png = await to_process_with_timeout(
+                        pjsk_chart.mirrored_chart, png, song.id, diff, region
+                    )
+
+                puzzle["answer_file_path"] = png
+                puzzle["answer"] = song.id
+                puzzle["answerName"] = song.title
+                puzzle["data"]["diff"] = diff
+                puzzle["data"]["region"] = region
+                puzzle["data"]["is_chart"] = True
+
+                edited_image = await self.random_crop_chart(png)
+            case "event":
+                for _ in range(10):  # maximum 10 retries
+                    try:
+                        event = self.random_event(en_only=True)
+                        thumbnail, png, _ = methods.Tools.get_event_images(
+                            event["id"], methods.Tools.get_event_region(event["id"])
+                        )
+                        break
+                    except IndexError as e:
+                        print(e)
+                        pass
+
+                puzzle["answer_file_path"] = png
+                puzzle["data"]["thumbnail"] = thumbnail
+                puzzle["answer"] = event["id"]
+                puzzle["answerName"] = event["name"]
+                puzzle["data"]["short"] = event["assetbundleName"].split("_")[1]
+
+                edited_image = await self.random_crop_rectangle(png)
+            case "notes":
+                song, jacket_path = self.random_jacket(has_master=True)
+
+                puzzle["answer"] = song.id
+                puzzle["answerName"] = song.title
+                puzzle["data"]["notes"] = song.difficulties["master"]["totalNoteCount"]
+                puzzle["data"]["thumbnail"] = jacket_path
+            case _:
+                raise ValueError(f"Unknown guess type {guessing}")
+
+        if edited_image:
+            puzzle["image"] = edited_image.getvalue()
+        return puzzle
+
+    async def get_puzzle(self, guessing: str, mirrored: bool = False) -> dict:
+        """A puzzle from the pool, or a freshly generated one if the pool is empty."""
+        key = (guessing, mirrored)
+        pool = self.puzzle_pool.get(key)
+        puzzle = pool.pop(0) if pool else None
+        self.refill_puzzle_pool(key)
+        return puzzle or await self.generate_puzzle(guessing, mirrored)
+
+    def refill_puzzle_pool(self, key: tuple[str, bool]):
+        task = self.puzzle_pool_tasks.get(key)
+        if task and not task.done():
+            return
+        self.puzzle_pool_tasks[key] = asyncio.create_task(self.fill_puzzle_pool(key))
+
+    async def fill_puzzle_pool(self, key: tuple[str, bool]):
+        pool = self.puzzle_pool.setdefault(key, [])
+        while len(pool) < self.puzzle_pool_size:
+            try:
+                pool.append(await self.generate_puzzle(*key))
+            except Exception as e:
+                self.bot.traceback(e)
+                return
+
     async def channel_checks(
         self, interaction: discord.Interaction, already_guessing_check=True
     ) -> bool:
@@ -409,6 +613,8 @@ class GuessCog(commands.Cog):
     @staticmethod
     def remove_guess(bot: DiscordBot, channel_id: str):
         guess = bot.cache.guess_channels.pop(channel_id, {})
+        if guess.get("timeout"):
+            guess.pop("timeout").cancel()
         if guess.get("id"):
             try:
                 bot.existing_ids.remove(guess.get("id"))
@@ -520,69 +726,75 @@ class GuessCog(commands.Cog):
     
     """
 
-    @tasks.loop(seconds=0.5)
-    async def check_guess_task(self):
-        def max_guess_time():
-            if data["guessing"] == "chart_append":
-                return self.max_guess_time // 3
-            return (
-                self.max_guess_time
-                if data["guessType"] == "song"
-                else self.max_guess_time // 2
-            )
+    def guess_time_limit(self, data: dict) -> int:
+        if data["guessing"] == "chart_append":
+            return self.max_guess_time // 3
+        return (
+            self.max_guess_time
+            if data["guessType"] == "song"
+            else self.max_guess_time // 2
+        )
 
-        for channel_id, data in self.bot.cache.guess_channels.copy().items():
-            if data["startTime"] and data["startTime"] + max_guess_time() < time.time():
-                try:
-                    embed = embeds.embed(
-                        title="Failed",
-                        description=f"You failed to guess the {data['guessType']}.",
-                        color=discord.Color.red(),
-                    )
-                    embed.add_field(
-                        name="Answer",
-                        value=(
-                            (
-                                f"The correct answer was **{data['answerName']}**."
-                                + (
-                                    f"\n\n**This song has `{data['data']['notes']}` notes on Master.**"
-                                    if data["data"].get("notes")
-                                    else ""
-                                )
-                            )
-                            if data["guessType"] != "event"
-                            else f"The correct answer was **{data['answerName']}** (`{data['data']['short']}`)."
-                        ),
-                        inline=False,
-                    )
-                    if data["guessType"] == "character" and data.get("data"):
-                        embed.description += f"\n**Card:** {data['data']['card_name']}"
-                    if self.guess_ended(self.bot, data):
-                        return
-                    view = get_view(self.bot, data)
-                    files = []
-                    if data["data"].get("thumbnail"):
-                        file = discord.File(data["data"]["thumbnail"], "thumb.png")
-                        files.append(file)
-                        embed.set_thumbnail(url="attachment://thumb.png")
-                    if data["answer_file_path"]:
-                        if isinstance(data["answer_file_path"], io.BytesIO):
-                            data["answer_file_path"].seek(0)
-                        file = discord.File(data["answer_file_path"], "image.png")
-                        files.append(file)
-                        embed.set_image(url="attachment://image.png")
-                    da_embeds = [embed]
-                    tip = random.randint(1, 10) == 7
-                    if tip:
-                        da_embeds.append(random.choice(self.tip_embeds))
-                    msg = await data["channel"].send(
-                        embeds=da_embeds, view=view, files=files
+    def schedule_guess_timeout(self, data: dict):
+        """
+        End the guess once its time is up. The timer is cancelled by `remove_guess`,
+        so nothing runs while no guesses are active.
+        """
+        delay = max(0, data["startTime"] + self.guess_time_limit(data) - time.time())
+        data["timeout"] = asyncio.create_task(self.guess_timeout(data, delay))
+
+    async def guess_timeout(self, data: dict, delay: float):
+        await asyncio.sleep(delay)
+        data.pop("timeout", None)  # so ending the guess can't cancel this mid-send
+        if self.guess_ended(self.bot, data):
+            return
+        try:
+            embed = embeds.embed(
+                title="Failed",
+                description=f"You failed to guess the {data['guessType']}.",
+                color=discord.Color.red(),
+            )
+            embed.add_field(
+                name="Answer",
+                value=(
+                    (
+                        f"The correct answer was **{data['answerName']}**."
+                        + (
+                            f"\n\n**This song has `{data['data']['notes']}` notes on Master.**"
+                            if data["data"].get("notes")
+                            else ""
+                        )
                     )
-                    if view:
-                        view.message = msg
-                except:
-                    pass
-                self.remove_guess(self.bot, channel_id)
+                    if data["guessType"] != "event"
+                    else f"The correct answer was **{data['answerName']}** (`{data['data']['short']}`)."
+                ),
+                inline=False,
+            )
+            if data["guessType"] == "character" and data.get("data"):
+                embed.description += f"\n**Card:** {data['data']['card_name']}"
+            view = get_view(self.bot, data)
+            files = []
+            if data["data"].get("thumbnail"):
+                file = discord.File(data["data"]["thumbnail"], "thumb.png")
+                files.append(file)
+                embed.set_thumbnail(url="attachment://thumb.png")
+            if data["answer_file_path"]:
+                if isinstance(data["answer_file_path"], io.BytesIO):
+                    data["answer_file_path"].seek(0)
+                file = discord.File(data["answer_file_path"], "image.png")
+                files.append(file)
+                embed.set_image(url="attachment://image.png")
+            da_embeds = [embed]
+            tip = random.randint(1, 10) == 7
+            if tip:
+                da_embeds.append(random.choice(self.tip_embeds))
+            msg = await data["channel"].send(embeds=da_embeds, view=view, files=files)
+            if view:
+                view.message = msg
+        except:
+            pass
+        if not self.guess_ended(self.bot, data):
+            self.remove_guess(self.bot, data["channel"].id)
 
     """
     
@@ -741,10 +953,10 @@ class GuessCog(commands.Cog):
                     return
                 data["guessed"].append(message.author.id)
                 if data["guessType"] == "song":
-                    song = converters.SongFromPJSK(self.bot.pjsk, content)
+                    song = await self.resolve_song_guess(message.channel.id, content)
                     if GuessCog.guess_ended(self.bot, data):
                         return
-                    leak = (methods.Tools.isleak(song.id)) if song else False
+                    leak = self.bot.pjsk.availability.isleak(song.id) if song else False
                     if not song or leak:
                         embed = embeds.error_embed(
                             title="Incorrect",
@@ -1635,345 +1847,151 @@ class GuessCog(commands.Cog):
             interaction.user.id
         )
 
-        async def random_chart(diff: str = "master") -> Tuple[Song, str, str]:
-            for _ in range(10):  # maximum 10 retries
-                try:
-                    if diff == "master":
-                        song = self.random_song()
-                    else:
-                        song = self.random_song(has_append=True)
-                    region = methods.Tools.get_music_region(song.id, "en")
-                    png = await methods.Tools.get_chart(
-                        diff,
-                        song.id,
-                        server=region,
-                    )
-                    break
-                except IndexError:
-                    pass
-            return song, png, region
-
-        def random_jacket(has_master: bool = False) -> Tuple[Song, str]:
-            song = self.random_song()
-            jacket_path = methods.Tools.get_music_jacket(song.id)
-            for _ in range(10):  # maximum 10 retries
-                if (
-                    (not jacket_path)
-                    or (not os.path.exists(jacket_path))
-                    or (has_master and not song.difficulties.get("master"))
-                ):
-                    song = self.random_song()
-                    jacket_path = methods.Tools.get_music_jacket(song.id)
-                else:
-                    break
-            return song, jacket_path
-
-        def random_card_rare() -> Tuple[dict, str, int, bool, int]:
-            """char, card_path, char_id, trained, card_id"""
-            api = methods.pjsk_game_api_jp
+        try:
+            mirrored = guessing in ["chart", "chart_append"] and bool(
+                user_settings["mirror_charts_by_default"]
+            )
+            puzzle = await self.get_puzzle(guessing, mirrored)
 
-            def da_works():
-                char_id, asset_name, card_id, rarity = self.random_card()
-                if rarity == "rarity_birthday":
-                    path2 = "normal"
-                    trained = False
-                else:
-                    trained = not random.randint(0, 1)
-                    if trained:
-                        path2 = "after_training"
-                    else:
-                        path2 = "normal"
-                card_path = os.path.join(
-                    api.game_files_path,
-                    api.app_region,
-                    "character",
-                    "member",
-                    f"{asset_name}_ex",
-                    f"card_{path2}.png",
-                )
-                return card_path, char_id, asset_name, card_id, rarity, trained
+            new_guess["answer_file_path"] = puzzle["answer_file_path"]
+            new_guess["answer"] = puzzle["answer"]
+            new_guess["answerName"] = puzzle["answerName"]
+            new_guess["data"].update(puzzle["data"])
 
-            card_path, char_id, asset_name, card_id, rarity, trained = da_works()
-            for _ in range(10):
-                if (not card_path) or (not os.path.exists(card_path)):
-                    card_path, char_id, asset_name, card_id, rarity, trained = (
-                        da_works()
-                    )
-                else:
-                    break
-            char = self.bot.pjsk.characters_game[char_id - 1]
-            return char, card_path, char_id, trained, card_id
+            if puzzle["image"]:
+                file = discord.File(io.BytesIO(puzzle["image"]), "image.png")
+            else:
+                file = discord.utils.MISSING
 
-        try:
             match guessing:
                 case "jacket":
                     new_guess["guessType"] = "song"
 
-                    song, jacket_path = random_jacket()
-
-                    new_guess["answer_file_path"] = jacket_path
-                    new_guess["answer"] = song.id
-                    new_guess["answerName"] = song.title
-
-                    edited_image = await self.random_crop(jacket_path)
-
                     embed = embeds.embed(
                         title="Guess The Song", color=discord.Color.dark_gold()
                     )
-                    edited_image.seek(0)
-                    file = discord.File(edited_image, "image.png")
                     embed.set_image(url="attachment://image.png")
                     embed.description = f"Guess song name based on a cropped jacket.\nUse {('**'+self.bot.user.mention+'` ') if ((not self.bot.intents.message_content) and self.use_prefix) else ('**`' + self.guess_prefix)}your guess`** to guess. You have 60 seconds."
                     # debugging, comment this for prod
-                    # embed.description += f"\ndebug - answer `{song.title}` (`{song.id}`)"
+                    # embed.description += f"\ndebug - answer `{new_guess['answerName']}` (`{new_guess['answer']}`)"
 
                 case "jacket_30px":
                     new_guess["guessType"] = "song"
                     new_guess["data"]["success_modifier"] = 1.2
 
-                    song, jacket_path = random_jacket()
-
-                    new_guess["answer_file_path"] = jacket_path
-                    new_guess["answer"] = song.id
-                    new_guess["answerName"] = song.title
-
-                    edited_image = await self.random_crop(jacket_path, size=30)
-
                     embed = embeds.embed(
                         title="Guess The Song", color=discord.Color.dark_gold()
                     )
-                    edited_image.seek(0)
-                    file = discord.File(edited_image, "image.png")
                     embed.set_image(url="attachment://image.png")
                     embed.description = f"**30px Jacket Guess!** Guess song name based on cropped jacket.\nUse {('**'+self.bot.user.mention+'` ') if ((not self.bot.intents.message_content) and self.use_prefix) else ('**`' + self.guess_prefix)}your guess`** to guess. You have 60 seconds."
                     # debugging, comment this for prod
-                    # embed.description += f"\ndebug - answer `{song.title}` (`{song.id}`)"
+                    # embed.description += f"\ndebug - answer `{new_guess['answerName']}` (`{new_guess['answer']}`)"
                 case "jacket_bw":
                     new_guess["guessType"] = "song"
                     new_guess["data"]["success_modifier"] = 1.1
 
-                    song, jacket_path = random_jacket()
-
-                    new_guess["answer_file_path"] = jacket_path
-                    new_guess["answer"] = song.id
-                    new_guess["answerName"] = song.title
-
-                    edited_image = await self.random_crop(jacket_path, bw=True)
                     embed = embeds.embed(
                         title="Guess The Song", color=discord.Color.dark_gold()
                     )
-                    edited_image.seek(0)
-                    file = discord.File(edited_image, "image.png")
                     embed.set_image(url="attachment://image.png")
                     embed.description = f"**Grayscale Jacket Guess!** Guess song name based on cropped jacket.\nUse {('**'+self.bot.user.mention+'` ') if ((not self.bot.intents.message_content) and self.use_prefix) else ('**`' + self.guess_prefix)}your guess`** to guess. You have 60 seconds."
                     # debugging, comment this for prod
-                    # embed.description += f"\ndebug - answer `{song.title}` (`{song.id}`)"
+                    # embed.description += f"\ndebug - answer `{new_guess['answerName']}` (`{new_guess['answer']}`)"
                 case "jacket_challenge":
                     new_guess["guessType"] = "song"
                     new_guess["data"]["success_modifier"] = 5
 
-                    song, jacket_path = random_jacket()
-
-                    new_guess["answer_file_path"] = jacket_path
-                    new_guess["answer"] = song.id
-                    new_guess["answerName"] = song.title
-
-                    edited_image = await self.random_crop(jacket_path, size=30, bw=True)
                     embed = embeds.embed(
                         title="Guess The Song", color=discord.Color.dark_gold()
                     )
-                    edited_image.seek(0)
-                    file = discord.File(edited_image, "image.png")
                     embed.set_image(url="attachment://image.png")
                     embed.description = f"**CHALLENGE JACKET GUESS!** Guess song name based on cropped *grayscale 30px* jacket.\nUse {('**'+self.bot.user.mention+'` ') if ((not self.bot.intents.message_content) and self.use_prefix) else ('**`' + self.guess_prefix)}your guess`** to guess. You have 60 seconds."  # {not_counted_warning}"
                     # debugging, comment this for prod
-                    # embed.description += f"\ndebug - answer `{song.title}` (`{song.id}`)"
+                    # embed.description += f"\ndebug - answer `{new_guess['answerName']}` (`{new_guess['answer']}`)"
                 case "character":
                     new_guess["guessType"] = "character"
 
-                    char, card_path, char_id, trained, card_id = random_card_rare()
-
-                    new_guess["answer_file_path"] = card_path
-                    new_guess["answer"] = char_id
-                    new_guess["answerName"] = (
-                        str(char["givenName"]) + " " + str(char["firstName"])
-                        if char.get("firstName") and char.get("unit") != "piapro"
-                        else (
-                            str(char["firstName"]) + " " + str(char["givenName"])
-                            if char.get("firstName")
-                            else char["givenName"]
-                        )
-                    )
-                    new_guess["data"]["card_id"] = card_id
-                    new_guess["data"]["trained"] = trained
-                    new_guess["data"]["card_name"] = methods.Tools.get_card_name(
-                        card_id, trained, include_character=True, use_emojis=True
-                    )
-
-                    edited_image = await self.random_crop_rectangle(card_path)
                     embed = embeds.embed(
                         title="Guess The Character", color=discord.Color.dark_gold()
                     )
-                    edited_image.seek(0)
-                    file = discord.File(edited_image, "image.png")
                     embed.set_image(url="attachment://image.png")
                     embed.description = f"Guess character name based on cropped card.\nUse {('**'+self.bot.user.mention+'` ') if ((not self.bot.intents.message_content) and self.use_prefix) else ('**`' + self.guess_prefix)}your guess`** to guess. You have 30 seconds."
                     # debugging, comment this for prod
-                    # embed.description += f"\ndebug - answer `{song.title}` (`{song.id}`)"
+                    # embed.description += f"\ndebug - answer `{new_guess['answerName']}` (`{new_guess['answer']}`)"
                 case "character_bw":
                     new_guess["guessType"] = "character"
                     new_guess["data"]["success_modifier"] = 1.25
 
-                    char, card_path, char_id, trained, card_id = random_card_rare()
-
-                    new_guess["answer_file_path"] = card_path
-                    new_guess["answer"] = char_id
-                    new_guess["answerName"] = (
-                        str(char["givenName"]) + " " + str(char["firstName"])
-                        if char.get("firstName") and char.get("unit") != "piapro"
-                        else (
-                            str(char["firstName"]) + " " + str(char["givenName"])
-                            if char.get("firstName")
-                            else char["givenName"]
-                        )
-                    )
-                    new_guess["data"]["card_id"] = card_id
-                    new_guess["data"]["trained"] = trained
-                    new_guess["data"]["card_name"] = methods.Tools.get_card_name(
-                        card_id, trained, include_character=True, use_emojis=True
-                    )
-
-                    edited_image = await self.random_crop_rectangle(card_path, bw=True)
                     embed = embeds.embed(
                         title="Guess The Character", color=discord.Color.dark_gold()
                     )
-                    edited_image.seek(0)
-                    file = discord.File(edited_image, "image.png")
                     embed.set_image(url="attachment://image.png")
                     embed.description = f"**Grayscale Character Guess!** Guess character name based on cropped card.\nUse {('**'+self.bot.user.mention+'` ') if ((not self.bot.intents.message_content) and self.use_prefix) else ('**`' + self.guess_prefix)}your guess`** to guess. You have 30 seconds."
                     # debugging, comment this for prod
-                    # embed.description += f"\ndebug - answer `{song.title}` (`{song.id}`)"
+                    # embed.description += f"\ndebug - answer `{new_guess['answerName']}` (`{new_guess['answer']}`)"
                 case "chart":
                     new_guess["guessType"] = "song"
                     new_guess["data"]["success_modifier"] = 2
 
-                    song, png, region = await random_chart()
-                    if user_settings["mirror_charts_by_default"]:
-                        png = await to_process_with_timeout(pjsk_chart.mirror, png)
-
-                    new_guess["answer_file_path"] = png
-                    new_guess["answer"] = song.id
-                    new_guess["answerName"] = song.title
-                    new_guess["data"]["diff"] = "master"
-                    new_guess["data"]["region"] = region
-                    new_guess["data"]["is_chart"] = True
-
-                    edited_image = await self.random_crop_chart(png)
                     embed = embeds.embed(
                         title="Guess The Chart", color=discord.Color.dark_gold()
                     )
-                    edited_image.seek(0)
-                    file = discord.File(edited_image, "image.png")
                     embed.set_image(url="attachment://image.png")
 
                     embed.description = (
                         f"Guess song name based on cropped master chart.\nUse {('**'+self.bot.user.mention+'` ') if ((not self.bot.intents.message_content) and self.use_prefix) else ('**`' + self.guess_prefix)}your guess`** to guess. You have 60 seconds."
                         + (
                             "\n\n**Chart is mirrored! (user settings)**"
-                            if user_settings["mirror_charts_by_default"]
+                            if mirrored
                             else ""
                         )
                     )
                     # debugging, comment this for prod
-                    # embed.description += f"\ndebug - answer `{song.title}` (`{song.id}`)"
+                    # embed.description += f"\ndebug - answer `{new_guess['answerName']}` (`{new_guess['answer']}`)"
                 case "chart_append":
                     new_guess["guessType"] = "song"
 
-                    song, png, region = await random_chart("append")
-                    if user_settings["mirror_charts_by_default"]:
-                        png = await to_process_with_timeout(pjsk_chart.mirror, png)
-
-                    new_guess["answer_file_path"] = png
-                    new_guess["answer"] = song.id
-                    new_guess["answerName"] = song.title
-                    new_guess["data"]["diff"] = "append"
-                    new_guess["data"]["region"] = region
-                    new_guess["data"]["is_chart"] = True
-
-                    edited_image = await self.random_crop_chart(png)
                     embed = embeds.embed(
                         title="Guess The Chart", color=discord.Color.dark_gold()
                     )
-                    edited_image.seek(0)
-                    file = discord.File(edited_image, "image.png")
                     embed.set_image(url="attachment://image.png")
 
                     embed.description = (
                         f"Guess song name based on cropped append chart.\nUse {('**'+self.bot.user.mention+'` ') if ((not self.bot.intents.message_content) and self.use_prefix) else ('**`' + self.guess_prefix)}your guess`** to guess. You have 20 seconds."
                         + (
                             "\n\n**Chart is mirrored! (user settings)**"
-                            if user_settings["mirror_charts_by_default"]
+                            if mirrored
                             else ""
                         )
                     )
                     # debugging, comment this for prod
-                    # embed.description += f"\ndebug - answer `{song.title}` (`{song.id}`)"
+                    # embed.description += f"\ndebug - answer `{new_guess['answerName']}` (`{new_guess['answer']}`)"
                 case "event":
                     new_guess["guessType"] = "event"
                     new_guess["data"]["success_modifier"] = 1.1
 
-                    for _ in range(10):  # maximum 10 retries
-                        try:
-                            event = self.random_event(en_only=True)
-                            thumbnail, png, _ = methods.Tools.get_event_images(
-                                event["id"], methods.Tools.get_event_region(event["id"])
-                            )
-                            break
-                        except IndexError as e:
-                            print(e)
-                            pass
-
-                    new_guess["answer_file_path"] = png
-                    new_guess["data"]["thumbnail"] = thumbnail
-                    new_guess["answer"] = event["id"]
-                    new_guess["answerName"] = event["name"]
-                    new_guess["data"]["short"] = event["assetbundleName"].split("_")[1]
-
-                    edited_image = await self.random_crop_rectangle(png)
                     embed = embeds.embed(
                         title="Guess The Event", color=discord.Color.dark_gold()
                     )
-                    edited_image.seek(0)
-                    file = discord.File(edited_image, "image.png")
                     embed.set_image(url="attachment://image.png")
 
                     embed.description = f"Guess event name based on cropped event background.\nUse {('**'+self.bot.user.mention+'` ') if ((not self.bot.intents.message_content) and self.use_prefix) else ('**`' + self.guess_prefix)}your guess`** to guess. You have 60 seconds.\n\n-# Note: EN only events will show up. No specific aliases."
                     # debugging, comment this for prod
-                    # embed.description += f"\ndebug - answer `{event['name']}` (`{event['id']}`, `{event['assetbundleName']}`)"
+                    # embed.description += f"\ndebug - answer `{new_guess['answerName']}` (`{new_guess['answer']}`, `{new_guess['data']['short']}`)"
                 case "notes":
                     new_guess["guessType"] = "song"
                     new_guess["data"]["success_modifier"] = 2
 
-                    song, jacket_path = random_jacket(has_master=True)
-
-                    new_guess["answer_file_path"] = None
-                    new_guess["answer"] = song.id
-                    new_guess["answerName"] = song.title
-                    new_guess["data"]["notes"] = song.difficulties["master"][
-                        "totalNoteCount"
-                    ]
-                    new_guess["data"]["thumbnail"] = jacket_path
-
                     embed = embeds.embed(
                         title="Guess The Song", color=discord.Color.dark_gold()
                     )
-                    file = discord.utils.MISSING
                     embed.description = f"Guess song name based on Master note count.\nUse {('**'+self.bot.user.mention+'` ') if ((not self.bot.intents.message_content) and self.use_prefix) else ('**`' + self.guess_prefix)}your guess`** to guess. You have 60 seconds.\n\n# This song has `{new_guess['data']['notes']}` notes on Master."
                     # debugging, comment this for prod
-                    # embed.description += f"\ndebug - answer `{song.title}` (`{song.id}`)"
+                    # embed.description += f"\ndebug - answer `{new_guess['answerName']}` (`{new_guess['answer']}`)"
 
             await interaction.followup.send(embed=embed, file=file)
             new_guess["startTime"] = time.time()
+            self.schedule_guess_timeout(new_guess)
         except (
             Exception
         ) as e:  # it errored and we don't want to permanently block this channel
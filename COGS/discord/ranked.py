@@ -14,6 +14,7 @@ from DATA.helpers import discord_autocompletes as autocompletes
 from DATA.helpers import views
 from DATA.helpers import embeds
 from DATA.helpers import tools
+from DATA.helpers import master_index
 
 from DATA.helpers.unblock import to_process_with_timeout
 
@@ -73,13 +74,25 @@ class RankedCog(commands.Cog):
                 for k, v in data["last_updated"].items():
                     self.bot.cache.ranked_last_updated[k] = v
 
+    def rank_data_expires_at(
+        self, seasons: master_index.IntervalIndex, region: str
+    ) -> float:
+        """
+        When the cached ranked leaderboard of a region goes stale: update_cooldown after
+        the last update during a season, otherwise once the next season starts.
+        """
+        last_updated = self.bot.cache.ranked_last_updated[region]
+        at = int(last_updated * 1000)
+        changes_at = seasons.changes_at(at)
+        expires_at = changes_at / 1000 if changes_at is not None else math.inf
+        if seasons.current(at):
+            expires_at = min(expires_at, last_updated + self.update_cooldown)
+        return expires_at
+
     def update_rank_data(self, region: str, force: bool = False) -> str:
         api = methods.Tools.get_api(region)
-        if (
-            force
-            or self.bot.cache.ranked_last_updated[region] + self.update_cooldown
-            < time.time()
-        ):
+        seasons = master_index.rank_match_seasons(api)
+        if force or self.rank_data_expires_at(seasons, region) < time.time():
             try:
                 self.bot.cache.ranked_data[region] = api.get_ranked_leaderboard()
                 self.bot.cache.ranked_last_updated[region] = time.time()
@@ -94,22 +107,14 @@ class RankedCog(commands.Cog):
             except Exception as e:
                 # pass
                 self.bot.traceback(e)
-        data = api.get_master_data("rankMatchSeasons.json")
-        for i in range(0, len(data)):
-            startAt = data[i]["startAt"]
-            endAt = data[i]["closedAt"]
-            now = int(round(time.time() * 1000))
-            if startAt < now < endAt:
-                return data[i]["name"]
-        if (
-            len(data) == 1
-        ):  # 如果只有一个数据，有可能是开第一次排位之前，也有可能是第一次排位之后，排除第一个排位之前的
-            if now < data[0]["startAt"]:
-                return "Unknown Season"
-            else:
-                return data[len(data) - 1]["id"]
-        else:
-            return data[len(data) - 1]["id"]
+        now = int(round(time.time() * 1000))
+        current = seasons.current(now)
+        if current:
+            return current["name"]
+        previous = seasons.previous(now)
+        if previous:
+            return previous["id"]
+        return "Unknown Season"  # before the first season
 
     class LeaderboardView(views.SbotgaView):
         def __init__(
@@ -22,6 +22,7 @@ from DATA.helpers import views
 from DATA.helpers import embeds
 from DATA.helpers.unblock import to_process_with_timeout
 from DATA.helpers import pjsk_chart
+from DATA.helpers import image_cache
 from DATA.helpers import tools
 
 from DATA.data.pjsk import Song, pjsk as pjsk_data_obj
@@ -244,7 +245,7 @@ class SongInfo(commands.Cog):
 
             # --- Load jacket and prepare drawing ---
             jacket = methods.Tools.get_music_jacket(song.id)
-            img = Image.open(jacket)
+            img = image_cache.open_image(jacket)
             img_width, img_height = img.size
 
             indicator_size = (75, 75)
@@ -271,7 +272,9 @@ class SongInfo(commands.Cog):
                     else indicators[status_map[status]]
                 )
 
-                indicator = Image.open(indicator_path).resize(indicator_size)
+                indicator = image_cache.open_image(
+                    indicator_path, size=indicator_size, copy=False
+                )
 
                 expanded_size = (
                     indicator_size[0] + padding * 2,
@@ -455,7 +458,9 @@ class SongInfo(commands.Cog):
             region = region[0]
             chart = await methods.Tools.get_chart(difficulty, song.id, region)
             if mirror:
-                chart = await to_process_with_timeout(pjsk_chart.mirror, chart)
+                chart = await to_process_with_timeout(
+                    pjsk_chart.mirrored_chart, chart, song.id, difficulty, region
+                )
             file = discord.File(chart, "image.png")
             embed.set_image(url="attachment://image.png")
             embed.description = f"**Difficulty:** {emojis.difficulty_colors[difficulty]} {difficulty.title()}"
@@ -593,7 +598,7 @@ class SongInfo(commands.Cog):
             return
         found = []
         for music_id, data in self.bot.pjsk.difficulties.items():
-            if methods.Tools.isleak(music_id):
+            if self.bot.pjsk.availability.isleak(music_id):
                 continue
             for difficulty, diff_data in data.items():
                 song = converters.SongFromPJSK(self.bot.pjsk, music_id)
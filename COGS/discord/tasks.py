@@ -7,7 +7,7 @@ from COGS.discord_translations import translations
 
 from main import DiscordBot
 
-import time, csv, asyncio, datetime
+import time, csv, asyncio, datetime, hashlib
 from io import StringIO
 
 import aiohttp
@@ -18,6 +18,9 @@ from DATA.helpers import discord_autocompletes as autocompletes
 from DATA.helpers import converters
 from DATA.helpers import embeds
 from DATA.helpers import unblock
+from DATA.helpers import jacket_atlas
+
+from COGS import render_jobs
 
 from DATA.data.pjsk import Song
 
@@ -29,6 +32,8 @@ class TasksAndUpdates(commands.Cog):
         self.bot.get_constant = self.get_constant
         self.bot.get_constant_sync = self.get_constant_sync
 
+        self.jacket_atlas_version = None
+
         self.cog_tasks.start()
         self.hourly_task.start()
 
@@ -60,6 +65,21 @@ class TasksAndUpdates(commands.Cog):
     async def cog_tasks(self):
         if self.bot.cache.constants_updated + 3600 < time.time():
             await self.update_constants()
+        if self.jacket_atlas_version != self.bot.pjsk.master_version:
+            # new songs since the last check, the rest of the atlas is kept
+            self.jacket_atlas_version = self.bot.pjsk.master_version
+            unblock.to_thread(self.update_jacket_atlas)
+
+    def update_jacket_atlas(self):
+        """Pre-resize every song's jacket for the B30 counts anyone can use."""
+        paths = []
+        for music_id in list(self.bot.pjsk.songs):
+            try:
+                paths.append(methods.Tools.get_music_jacket(music_id))
+            except Exception:
+                continue
+        for count in (10, 30, 50):
+            jacket_atlas.update(paths, render_jobs.b30_jacket_size(count))
 
     async def get_constant(
         self,
@@ -118,6 +138,14 @@ class TasksAndUpdates(commands.Cog):
                     csv_data = await response.read()
                     await self.parse_csv(csv_data, secondary=True)
                     self.bot.cache.constants_updated = time.time()
+        self.bot.cache.constants_version = hashlib.md5(
+            repr(
+                (
+                    sorted(self.bot.cache.constants.items()),
+                    sorted(self.bot.cache.constants_override.items()),
+                )
+            ).encode("utf-8")
+        ).hexdigest()
 
     async def parse_csv(self, csv_data: bytes, secondary: bool = False):
         # Decode CSV data and load into a dictionary
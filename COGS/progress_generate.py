@@ -1,9 +1,12 @@
 from PIL import Image, ImageDraw, ImageFont
 from dataclasses import dataclass
+from functools import cache
 from math import ceil
 from io import BytesIO
 from typing import List
 
+from DATA.helpers.draw_primitives import draw_gradient, vertical_gradient, donut_chart
+
 
 @dataclass
 class DifficultyCategory:
@@ -23,28 +26,130 @@ class StrDifficultyCategory:
     all_count: int
 
 
-def _draw_gradient(img: Image.Image, start: tuple, end: tuple) -> None:
-    """Paint a vertical gradient from start RGB to end RGB on img (in-place)."""
-    draw = ImageDraw.Draw(img)
-    h = img.height
-    w = img.width
-    # Pre-calc float steps
-    r0, g0, b0 = start
-    r1, g1, b1 = end
-    for y in range(h):
-        t = y / h
-        color = (
-            int(r0 + (r1 - r0) * t),
-            int(g0 + (g1 - g0) * t),
-            int(b0 + (b1 - b0) * t),
-        )
-        draw.line([(0, y), (w, y)], fill=color)
-
-
-def generate_general_progress(data: List[StrDifficultyCategory]):
-    # fonts
-    FONTPATH = "DATA/data/ASSETS/rodinntlg_eb.otf"
-    FONTPATH_LIGHT = "DATA/data/ASSETS/rodinntlg_m.otf"
+FONTPATH = "DATA/data/ASSETS/rodinntlg_eb.otf"
+FONTPATH_LIGHT = "DATA/data/ASSETS/rodinntlg_m.otf"
+
+FC_COLOR = "#e83ce3"
+CLEAR_COLOR = "#F9D442"
+NOT_CLEAR_COLOR = "#38383a"
+
+ICONS = {
+    "ap": "DATA/data/ASSETS/normal_ap.png",
+    "ap_append": "DATA/data/ASSETS/append_ap.png",
+    "fc": "DATA/data/ASSETS/normal_fc.png",
+    "fc_append": "DATA/data/ASSETS/append_fc.png",
+    "clear": "DATA/data/ASSETS/normal_clear.png",
+    "clear_append": "DATA/data/ASSETS/append_clear.png",
+}
+ICON_PADDING = 20
+
+BACKGROUND_IMG = "DATA/data/ASSETS/hug.png"
+
+# Difficulty color images used for sampling badge/donut backgrounds.
+DIFFICULTY_COLORS = {
+    "append": "DATA/data/ASSETS/append_color.jpg",
+    "hard": "DATA/data/ASSETS/hard_color.jpg",
+    "normal": "DATA/data/ASSETS/normal_color.jpg",
+    "easy": "DATA/data/ASSETS/easy_color.jpg",
+    "master": "DATA/data/ASSETS/master_color.jpg",
+    "expert": "DATA/data/ASSETS/expert_color.jpg",
+}
+
+
+def _difficulty_colors(size: tuple[int, int]) -> dict[str, tuple]:
+    """difficulty -> (top left, bottom right) color of its color image resized to size"""
+    colors = {}
+    for key, path in DIFFICULTY_COLORS.items():
+        img = Image.open(path).resize(size, Image.LANCZOS).convert("RGBA")
+        colors[key] = (img.getpixel((1, 1)), img.getpixel((size[0] - 1, size[1] - 1)))
+    return colors
+
+
+def _ap_gradient(size: int) -> Image.Image:
+    """Square gradient of the ALL PERFECT icon's colors, for the AP slice of donuts."""
+    ap_color_sample = Image.open(ICONS["ap"]).convert("RGBA")
+    # sample positions (guard within bounds)
+    w_s, h_s = ap_color_sample.size
+    top_y = min(60, h_s - 1)
+    bottom_y = max(h_s - 60, 0)
+    color_top = ap_color_sample.getpixel((w_s // 2, top_y))
+    color_bottom = ap_color_sample.getpixel((w_s // 2, bottom_y))
+    # RGBA, the donut takes its slice pixels as they are
+    return vertical_gradient((size, size), color_top[:3], color_bottom[:3], "RGBA")
+
+
+def _background(width: int, height: int) -> Image.Image:
+    background_img = Image.open(BACKGROUND_IMG)
+    original_width, original_height = background_img.size
+    if original_height > height:
+        background_img = background_img.crop((0, 0, original_width, height))
+    else:
+        background_img = background_img.resize((original_width, height))
+    return background_img.resize((width, height))
+
+
+def _draw_donut(
+    size: int,
+    ap_gradient: Image.Image,
+    diff,
+    hole: tuple,
+    icons: dict,
+    icon_size: int,
+    append: bool,
+) -> Image.Image:
+    """The AP/FC/clear/not clear donut of one difficulty category."""
+    # Compute pie slice angles.
+    aped = diff.ap_count
+    fced = diff.fc_count - diff.ap_count
+    cleared = diff.clear_count - diff.fc_count
+    not_cleared = diff.all_count - diff.clear_count
+
+    # protect against division by zero (keeps original intent)
+    total = diff.all_count or 1
+    percentage_ap = aped / total
+    percentage_fc = fced / total
+    percentage_clear = cleared / total
+    percentage_not_clear = not_cleared / total
+
+    angle_ap = percentage_ap * 360
+    angle_fc = angle_ap + (percentage_fc * 360)
+    angle_clear = angle_fc + (percentage_clear * 360)
+    angle_not_clear = angle_clear + (percentage_not_clear * 360)
+
+    # ALL PERFECT portion is cut out of the AP gradient
+    donut_img = donut_chart(
+        size,
+        hole,
+        [
+            (angle_ap, ap_gradient),
+            (angle_fc, FC_COLOR),
+            (angle_clear, CLEAR_COLOR),
+            (angle_not_clear, NOT_CLEAR_COLOR),
+        ],
+    )
+
+    # Overlay icon if fully ALL PERFECT, FULL COMBO or CLEAR.
+    icon_x = (size - icon_size) // 2
+    icon_y = (size - icon_size) // 2
+    key = None
+    if diff.ap_count == diff.all_count:
+        key = "ap"
+    elif diff.fc_count == diff.all_count:
+        key = "fc"
+    elif diff.clear_count == diff.all_count:
+        key = "clear"
+    if key:
+        icon = icons[key + "_append" if append else key]
+        donut_img.paste(icon, (icon_x, icon_y), icon)
+    return donut_img
+
+
+class GeneralProgressRenderer:
+    """
+    The all difficulty summary image. Everything that doesn't depend on the counts
+    (fonts, header, difficulty colors and badges, icons, the AP gradient, card and
+    panel backgrounds) is built once; a render only draws the donuts and counts.
+    """
 
     # image params
     IMAGE_WIDTH = 2000
@@ -54,11 +159,11 @@ def generate_general_progress(data: List[StrDifficultyCategory]):
     CARD_GUTTER_HEIGHT = 50
     CARD_GUTTER_WIDTH = 50
     CARD_WIDTH = IMAGE_WIDTH - (CARD_GUTTER_WIDTH * 2)
+    CARD_RADIUS = 25
 
     # Badge (difficulty title) parameters
     BADGE_HPAD = 40  # horizontal padding inside badge
     BADGE_VPAD = 20  # vertical padding inside badge
-    badge_font = ImageFont.truetype(FONTPATH, 70)
 
     # Donut chart parameters
     DONUT_SIZE = 350
@@ -69,334 +174,258 @@ def generate_general_progress(data: List[StrDifficultyCategory]):
     COUNT_PADDING_Y = 30  # vertical padding for counts panel
     COUNT_PADDING_X = 30
     COUNT_FONT_SIZE = 50
-    COUNT_FONT_CATEGORIES = ImageFont.truetype(FONTPATH, COUNT_FONT_SIZE)
-    COUNT_FONT_TEXT = ImageFont.truetype(FONTPATH_LIGHT, COUNT_FONT_SIZE)
     COUNT_FONT_COLOR = "white"
-    line_spacing = 20  # spacing between lines
-
-    FC_COLOR = "#e83ce3"
-    CLEAR_COLOR = "#F9D442"
-    NOT_CLEAR_COLOR = "#38383a"
-
-    ALL_AP_ICON = "DATA/data/ASSETS/normal_ap.png"
-    ALL_AP_APPEND_ICON = "DATA/data/ASSETS/append_ap.png"
-    ALL_FC_ICON = "DATA/data/ASSETS/normal_fc.png"
-    ALL_FC_APPEND_ICON = "DATA/data/ASSETS/append_fc.png"
-    ALL_CLEAR_ICON = "DATA/data/ASSETS/normal_clear.png"
-    ALL_CLEAR_APPEND_ICON = "DATA/data/ASSETS/append_clear.png"
-    ICON_PADDING = 20
-
-    BACKGROUND_IMG = "DATA/data/ASSETS/hug.png"
-
-    # Difficulty color images used for sampling badge/donut backgrounds.
-    difficulty_colors = {
-        "append": "DATA/data/ASSETS/append_color.jpg",
-        "hard": "DATA/data/ASSETS/hard_color.jpg",
-        "normal": "DATA/data/ASSETS/normal_color.jpg",
-        "easy": "DATA/data/ASSETS/easy_color.jpg",
-        "master": "DATA/data/ASSETS/master_color.jpg",
-        "expert": "DATA/data/ASSETS/expert_color.jpg",
-    }
-
-    # Preload difficulty images (resized) once
-    difficulty_images = {
-        key: Image.open(path)
-        .resize((CARD_WIDTH, DONUT_SIZE), Image.LANCZOS)
-        .convert("RGBA")
-        for key, path in difficulty_colors.items()
-    }
-
-    # Preload icon samples once (we'll resize copies when needed)
-    _ICON_CACHE = {
-        "ap": Image.open(ALL_AP_ICON).convert("RGBA"),
-        "ap_append": Image.open(ALL_AP_APPEND_ICON).convert("RGBA"),
-        "fc": Image.open(ALL_FC_ICON).convert("RGBA"),
-        "fc_append": Image.open(ALL_FC_APPEND_ICON).convert("RGBA"),
-        "clear": Image.open(ALL_CLEAR_ICON).convert("RGBA"),
-        "clear_append": Image.open(ALL_CLEAR_APPEND_ICON).convert("RGBA"),
-    }
-
-    def main(data: List[StrDifficultyCategory]):
+    LINE_SPACING = 20  # spacing between lines
+    LABELS = ["ALL PERFECT", "FULL COMBO", "CLEAR", "ALL"]
+
+    # We'll add extra padding around the white card background.
+    WHITE_CARD_PADDING = 30
+
+    def __init__(self):
+        self.badge_font = ImageFont.truetype(FONTPATH, 70)
+        self.count_font_categories = ImageFont.truetype(FONTPATH, self.COUNT_FONT_SIZE)
+        self.count_font_text = ImageFont.truetype(FONTPATH_LIGHT, self.COUNT_FONT_SIZE)
+
+        self.difficulty_colors = _difficulty_colors((self.CARD_WIDTH, self.DONUT_SIZE))
+        self.ap_gradient = _ap_gradient(self.DONUT_SIZE)
+        self.icon_size = (
+            self.DONUT_SIZE - (self.DONUT_THICKNESS * 2) - (ICON_PADDING * 2)
+        )
+        self.icons = {
+            key: Image.open(path)
+            .convert("RGBA")
+            .resize((self.icon_size, self.icon_size))
+            for key, path in ICONS.items()
+        }
+        self.backgrounds = {}
+        self.badges = {}
+
+        # --- Determine counts panel height ---
+        sample_text = "ALL PERFECT"
+        bbox = self.count_font_categories.getbbox(sample_text)
+        self.text_height = bbox[3] - bbox[1]
+        counts_panel_height = (
+            self.COUNT_PADDING_Y
+            + (self.text_height * 4)
+            + (self.LINE_SPACING * 3)
+            + self.COUNT_PADDING_Y
+        )
+        # The content row (donut and counts) height is the larger of DONUT_SIZE and counts_panel_height.
+        row_height = max(self.DONUT_SIZE, counts_panel_height)
+        # The white card background area will fill the entire card container.
+        self.card_content_height = row_height + (self.WHITE_CARD_PADDING * 2)
+
+        # Header
+        self.header = Image.new("RGBA", (self.IMAGE_WIDTH, self.HEADER_HEIGHT + 1))
+        header_draw = ImageDraw.Draw(self.header)
+        header_draw.rectangle(
+            [(0, 0), (self.IMAGE_WIDTH, self.HEADER_HEIGHT)],
+            fill="#b4ccfa",
+            outline="#00194a",
+        )
+        header_font = ImageFont.truetype(FONTPATH, 96)
+        header_draw.text(
+            (20, 28), "Your PJSK All Difficulty Summary", fill="black", font=header_font
+        )
+        watermark = ImageFont.truetype(FONTPATH, 60)
+        header_draw.text((20, 130), "Generated by Sbotga", fill="black", font=watermark)
+
+        # Counts panel before the counts, in the rest of the card right of the donut
+        self.donut_x = self.WHITE_CARD_PADDING + self.DONUT_PADDING
+        self.count_panel_x = self.donut_x + self.DONUT_SIZE + self.DONUT_PADDING
+        content_area_right = self.CARD_WIDTH - self.WHITE_CARD_PADDING
+        self.count_panel_width = (
+            content_area_right - self.count_panel_x - self.DONUT_PADDING
+        )
+        self.count_panel = Image.new(
+            "RGBA", (self.count_panel_width, self.DONUT_SIZE), (255, 255, 255, 0)
+        )
+        count_draw = ImageDraw.Draw(self.count_panel)
+        count_draw.rounded_rectangle(
+            (0, 0, self.count_panel_width, self.DONUT_SIZE),
+            radius=self.CARD_RADIUS,
+            fill="#38383adf",
+        )
+        total_text_height = (self.text_height * 4) + (self.LINE_SPACING * 3)
+        self.count_start_y = (self.DONUT_SIZE - total_text_height) // 2
+        for idx, label in enumerate(self.LABELS):
+            count_draw.text(
+                (self.COUNT_PADDING_X, self.count_y(idx)),
+                label,
+                fill=self.COUNT_FONT_COLOR,
+                font=self.count_font_categories,
+            )
+
+    def count_y(self, idx: int) -> int:
+        return self.count_start_y + idx * (self.text_height + self.LINE_SPACING)
+
+    def background(self, height: int) -> Image.Image:
+        if height not in self.backgrounds:
+            self.backgrounds[height] = _background(self.IMAGE_WIDTH, height)
+        return self.backgrounds[height]
+
+    def card(self, height: int) -> Image.Image:
+        """Empty card container: a white rounded card inside the padding."""
+        if ("card", height) not in self.backgrounds:
+            card_container = Image.new(
+                "RGBA", (self.CARD_WIDTH, height), (255, 255, 255, 0)
+            )
+            white_rect = (
+                self.WHITE_CARD_PADDING,
+                self.WHITE_CARD_PADDING,
+                self.CARD_WIDTH - self.WHITE_CARD_PADDING,
+                height - self.WHITE_CARD_PADDING,
+            )
+            ImageDraw.Draw(card_container).rounded_rectangle(
+                white_rect, radius=self.CARD_RADIUS, fill="white"
+            )
+            self.backgrounds[("card", height)] = card_container
+        return self.backgrounds[("card", height)]
+
+    def badge(
+        self, difficulty: str, width: int, height: int
+    ) -> tuple[Image.Image, Image.Image]:
+        """Difficulty badge with its text, and the mask of its rounded shape."""
+        key = (difficulty, width, height)
+        if key in self.badges:
+            return self.badges[key]
+        diff_key = difficulty.lower()
+        colors = self.difficulty_colors.get(diff_key)
+        if colors:
+            if diff_key == "append":
+                top_color, bottom_color = colors
+                badge_bg = Image.new("RGB", (width, height))
+                draw_gradient(badge_bg, top_color, bottom_color)
+            else:
+                badge_bg = Image.new("RGB", (width, height), colors[0])
+        else:
+            badge_bg = Image.new("RGB", (width, height), "gray")
+        badge_bg = badge_bg.convert("RGB")
+        badge_mask = Image.new("L", (width, height), 0)
+        mask_draw = ImageDraw.Draw(badge_mask)
+        mask_draw.rounded_rectangle(
+            (0, 0, width, height),
+            radius=(height // 2),
+            fill=255,
+        )
+        # Draw badge text centered in the badge.
+        badge_text = difficulty.upper()
+        text_w = self.badge_font.getlength(badge_text)
+        text_bbox = self.badge_font.getbbox(badge_text)
+        text_h = text_bbox[3] - text_bbox[1]
+        text_x = (width - text_w) / 2
+        text_y = (height - text_h) / 2 - 5
+        ImageDraw.Draw(badge_bg).text(
+            (text_x, text_y), badge_text, fill="black", font=self.badge_font
+        )
+        self.badges[key] = (badge_bg, badge_mask)
+        return self.badges[key]
+
+    def render(self, data: List[StrDifficultyCategory]) -> BytesIO:
         # --- Compute maximum badge dimensions (all badges will use the largest size (we add 2 characters for padding)) ---
         max_text_width = 0
         max_text_height = 0
         for diff in data:
             text = diff.difficulty.upper() + "hi"
-            w = badge_font.getlength(text)
-            bbox = badge_font.getbbox(text)
+            w = self.badge_font.getlength(text)
+            bbox = self.badge_font.getbbox(text)
             h = bbox[3] - bbox[1]
             if w > max_text_width:
                 max_text_width = w
             if h > max_text_height:
                 max_text_height = h
-        max_badge_width = int(max_text_width + 2 * BADGE_HPAD)
-        max_badge_height = int(max_text_height + 2 * BADGE_VPAD)
-
-        # --- Determine counts panel height dynamically ---
-        sample_text = "ALL PERFECT"
-        bbox = COUNT_FONT_CATEGORIES.getbbox(sample_text)
-        text_height = bbox[3] - bbox[1]
-        counts_panel_height = (
-            COUNT_PADDING_Y + (text_height * 4) + (line_spacing * 3) + COUNT_PADDING_Y
-        )
-
-        # The content row (donut and counts) height is the larger of DONUT_SIZE and counts_panel_height.
-        row_height = max(DONUT_SIZE, counts_panel_height)
-
-        # We'll add extra padding around the white card background.
-        white_card_padding = 30
-        # The white card background area will fill the entire card container.
-        # We set CARD_CONTENT_HEIGHT to row_height plus vertical padding.
-        CARD_CONTENT_HEIGHT = row_height + (white_card_padding * 2)
+        max_badge_width = int(max_text_width + 2 * self.BADGE_HPAD)
+        max_badge_height = int(max_text_height + 2 * self.BADGE_VPAD)
 
         # The overall card container height must allow the badge (which will overlap above)
-        CARD_CONTAINER_HEIGHT = CARD_CONTENT_HEIGHT + (max_badge_height // 2)
+        card_container_height = self.card_content_height + (max_badge_height // 2)
 
         # Total number of cards and overall image height.
         number_of_cards = len(data)
         total_height = (
-            HEADER_HEIGHT
-            + SUB_HEADER_HEIGHT
-            + (number_of_cards * CARD_CONTAINER_HEIGHT)
-            + ((number_of_cards + 1) * CARD_GUTTER_HEIGHT)
+            self.HEADER_HEIGHT
+            + self.SUB_HEADER_HEIGHT
+            + (number_of_cards * card_container_height)
+            + ((number_of_cards + 1) * self.CARD_GUTTER_HEIGHT)
         )
 
-        new_im = Image.new("RGBA", (IMAGE_WIDTH, total_height))
-
-        # Draw overall background image.
-        background_img = Image.open(BACKGROUND_IMG)
-        original_width, original_height = background_img.size
-        if original_height > total_height:
-            background_img = background_img.crop((0, 0, original_width, total_height))
-        else:
-            background_img = background_img.resize((original_width, total_height))
-        background_img = background_img.resize((IMAGE_WIDTH, total_height))
-        new_im.paste(background_img, (0, 0))
-
-        im_draw = ImageDraw.Draw(new_im)
-
-        # Draw header.
-        im_draw.rectangle(
-            [(0, 0), (new_im.width, HEADER_HEIGHT)], fill="#b4ccfa", outline="#00194a"
+        new_im = Image.new("RGBA", (self.IMAGE_WIDTH, total_height))
+        new_im.paste(self.background(total_height), (0, 0))
+        new_im.paste(self.header, (0, 0))
+
+        # Define the content area inside the white card.
+        content_area_y = self.WHITE_CARD_PADDING
+        content_area_height = card_container_height - 2 * self.WHITE_CARD_PADDING
+
+        # Position the donut: leave DONUT_PADDING from the left.
+        donut_x = self.donut_x
+        donut_y = content_area_y + (content_area_height - self.DONUT_SIZE) // 2
+        count_panel_x = self.count_panel_x
+        hole = (
+            self.DONUT_THICKNESS,
+            self.DONUT_THICKNESS,
+            self.DONUT_SIZE - self.DONUT_THICKNESS,
+            self.DONUT_SIZE - self.DONUT_THICKNESS,
         )
-        header_font = ImageFont.truetype(FONTPATH, 96)
-        im_draw.text(
-            (20, 28), "Your PJSK All Difficulty Summary", fill="black", font=header_font
-        )
-        watermark = ImageFont.truetype(FONTPATH, 60)
-        im_draw.text((20, 130), "Generated by Sbotga", fill="black", font=watermark)
 
         # Process each card.
         for i, diff in enumerate(data):
             y_card = (
-                HEADER_HEIGHT
-                + SUB_HEADER_HEIGHT
-                + CARD_GUTTER_HEIGHT
-                + i * (CARD_CONTAINER_HEIGHT + CARD_GUTTER_HEIGHT)
-            )
-
-            # Create card container.
-            card_container = Image.new(
-                "RGBA", (CARD_WIDTH, CARD_CONTAINER_HEIGHT), (255, 255, 255, 0)
-            )
-            container_draw = ImageDraw.Draw(card_container)
-            CARD_RADIUS = 25
-
-            # --- Draw white card background (expanded to include padding) ---
-            white_rect = (
-                white_card_padding,
-                white_card_padding,
-                CARD_WIDTH - white_card_padding,
-                CARD_CONTAINER_HEIGHT - white_card_padding,
-            )
-            container_draw.rounded_rectangle(
-                white_rect, radius=CARD_RADIUS, fill="white"
-            )
-
-            # --- Inside white card, draw the donut and counts panel.
-            # Define the content area inside the white card.
-            content_area_x = white_card_padding
-            content_area_y = white_card_padding
-            content_area_width = CARD_WIDTH - 2 * white_card_padding
-            content_area_height = CARD_CONTAINER_HEIGHT - 2 * white_card_padding
-
-            # Position the donut: leave DONUT_PADDING from the left.
-            donut_x = content_area_x + DONUT_PADDING
-            donut_y = content_area_y + (content_area_height - DONUT_SIZE) // 2
-
-            # Create the donut chart.
-            donut_img = Image.new("RGBA", (DONUT_SIZE, DONUT_SIZE), (255, 255, 255, 0))
-            donut_draw = ImageDraw.Draw(donut_img)
-
-            # Compute pie slice angles.
-            aped = diff.ap_count
-            fced = diff.fc_count - diff.ap_count
-            cleared = diff.clear_count - diff.fc_count
-            not_cleared = diff.all_count - diff.clear_count
-
-            # protect against division by zero (keeps original intent)
-            total = diff.all_count or 1
-            percentage_ap = aped / total
-            percentage_fc = fced / total
-            percentage_clear = cleared / total
-            percentage_not_clear = not_cleared / total
-
-            angle_ap = percentage_ap * 360
-            angle_fc = angle_ap + (percentage_fc * 360)
-            angle_clear = angle_fc + (percentage_clear * 360)
-            angle_not_clear = angle_clear + (percentage_not_clear * 360)
-
-            pie_location = (0, 0, DONUT_SIZE, DONUT_SIZE)
-            donut_draw.pieslice(pie_location, 0, 360, fill="white")
-
-            # For ALL PERFECT portion, use a gradient from the ALL_AP_ICON sample.
-            # Use preloaded sample
-            ap_color_sample = _ICON_CACHE["ap"]
-            # sample positions (guard within bounds)
-            w_s, h_s = ap_color_sample.size
-            top_y = min(60, h_s - 1)
-            bottom_y = max(h_s - 60, 0)
-            color_top = ap_color_sample.getpixel((w_s // 2, top_y))
-            color_bottom = ap_color_sample.getpixel((w_s // 2, bottom_y))
-            gradient = Image.new("RGB", (DONUT_SIZE, DONUT_SIZE))
-            _draw_gradient(gradient, color_top, color_bottom)
-            im_mask = Image.new("L", (DONUT_SIZE, DONUT_SIZE), 0)
-            d_mask = ImageDraw.Draw(im_mask)
-            d_mask.pieslice((0, 0, DONUT_SIZE, DONUT_SIZE), 0, angle_ap, fill=255)
-            donut_img.paste(gradient, (0, 0), im_mask)
-
-            donut_draw.pieslice(pie_location, angle_ap, angle_fc, fill=FC_COLOR)
-            donut_draw.pieslice(pie_location, angle_fc, angle_clear, fill=CLEAR_COLOR)
-            donut_draw.pieslice(
-                pie_location, angle_clear, angle_not_clear, fill=NOT_CLEAR_COLOR
-            )
-
-            donut_draw.ellipse(
-                (
-                    DONUT_THICKNESS,
-                    DONUT_THICKNESS,
-                    DONUT_SIZE - DONUT_THICKNESS,
-                    DONUT_SIZE - DONUT_THICKNESS,
-                ),
-                fill="white",
+                self.HEADER_HEIGHT
+                + self.SUB_HEADER_HEIGHT
+                + self.CARD_GUTTER_HEIGHT
+                + i * (card_container_height + self.CARD_GUTTER_HEIGHT)
+            )
+            card_container = self.card(card_container_height).copy()
+
+            donut_img = _draw_donut(
+                self.DONUT_SIZE,
+                self.ap_gradient,
+                diff,
+                hole,
+                self.icons,
+                self.icon_size,
+                diff.difficulty.lower() == "append",
             )
-
-            # Overlay icon if fully ALL PERFECT or FULL COMBO.
-            icon_size = DONUT_SIZE - (DONUT_THICKNESS * 2) - (ICON_PADDING * 2)
-            icon_x = (DONUT_SIZE - icon_size) // 2
-            icon_y = (DONUT_SIZE - icon_size) // 2
-
-            if diff.ap_count == diff.all_count:
-                key = "ap_append" if diff.difficulty.lower() == "append" else "ap"
-                all_ap_img = _ICON_CACHE[key].resize((icon_size, icon_size))
-                donut_img.paste(all_ap_img, (icon_x, icon_y), all_ap_img)
-            elif diff.fc_count == diff.all_count:
-                key = "fc_append" if diff.difficulty.lower() == "append" else "fc"
-                all_fc_img = _ICON_CACHE[key].resize((icon_size, icon_size))
-                donut_img.paste(all_fc_img, (icon_x, icon_y), all_fc_img)
-            elif diff.clear_count == diff.all_count:
-                key = "clear_append" if diff.difficulty.lower() == "append" else "clear"
-                all_clear_img = _ICON_CACHE[key].resize((icon_size, icon_size))
-                donut_img.paste(all_clear_img, (icon_x, icon_y), all_clear_img)
-
             card_container.paste(donut_img, (donut_x, donut_y), donut_img)
 
-            # --- Draw counts panel inside the white card ---
-            # Counts panel is placed in the remaining area to the right of the donut.
-            count_panel_x = donut_x + DONUT_SIZE + DONUT_PADDING
-            content_area_right = content_area_x + content_area_width
-            count_panel_width = content_area_right - count_panel_x - DONUT_PADDING
-            count_panel_height = DONUT_SIZE  # keep same as donut for visual balance
-            count_img = Image.new(
-                "RGBA", (count_panel_width, count_panel_height), (255, 255, 255, 0)
-            )
+            # --- Counts panel, to the right of the donut ---
+            count_img = self.count_panel.copy()
             count_draw = ImageDraw.Draw(count_img)
-            count_draw.rounded_rectangle(
-                (0, 0, count_panel_width, count_panel_height),
-                radius=CARD_RADIUS,
-                fill="#38383adf",
-            )
-
-            labels = ["ALL PERFECT", "FULL COMBO", "CLEAR", "ALL"]
-            total_text_height = (text_height * 4) + (line_spacing * 3)
-            start_y = (count_panel_height - total_text_height) // 2
-
-            for idx, label in enumerate(labels):
-                y_pos = start_y + idx * (text_height + line_spacing)
-                count_draw.text(
-                    (COUNT_PADDING_X, y_pos),
-                    label,
-                    fill=COUNT_FONT_COLOR,
-                    font=COUNT_FONT_CATEGORIES,
-                )
-                if label == "ALL PERFECT":
-                    value = str(diff.ap_count)
-                elif label == "FULL COMBO":
-                    value = str(diff.fc_count)
-                elif label == "CLEAR":
-                    value = str(diff.clear_count)
-                else:
-                    value = str(diff.all_count)
+            values = [diff.ap_count, diff.fc_count, diff.clear_count, diff.all_count]
+            for idx, value in enumerate(values):
                 count_draw.text(
-                    (count_panel_width - COUNT_PADDING_X, y_pos),
-                    value,
-                    fill=COUNT_FONT_COLOR,
-                    font=COUNT_FONT_TEXT,
+                    (self.count_panel_width - self.COUNT_PADDING_X, self.count_y(idx)),
+                    str(value),
+                    fill=self.COUNT_FONT_COLOR,
+                    font=self.count_font_text,
                     anchor="ra",
                 )
-
             card_container.alpha_composite(count_img, (count_panel_x, donut_y))
 
             # Composite the white card (with donut and counts) into the main image.
-            new_im.alpha_composite(card_container, (CARD_GUTTER_WIDTH, y_card))
+            new_im.alpha_composite(card_container, (self.CARD_GUTTER_WIDTH, y_card))
 
             # --- Now paste the badge on top so it overlaps all else ---
-            diff_key = diff.difficulty.lower()
-            base_img = difficulty_images.get(diff_key)
-            if base_img:
-                if diff_key == "append":
-                    top_color = base_img.getpixel((1, 1))
-                    bottom_color = base_img.getpixel((CARD_WIDTH - 1, DONUT_SIZE - 1))
-                    badge_bg = Image.new("RGB", (max_badge_width, max_badge_height))
-                    _draw_gradient(badge_bg, top_color, bottom_color)
-                else:
-                    base_color = base_img.getpixel((1, 1))
-                    badge_bg = Image.new(
-                        "RGB", (max_badge_width, max_badge_height), base_color
-                    )
-            else:
-                badge_bg = Image.new("RGB", (max_badge_width, max_badge_height), "gray")
-            badge_bg = badge_bg.convert("RGB")
-            badge_mask = Image.new("L", (max_badge_width, max_badge_height), 0)
-            mask_draw = ImageDraw.Draw(badge_mask)
-            mask_draw.rounded_rectangle(
-                (0, 0, max_badge_width, max_badge_height),
-                radius=(max_badge_height // 2),
-                fill=255,
+            badge, badge_mask = self.badge(
+                diff.difficulty, max_badge_width, max_badge_height
             )
-            badge_x = CARD_GUTTER_WIDTH + (CARD_WIDTH - max_badge_width) // 2
+            badge_x = self.CARD_GUTTER_WIDTH + (self.CARD_WIDTH - max_badge_width) // 2
             badge_y = y_card - 20
-            new_im.paste(badge_bg, (badge_x, badge_y), badge_mask)
-            # Draw badge text centered in the badge.
-            badge_text = diff.difficulty.upper()
-            text_w = badge_font.getlength(badge_text)
-            text_bbox = badge_font.getbbox(badge_text)
-            text_h = text_bbox[3] - text_bbox[1]
-            text_x = badge_x + (max_badge_width - text_w) / 2
-            text_y = badge_y + (max_badge_height - text_h) / 2 - 5
-            im_draw.text((text_x, text_y), badge_text, fill="black", font=badge_font)
+            new_im.paste(badge, (badge_x, badge_y), badge_mask)
 
         obj = BytesIO()
         new_im.save(obj, "PNG")
         obj.seek(0)
         return obj
 
-    return main(data)
 
-
-def generate_progress(data: List[DifficultyCategory], difficulty: str):
-    FONTPATH = "DATA/data/ASSETS/rodinntlg_eb.otf"
-    FONTPATH_LIGHT = "DATA/data/ASSETS/rodinntlg_m.otf"
+class ProgressRenderer:
+    """
+    The per level progress image of one difficulty. Fonts, headers, card and panel
+    backgrounds, icons and gradients are built once (per difficulty where they
+    depend on it); a render only draws the levels, donuts and counts.
+    """
 
     IMAGE_WIDTH = 2000
     HEADER_HEIGHT = 200
@@ -416,329 +445,233 @@ def generate_progress(data: List[DifficultyCategory], difficulty: str):
     CIRCLE_TEXT_OFFSET_X = 1.3
     CIRCLE_TEXT_OFFSET_Y = 1.74
     CIRCLE_FONTSIZE = 75
-    CIRCLE_FONT = ImageFont.truetype(FONTPATH, CIRCLE_FONTSIZE)
-
     CIRCLE_TEXT_COLOR = "black"
 
     DONUT_THICKNESS = 75
     DONUT_PADDING = 30
-
-    FC_COLOR = "#e83ce3"
-    CLEAR_COLOR = "#F9D442"
-    NOT_CLEAR_COLOR = "#38383a"
-
-    ALL_AP_ICON = "DATA/data/ASSETS/normal_ap.png"
-    ALL_AP_APPEND_ICON = "DATA/data/ASSETS/append_ap.png"
-    ALL_FC_ICON = "DATA/data/ASSETS/normal_fc.png"
-    ALL_FC_APPEND_ICON = "DATA/data/ASSETS/append_fc.png"
-    ALL_CLEAR_ICON = "DATA/data/ASSETS/normal_clear.png"
-    ALL_CLEAR_APPEND_ICON = "DATA/data/ASSETS/append_clear.png"
-    ICON_PADDING = 20
-
-    BACKGROUND_IMG = "DATA/data/ASSETS/hug.png"
+    DONUT_WIDTH = CARD_HEIGHT - (DONUT_PADDING * 2)
 
     COUNT_PADDING_Y = 47
     COUNT_PADDING_X = 30
     COUNT_SPACING = 85
     COUNT_BACKGROUND_COLOR = "#38383adf"
     COUNT_FONTSIZE = 50
-    COUNT_FONT_CATEGORIES = ImageFont.truetype(FONTPATH, COUNT_FONTSIZE)
-
     COUNT_FONT_COLOR = "white"
-    COUNT_FONT_TEXT = ImageFont.truetype(FONTPATH_LIGHT, COUNT_FONTSIZE)
-
-    difficulty_colors = {
-        "append": "DATA/data/ASSETS/append_color.jpg",
-        "hard": "DATA/data/ASSETS/hard_color.jpg",
-        "normal": "DATA/data/ASSETS/normal_color.jpg",
-        "easy": "DATA/data/ASSETS/easy_color.jpg",
-        "master": "DATA/data/ASSETS/master_color.jpg",
-        "expert": "DATA/data/ASSETS/expert_color.jpg",
-    }
-
-    # Preload difficulty images (resized) once
-    difficulty_images = {
-        key: Image.open(path)
-        .resize((CARD_WIDTH, CARD_HEIGHT), Image.LANCZOS)
-        .convert("RGBA")
-        for key, path in difficulty_colors.items()
-    }
-
-    # Preload icon samples once
-    _ICON_CACHE = {
-        "ap": Image.open(ALL_AP_ICON).convert("RGBA"),
-        "ap_append": Image.open(ALL_AP_APPEND_ICON).convert("RGBA"),
-        "fc": Image.open(ALL_FC_ICON).convert("RGBA"),
-        "fc_append": Image.open(ALL_FC_APPEND_ICON).convert("RGBA"),
-        "clear": Image.open(ALL_CLEAR_ICON).convert("RGBA"),
-        "clear_append": Image.open(ALL_CLEAR_APPEND_ICON).convert("RGBA"),
-    }
-
-    def main(data: List[DifficultyCategory]):
-        number_of_cards = len(data)
-        # two cards per row
-        number_of_rows = ceil(number_of_cards / 2)
-        total_height = (
-            HEADER_HEIGHT
-            + SUB_HEADER_HEIGHT
-            + (number_of_rows * CARD_HEIGHT)
-            + ((number_of_rows + 1) * CARD_GUTTER_HEIGHT)
+    COUNT_WIDTH = CARD_WIDTH - (CIRCLE_RADIUS * 2) - DONUT_WIDTH - DONUT_PADDING * 2
+
+    def __init__(self):
+        self.circle_font = ImageFont.truetype(FONTPATH, self.CIRCLE_FONTSIZE)
+        self.count_font_categories = ImageFont.truetype(FONTPATH, self.COUNT_FONTSIZE)
+        self.count_font_text = ImageFont.truetype(FONTPATH_LIGHT, self.COUNT_FONTSIZE)
+        self.title_font = ImageFont.truetype(FONTPATH, 96)
+        self.watermark_font = ImageFont.truetype(FONTPATH, 60)
+
+        self.difficulty_colors = _difficulty_colors((self.CARD_WIDTH, self.CARD_HEIGHT))
+        self.ap_gradient = _ap_gradient(self.DONUT_WIDTH)
+        self.icon_size = (
+            self.DONUT_WIDTH
+            - (self.DONUT_THICKNESS * 2)
+            - (self.DONUT_PADDING * 2)
+            - (ICON_PADDING * 2)
         )
-
-        new_im = Image.new("RGBA", (IMAGE_WIDTH, total_height))
-
-        # draw background image
-        background_img = Image.open(BACKGROUND_IMG)
-        original_width, original_height = background_img.size
-        if original_height > total_height:
-            background_img = background_img.crop((0, 0, original_width, total_height))
-        else:
-            background_img = background_img.resize((original_width, total_height))
-
-        background_img = background_img.resize((IMAGE_WIDTH, total_height))
-        new_im.paste(background_img, (0, 0))
-
-        im_draw = ImageDraw.Draw(new_im)
-
-        # Top bar
+        self.icons = {
+            key: Image.open(path)
+            .convert("RGBA")
+            .resize((self.icon_size, self.icon_size))
+            for key, path in ICONS.items()
+        }
+        self.backgrounds = {}
+        self.headers = {}
+        self.cards = {}
+
+        # Counts panel before the counts
+        self.count_positions = [
+            (self.COUNT_PADDING_X, self.COUNT_PADDING_Y + self.COUNT_SPACING * idx)
+            for idx in range(4)
+        ]
+        self.count_panel = Image.new(
+            "RGBA", (self.COUNT_WIDTH, self.CARD_HEIGHT), color=(255, 255, 255, 0)
+        )
+        count_draw = ImageDraw.Draw(self.count_panel)
+        # only round the right side
+        count_draw.rounded_rectangle(
+            (0, 0, self.COUNT_WIDTH, self.CARD_HEIGHT),
+            radius=25,
+            fill=self.COUNT_BACKGROUND_COLOR,
+        )
+        count_draw.rectangle(
+            (0, 0, self.COUNT_WIDTH / 2, self.CARD_HEIGHT),
+            fill=self.COUNT_BACKGROUND_COLOR,
+        )
+        for pos, label in zip(self.count_positions, ["AP", "FC", "CLEAR", "ALL"]):
+            count_draw.text(
+                pos,
+                label,
+                fill=self.COUNT_FONT_COLOR,
+                font=self.count_font_categories,
+            )
+
+    def background(self, height: int) -> Image.Image:
+        if height not in self.backgrounds:
+            self.backgrounds[height] = _background(self.IMAGE_WIDTH, height)
+        return self.backgrounds[height]
+
+    def header(self, difficulty: str) -> Image.Image:
+        """Top bar, with the difficulty name in its gradient on the right."""
+        if difficulty in self.headers:
+            return self.headers[difficulty]
+        header = Image.new("RGBA", (self.IMAGE_WIDTH, self.HEADER_HEIGHT + 1))
+        im_draw = ImageDraw.Draw(header)
         im_draw.rectangle(
-            [(0, 0), (new_im.width, HEADER_HEIGHT)], fill="#b4ccfa", outline="#00194a"
+            [(0, 0), (self.IMAGE_WIDTH, self.HEADER_HEIGHT)],
+            fill="#b4ccfa",
+            outline="#00194a",
         )
 
         # Top-left text
-        font = ImageFont.truetype(FONTPATH, 96)
+        font = self.title_font
         im_draw.text((20, 28), "Your PJSK Progress", fill="black", font=font)
-        watermark = ImageFont.truetype(FONTPATH, 60)
-        im_draw.text((20, 130), "Generated by Sbotga", fill="black", font=watermark)
+        im_draw.text(
+            (20, 130), "Generated by Sbotga", fill="black", font=self.watermark_font
+        )
 
         right_text = difficulty.upper()
         right_text_width = font.getlength(right_text)
-
-        image_width, image_height = im_draw.im.size
-        x_position = int(image_width - right_text_width - 20)
+        x_position = int(self.IMAGE_WIDTH - right_text_width - 20)
 
         # gradient for title text using the selected difficulty image
-        difficulty_img = difficulty_images[difficulty]
-        top_left_color = difficulty_img.getpixel((1, 1))
-        bottom_right_color = difficulty_img.getpixel((CARD_WIDTH - 1, CARD_HEIGHT - 1))
+        top_left_color, bottom_right_color = self.difficulty_colors[difficulty]
         w, h = font.getbbox(right_text)[2:]
         gradient = Image.new("RGB", (w, h))
-        _draw_gradient(gradient, top_left_color, bottom_right_color)
+        draw_gradient(gradient, top_left_color, bottom_right_color)
         im_text = Image.new("RGBA", (w, h))
         d = ImageDraw.Draw(im_text)
         d.text((0, 0), right_text, font=font)
-        new_im.paste(gradient, (x_position, 53), im_text)
+        header.paste(gradient, (x_position, 53), im_text)
 
-        for i, diff in enumerate(data):
-            data_img = Image.new(
-                "RGBA", (CARD_WIDTH, CARD_HEIGHT), color=(255, 255, 255, 0)
-            )
-            draw = ImageDraw.Draw(data_img)
+        self.headers[difficulty] = header
+        return header
 
-            # card rectangle
-            draw.rounded_rectangle(
-                (CIRCLE_RADIUS, 0, CARD_WIDTH, CARD_HEIGHT), radius=25, fill="white"
-            )
+    def card(self, difficulty: str) -> Image.Image:
+        """Card without its level, donut and counts."""
+        if difficulty in self.cards:
+            return self.cards[difficulty]
+        data_img = Image.new(
+            "RGBA", (self.CARD_WIDTH, self.CARD_HEIGHT), color=(255, 255, 255, 0)
+        )
+        draw = ImageDraw.Draw(data_img)
 
-            # circle with text in the middle - create gradient ellipse
-            gradient_circle = Image.new("RGB", (CIRCLE_RADIUS * 2, CIRCLE_RADIUS * 2))
-            _draw_gradient(gradient_circle, top_left_color, bottom_right_color)
-            im_mask = Image.new("L", (CIRCLE_RADIUS * 2, CIRCLE_RADIUS * 2), 0)
-            d_mask = ImageDraw.Draw(im_mask)
-            d_mask.ellipse((0, 0, CIRCLE_RADIUS * 2, CIRCLE_RADIUS * 2), fill=255)
-
-            ellipse_gradient = Image.composite(
-                gradient_circle,
-                Image.new("RGB", (CIRCLE_RADIUS * 2, CIRCLE_RADIUS * 2), (0, 0, 0)),
-                im_mask,
-            )
+        # card rectangle
+        draw.rounded_rectangle(
+            (self.CIRCLE_RADIUS, 0, self.CARD_WIDTH, self.CARD_HEIGHT),
+            radius=25,
+            fill="white",
+        )
 
-            data_img.paste(
-                ellipse_gradient,
-                (CIRCLE_X - CIRCLE_RADIUS, CIRCLE_Y - CIRCLE_RADIUS),
-                im_mask,
-            )
+        # circle for the level - create gradient ellipse
+        top_left_color, bottom_right_color = self.difficulty_colors[difficulty]
+        gradient_circle = Image.new("RGB", (self.CIRCLE_DIAMETER, self.CIRCLE_DIAMETER))
+        draw_gradient(gradient_circle, top_left_color, bottom_right_color)
+        im_mask = Image.new("L", (self.CIRCLE_DIAMETER, self.CIRCLE_DIAMETER), 0)
+        d_mask = ImageDraw.Draw(im_mask)
+        d_mask.ellipse((0, 0, self.CIRCLE_DIAMETER, self.CIRCLE_DIAMETER), fill=255)
+
+        ellipse_gradient = Image.composite(
+            gradient_circle,
+            Image.new("RGB", (self.CIRCLE_DIAMETER, self.CIRCLE_DIAMETER), (0, 0, 0)),
+            im_mask,
+        )
+
+        data_img.paste(
+            ellipse_gradient,
+            (self.CIRCLE_X - self.CIRCLE_RADIUS, self.CIRCLE_Y - self.CIRCLE_RADIUS),
+            im_mask,
+        )
+        self.cards[difficulty] = data_img
+        return data_img
+
+    def render(self, data: List[DifficultyCategory], difficulty: str) -> BytesIO:
+        number_of_cards = len(data)
+        # two cards per row
+        number_of_rows = ceil(number_of_cards / 2)
+        total_height = (
+            self.HEADER_HEIGHT
+            + self.SUB_HEADER_HEIGHT
+            + (number_of_rows * self.CARD_HEIGHT)
+            + ((number_of_rows + 1) * self.CARD_GUTTER_HEIGHT)
+        )
+
+        new_im = Image.new("RGBA", (self.IMAGE_WIDTH, total_height))
+        new_im.paste(self.background(total_height), (0, 0))
+        new_im.paste(self.header(difficulty), (0, 0))
+
+        hole = (
+            self.DONUT_THICKNESS,
+            self.DONUT_THICKNESS,
+            self.CARD_HEIGHT - self.DONUT_THICKNESS - (self.DONUT_PADDING * 2),
+            self.CARD_HEIGHT - self.DONUT_THICKNESS - (self.DONUT_PADDING * 2),
+        )
+
+        for i, diff in enumerate(data):
+            data_img = self.card(difficulty).copy()
+            draw = ImageDraw.Draw(data_img)
 
             # Draw circle text. keep exact offsets from original logic.
             draw.text(
                 (
-                    CIRCLE_X
-                    - (CIRCLE_RADIUS / CIRCLE_TEXT_OFFSET_X)
+                    self.CIRCLE_X
+                    - (self.CIRCLE_RADIUS / self.CIRCLE_TEXT_OFFSET_X)
                     + (2 if len(str(diff.difficulty)) == 2 else 28),
-                    CIRCLE_Y - (CIRCLE_RADIUS / CIRCLE_TEXT_OFFSET_Y) + 4,
+                    self.CIRCLE_Y
+                    - (self.CIRCLE_RADIUS / self.CIRCLE_TEXT_OFFSET_Y)
+                    + 4,
                 ),
                 str(diff.difficulty),
-                fill=CIRCLE_TEXT_COLOR,
-                font=CIRCLE_FONT,
-            )
-
-            # donut chart
-            donut_width = CARD_HEIGHT - (DONUT_PADDING * 2)
-            donut_img = Image.new(
-                "RGBA", (donut_width, donut_width), color=(255, 255, 255, 0)
+                fill=self.CIRCLE_TEXT_COLOR,
+                font=self.circle_font,
             )
 
-            # draw pie chart
-            aped = diff.ap_count
-            fced = diff.fc_count - diff.ap_count
-            cleared = diff.clear_count - diff.fc_count
-            not_cleared = diff.all_count - diff.clear_count
-
-            total = diff.all_count or 1
-            percentage_ap = aped / total
-            percentage_fc = fced / total
-            percentage_clear = cleared / total
-            percentage_not_clear = not_cleared / total
-
-            angle_ap = percentage_ap * 360
-            angle_fc = angle_ap + (percentage_fc * 360)
-            angle_clear = angle_fc + (percentage_clear * 360)
-            angle_not_clear = angle_clear + (percentage_not_clear * 360)
-
-            donut_draw = ImageDraw.Draw(donut_img)
-            pie_location = (0, 0, donut_width, donut_width)
-            donut_draw.pieslice(pie_location, 0, 360, fill="white")
-
-            ap_color_sample = _ICON_CACHE["ap"]
-            w_s, h_s = ap_color_sample.size
-            top_y = min(60, h_s - 1)
-            bottom_y = max(h_s - 60, 0)
-            color_top = ap_color_sample.getpixel((w_s // 2, top_y))
-            color_bottom = ap_color_sample.getpixel((w_s // 2, bottom_y))
-
-            gradient_slice = Image.new("RGB", (donut_width, donut_width))
-            _draw_gradient(gradient_slice, color_top, color_bottom)
-
-            # Create the mask for the pie slice
-            im_mask = Image.new("L", (donut_width, donut_width), 0)
-            d_mask = ImageDraw.Draw(im_mask)
-            d_mask.pieslice(
-                (0, 0, donut_width, donut_width), 0, angle_ap, fill=255
-            )  # Fill the slice with white
-            # Paste the gradient onto the donut image using the mask
-            donut_img.paste(gradient_slice, pie_location[:2], im_mask)
-
-            donut_draw.pieslice(pie_location, angle_ap, angle_fc, fill=FC_COLOR)
-            donut_draw.pieslice(pie_location, angle_fc, angle_clear, fill=CLEAR_COLOR)
-            donut_draw.pieslice(
-                pie_location, angle_clear, angle_not_clear, fill=NOT_CLEAR_COLOR
+            # donut chart, append icons follow the difficulty of the whole image
+            donut_img = _draw_donut(
+                self.DONUT_WIDTH,
+                self.ap_gradient,
+                diff,
+                hole,
+                self.icons,
+                self.icon_size,
+                difficulty == "append",
             )
-
-            # erase the middle to make it a donut
-            donut_draw.ellipse(
-                (
-                    DONUT_THICKNESS,
-                    DONUT_THICKNESS,
-                    CARD_HEIGHT - DONUT_THICKNESS - (DONUT_PADDING * 2),
-                    CARD_HEIGHT - DONUT_THICKNESS - (DONUT_PADDING * 2),
-                ),
-                fill="white",
-            )
-
-            # if it's all APed or all FCed, draw icon in the middle
-            icon_size = (
-                donut_width
-                - (DONUT_THICKNESS * 2)
-                - (DONUT_PADDING * 2)
-                - (ICON_PADDING * 2)
-            )
-            icon_x = (donut_width - icon_size) // 2
-            icon_y = (donut_width - icon_size) // 2
-            if diff.ap_count == diff.all_count:
-                key = "ap_append" if difficulty != "append" and False else "ap"
-                # Note: original logic uses difficulty param to choose append icons;
-                # preserve that original logic here exactly:
-                key = "ap_append" if difficulty == "append" else "ap"
-                all_ap_img = _ICON_CACHE[key].resize((icon_size, icon_size))
-                donut_img.paste(all_ap_img, (icon_x, icon_y), all_ap_img)
-            elif diff.fc_count == diff.all_count:
-                key = "fc_append" if difficulty == "append" else "fc"
-                all_fc_img = _ICON_CACHE[key].resize((icon_size, icon_size))
-                donut_img.paste(all_fc_img, (icon_x, icon_y), all_fc_img)
-            elif diff.clear_count == diff.all_count:
-                key = "clear_append" if difficulty == "append" else "clear"
-                all_clear_img = _ICON_CACHE[key].resize((icon_size, icon_size))
-                donut_img.paste(all_clear_img, (icon_x, icon_y), all_clear_img)
-
             data_img.paste(
                 donut_img,
-                ((CIRCLE_RADIUS * 2) + DONUT_PADDING, DONUT_PADDING),
+                ((self.CIRCLE_RADIUS * 2) + self.DONUT_PADDING, self.DONUT_PADDING),
                 donut_img,
             )
 
             # counts in the right
-            count_width = (
-                CARD_WIDTH - (CIRCLE_RADIUS * 2) - donut_width - DONUT_PADDING * 2
-            )
-            count_img = Image.new(
-                "RGBA", (count_width, CARD_HEIGHT), color=(255, 255, 255, 0)
-            )
+            count_img = self.count_panel.copy()
             count_draw = ImageDraw.Draw(count_img)
-            # only round the right side
-            count_draw.rounded_rectangle(
-                (0, 0, count_width, CARD_HEIGHT), radius=25, fill=COUNT_BACKGROUND_COLOR
-            )
-            count_draw.rectangle(
-                (0, 0, count_width / 2, CARD_HEIGHT), fill=COUNT_BACKGROUND_COLOR
-            )
-
-            ap_pos = (COUNT_PADDING_X, COUNT_PADDING_Y)
-            fc_pos = (COUNT_PADDING_X, COUNT_PADDING_Y + COUNT_SPACING)
-            clear_pos = (COUNT_PADDING_X, COUNT_PADDING_Y + COUNT_SPACING * 2)
-            all_pos = (COUNT_PADDING_X, COUNT_PADDING_Y + COUNT_SPACING * 3)
-
-            count_draw.text(
-                ap_pos, "AP", fill=COUNT_FONT_COLOR, font=COUNT_FONT_CATEGORIES
-            )
-            count_draw.text(
-                fc_pos, "FC", fill=COUNT_FONT_COLOR, font=COUNT_FONT_CATEGORIES
-            )
-            count_draw.text(
-                clear_pos, "CLEAR", fill=COUNT_FONT_COLOR, font=COUNT_FONT_CATEGORIES
-            )
-            count_draw.text(
-                all_pos, "ALL", fill=COUNT_FONT_COLOR, font=COUNT_FONT_CATEGORIES
-            )
-
-            count_draw.text(
-                (count_width - COUNT_PADDING_X, ap_pos[1]),
-                str(diff.ap_count),
-                fill=COUNT_FONT_COLOR,
-                font=COUNT_FONT_TEXT,
-                anchor="ra",
-            )
-            count_draw.text(
-                (count_width - COUNT_PADDING_X, fc_pos[1]),
-                str(diff.fc_count),
-                fill=COUNT_FONT_COLOR,
-                font=COUNT_FONT_TEXT,
-                anchor="ra",
-            )
-            count_draw.text(
-                (count_width - COUNT_PADDING_X, clear_pos[1]),
-                str(diff.clear_count),
-                fill=COUNT_FONT_COLOR,
-                font=COUNT_FONT_TEXT,
-                anchor="ra",
-            )
-            count_draw.text(
-                (count_width - COUNT_PADDING_X, all_pos[1]),
-                str(diff.all_count),
-                fill=COUNT_FONT_COLOR,
-                font=COUNT_FONT_TEXT,
-                anchor="ra",
-            )
+            values = [diff.ap_count, diff.fc_count, diff.clear_count, diff.all_count]
+            for pos, value in zip(self.count_positions, values):
+                count_draw.text(
+                    (self.COUNT_WIDTH - self.COUNT_PADDING_X, pos[1]),
+                    str(value),
+                    fill=self.COUNT_FONT_COLOR,
+                    font=self.count_font_text,
+                    anchor="ra",
+                )
 
-            data_img.alpha_composite(count_img, (CARD_WIDTH - count_width, 0))
+            data_img.alpha_composite(count_img, (self.CARD_WIDTH - self.COUNT_WIDTH, 0))
 
             x_location = (
-                CARD_GUTTER_WIDTH if i % 2 == 0 else CARD_WIDTH + CARD_GUTTER_WIDTH * 2
+                self.CARD_GUTTER_WIDTH
+                if i % 2 == 0
+                else self.CARD_WIDTH + self.CARD_GUTTER_WIDTH * 2
             )
             y_location = (
-                HEADER_HEIGHT
-                + SUB_HEADER_HEIGHT
-                + CARD_GUTTER_HEIGHT
-                + (i // 2) * (CARD_HEIGHT + CARD_GUTTER_HEIGHT)
+                self.HEADER_HEIGHT
+                + self.SUB_HEADER_HEIGHT
+                + self.CARD_GUTTER_HEIGHT
+                + (i // 2) * (self.CARD_HEIGHT + self.CARD_GUTTER_HEIGHT)
             )
             new_im.alpha_composite(data_img, (x_location, y_location))
 
@@ -747,4 +680,20 @@ def generate_progress(data: List[DifficultyCategory], difficulty: str):
         obj.seek(0)
         return obj
 
-    return main(data)
+
+@cache
+def general_progress_renderer() -> GeneralProgressRenderer:
+    return GeneralProgressRenderer()
+
+
+@cache
+def progress_renderer() -> ProgressRenderer:
+    return ProgressRenderer()
+
+
+def generate_general_progress(data: List[StrDifficultyCategory]):
+    return general_progress_renderer().render(data)
+
+
+def generate_progress(data: List[DifficultyCategory], difficulty: str):
+    return progress_renderer().render(data, difficulty)
@@ -0,0 +1,714 @@
+"""
+Image renders that run on the render process pool (`DATA.helpers.unblock.to_render_process`).
+
+Everything here is a module level function taking plain, picklable data; anything that
+needs the bot, the game API or master data is looked up before the job is submitted.
+"""
+
+import math, os
+from datetime import datetime, timezone
+from functools import lru_cache
+from io import BytesIO
+
+from PIL import Image, ImageDraw, ImageFont
+
+from DATA.helpers import image_cache, jacket_atlas
+from DATA.helpers.draw_primitives import vertical_gradient
+from DATA.helpers.unblock import render_pool
+
+from COGS.progress_generate import (
+    generate_progress,
+    DifficultyCategory,
+    generate_general_progress,
+    StrDifficultyCategory,
+    general_progress_renderer,
+    progress_renderer,
+)
+
+FONT_BOLD = "DATA/data/ASSETS/rodinntlg_eb.otf"
+FONT_MEDIUM = "DATA/data/ASSETS/rodinntlg_m.otf"
+
+gacha_thumbnails_path = "DATA/data/gacha_thumbnails"
+
+
+@lru_cache(maxsize=128)
+def load_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(path, size)
+
+
+def warm() -> None:
+    """Preload the fonts and static assets used by every render, once per worker."""
+    for path, sizes in ((FONT_BOLD, (20, 22, 30, 35, 48, 60)), (FONT_MEDIUM, (40, 60))):
+        for size in sizes:
+            load_font(path, size)
+    for path in (
+        "DATA/data/ASSETS/gacha.png",
+        "DATA/data/ASSETS/gachacardmask.png",
+    ):
+        if os.path.exists(path):
+            image_cache.open_image(path, copy=False)
+    general_progress_renderer()
+    progress_renderer()
+
+
+render_pool.add_warmup(warm)
+
+
+def _with_headers(
+    img: Image.Image, headers: list[tuple], date_y: int = 15, separators: bool = True
+) -> BytesIO:
+    """
+    Stack a dark gray header bar per (name, id line, unix timestamp) above img.
+    """
+    SCALE = 2
+    header_height = len(headers) * 100 * SCALE
+    new_img = Image.new(
+        "RGBA", (img.width, img.height + header_height), (50, 50, 50, 255)
+    )  # Dark gray bar
+    new_img.paste(img, (0, header_height))
+
+    draw = ImageDraw.Draw(new_img)
+    font = load_font(FONT_BOLD, 30 * SCALE)
+    font_2 = load_font(FONT_MEDIUM, 30 * SCALE)
+    font_3 = load_font(FONT_MEDIUM, 20 * SCALE)
+
+    region_height_offset = 0
+    for name, id_line, timestamp in headers:
+        data_date = datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime(
+            "%Y-%m-%d"
+        )
+        data_time = datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%H:%M")
+        draw.text(
+            (10, region_height_offset + 15 * SCALE),
+            str(name),
+            font=font,
+            fill="white",
+        )
+        draw.text(
+            (10, region_height_offset + 60 * SCALE),
+            id_line,
+            font=font_3,
+            fill="white",
+        )
+        draw.text(
+            (img.width - 215 * SCALE, region_height_offset + date_y * SCALE),
+            f"{data_date}",
+            font=font_2,
+            fill="white",
+        )
+        draw.text(
+            (img.width - 200 * SCALE, region_height_offset + 50 * SCALE),
+            f"{data_time} UTC",
+            font=font_2,
+            fill="white",
+        )
+
+        if separators:
+            # Add a white line separator after each region's section
+            line_y = region_height_offset + 100 * SCALE
+            draw.line((0, line_y, img.width, line_y), fill="white", width=2)
+        region_height_offset += 100 * SCALE
+
+    output = BytesIO()
+    new_img.save(output, format="PNG")
+    output.seek(0)
+    return output
+
+
+def summary_image(categories: list[StrDifficultyCategory], header: tuple) -> BytesIO:
+    img = Image.open(generate_general_progress(categories))
+    return _with_headers(img, [header], date_y=10, separators=False)
+
+
+def progress_image(
+    categories: list[DifficultyCategory], difficulty: str, headers: list[tuple]
+) -> BytesIO:
+    img = Image.open(generate_progress(categories, difficulty))
+    return _with_headers(img, headers)
+
+
+def b30_image(
+    songs: list, fc_only: bool, ap_only: bool, song_count: int, headers: list[tuple]
+) -> BytesIO:
+    img = Image.open(
+        draw_b30(songs, fc_only=fc_only, ap_only=ap_only, song_count=song_count)
+    )
+    return _with_headers(img, headers)
+
+
+def gacha_card_thumbnail(card: dict, trained: bool, game_files_path: str) -> Image:
+    """card: cardRarityType, assetbundleName and attr of a cards.json entry"""
+    if trained:
+        suffix = "after_training"
+    else:
+        suffix = "normal"
+    if card["cardRarityType"] != "rarity_3" and card["cardRarityType"] != "rarity_4":
+        suffix = "normal"
+    pic = Image.new("RGBA", (338, 338), (0, 0, 0, 0))
+    card_pic_path = os.path.join(
+        game_files_path,
+        "jp",
+        "character",
+        "member_cutout",
+        card["assetbundleName"] + "_ex",
+        f"{suffix}.png",
+    )
+    picmask = image_cache.open_image(f"DATA/data/ASSETS/gachacardmask.png", copy=False)
+    r, g, b, mask = picmask.split()
+    cardpic = image_cache.open_image(
+        card_pic_path,
+        size=mask.size,
+        resample=Image.Resampling.LANCZOS,
+        copy=False,
+    )
+    pic.paste(cardpic, (0, 0), mask)
+    cardFrame = image_cache.open_image(
+        f'DATA/data/ASSETS/chara/cardFrame_{card["cardRarityType"]}.png',
+        size=(338, 338),
+        copy=False,
+    )
+    r, g, b, mask = cardFrame.split()
+
+    pic.paste(cardFrame, (0, 0), mask)
+    if card["cardRarityType"] == "rarity_1":
+        star = image_cache.open_image(
+            f"DATA/data/ASSETS/chara/rarity_star_normal.png",
+            size=(61, 61),
+            copy=False,
+        )
+        r, g, b, mask = star.split()
+        pic.paste(star, (21, 256), mask)
+    if card["cardRarityType"] == "rarity_2":
+        star = image_cache.open_image(
+            f"DATA/data/ASSETS/chara/rarity_star_normal.png",
+            size=(60, 60),
+            copy=False,
+        )
+        r, g, b, mask = star.split()
+        pic.paste(star, (21, 256), mask)
+        pic.paste(star, (78, 256), mask)
+    if card["cardRarityType"] == "rarity_3":
+        if trained:
+            star_path = f"DATA/data/ASSETS/chara/rarity_star_afterTraining.png"
+        else:
+            star_path = f"DATA/data/ASSETS/chara/rarity_star_normal.png"
+        star = image_cache.open_image(star_path, size=(60, 60), copy=False)
+        r, g, b, mask = star.split()
+        pic.paste(star, (21, 256), mask)
+        pic.paste(star, (78, 256), mask)
+        pic.paste(star, (134, 256), mask)
+    if card["cardRarityType"] == "rarity_4":
+        if trained:
+            star_path = f"DATA/data/ASSETS/chara/rarity_star_afterTraining.png"
+        else:
+            star_path = f"DATA/data/ASSETS/chara/rarity_star_normal.png"
+        star = image_cache.open_image(star_path, size=(60, 60), copy=False)
+        r, g, b, mask = star.split()
+        pic.paste(star, (21, 256), mask)
+        pic.paste(star, (78, 256), mask)
+        pic.paste(star, (134, 256), mask)
+        pic.paste(star, (190, 256), mask)
+    if card["cardRarityType"] == "rarity_birthday":
+        star = image_cache.open_image(
+            f"DATA/data/ASSETS/chara/rarity_birthday.png",
+            size=(60, 60),
+            copy=False,
+        )
+        r, g, b, mask = star.split()
+        pic.paste(star, (21, 256), mask)
+    attr = image_cache.open_image(
+        f'DATA/data/ASSETS/chara/icon_attribute_{card["attr"]}.png',
+        size=(76, 76),
+        copy=False,
+    )
+    r, g, b, mask = attr.split()
+    pic.paste(attr, (1, 1), mask)
+    return pic
+
+
+def gacha_card_thumbnail_path(card: dict, trained: bool, game_files_path: str) -> str:
+    """
+    Path to the 338px thumbnail of a card, composed once and kept on disk until the
+    card's cutout changes.
+    """
+    suffix = "after_training" if trained else "normal"
+    if card["cardRarityType"] not in ("rarity_3", "rarity_4"):
+        suffix = "normal"
+    cutout = os.path.join(
+        game_files_path,
+        "jp",
+        "character",
+        "member_cutout",
+        card["assetbundleName"] + "_ex",
+        f"{suffix}.png",
+    )
+    prefix = (
+        f"{card['assetbundleName']}_{card['cardRarityType']}_{card['attr']}_"
+        f"{'trained' if trained else 'normal'}_"
+    )
+    path = os.path.join(
+        gacha_thumbnails_path, f"{prefix}{os.stat(cutout).st_mtime_ns}.png"
+    )
+    if os.path.exists(path):
+        return path
+
+    os.makedirs(gacha_thumbnails_path, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    gacha_card_thumbnail(card, trained, game_files_path).save(tmp, "PNG")
+    os.replace(tmp, path)
+
+    # thumbnails of older versions of this cutout
+    for name in os.listdir(gacha_thumbnails_path):
+        if name.startswith(prefix) and name.endswith(".png"):
+            if os.path.join(gacha_thumbnails_path, name) != path:
+                try:
+                    os.remove(os.path.join(gacha_thumbnails_path, name))
+                except OSError:
+                    pass
+    return path
+
+
+def gacha_image(cards: list[dict], game_files_path: str) -> BytesIO:
+    """Ten pull result, cards in pull order."""
+    pic = image_cache.open_image(f"DATA/data/ASSETS/gacha.png")
+    cover = Image.new("RGB", (1550, 600), (255, 255, 255))
+    pic.paste(cover, (314, 500))
+    for i, card in enumerate(cards[:10]):
+        # resized straight from the composed thumbnail, cached with the other images
+        cardpic = image_cache.open_image(
+            gacha_card_thumbnail_path(card, False, game_files_path),
+            size=(263, 263),
+            copy=False,
+        )
+        pic.paste(
+            cardpic,
+            (336 + 304 * (i % 5), 520 if i < 5 else 825),
+            cardpic.getchannel("A"),
+        )
+    pic = pic.convert("RGB")
+    obj = BytesIO()
+    pic.save(obj, "JPEG")
+    obj.seek(0)
+    return obj
+
+
+def b30_grid(song_count: int) -> tuple[int, int]:
+    """(rows, columns) of a B30 image with song_count songs."""
+    column_options = [3, 4, 5, 2]
+    best_fit = None
+    min_gaps = float("inf")
+
+    for columns in column_options:
+        rows = math.ceil(song_count / columns)
+        gaps = (rows * columns) - song_count
+
+        if gaps == 0:  # Perfect fit
+            return rows, columns
+
+        if gaps < min_gaps:
+            min_gaps = gaps
+            best_fit = (rows, columns)
+
+    return best_fit
+
+
+def b30_jacket_size(song_count: int) -> tuple[int, int]:
+    """Size draw_b30 pastes jackets at, for the jacket atlas."""
+    rows = b30_grid(song_count)[0]
+    card_height = int((int(2500 * (rows / 10)) - 70 * (rows + 1)) / rows)
+    return (card_height - 20, card_height - 20)
+
+
+def draw_b30(songs: list, fc_only: bool, ap_only: bool, song_count: int) -> BytesIO:
+    """
+    [
+        {
+            "path": "/image.png",
+            "difficulty": "append",
+            "name": "test",
+            "constant": 32.3,
+            "ap_or_fc": "ap"
+        }
+    ]
+    """
+
+    # text_wrap preserved but micro-optimized: local alias for multiline_textbbox
+    def text_wrap(text, font, drawing: ImageDraw.ImageDraw, max_width, max_height):
+        def textsize_from_bbox(bbox):
+            return (bbox[2] - bbox[0], bbox[3] - bbox[1])
+
+        lines = [[]]
+        words = text.split(" ")
+        mttb = drawing.multiline_textbbox
+
+        for i, word in enumerate(words):
+            test_line = lines[-1] + ([word] if i == len(words) - 1 else [word, " "])
+            test_text = "\n".join(
+                ["".join(line) for line in lines[:-1]] + ["".join(test_line)]
+            )
+            w, h = textsize_from_bbox(mttb((0, 0), test_text, font=font))
+
+            if w <= max_width:
+                lines[-1].append(word)
+                if i != len(words) - 1:
+                    lines[-1].append(" ")
+            else:
+                if lines[-1]:
+                    lines.append([])
+                lines[-1].append(word)
+                if i != len(words) - 1:
+                    lines[-1].append(" ")
+
+                w, h = textsize_from_bbox(
+                    mttb(
+                        (0, 0),
+                        "\n".join(["".join(line) for line in lines]),
+                        font=font,
+                    )
+                )
+                if w > max_width:
+                    # Word still doesn't fit; split by character
+                    lines.pop()
+                    current_line = []
+                    for char in word:
+                        current_line.append(char)
+                        w, h = textsize_from_bbox(
+                            mttb(
+                                (0, 0),
+                                "\n".join(["".join(current_line)]),
+                                font=font,
+                            )
+                        )
+                        if w > max_width:
+                            lines.append(current_line[:-1])
+                            current_line = [current_line[-1]]
+                            w, h = textsize_from_bbox(
+                                mttb(
+                                    (0, 0),
+                                    "\n".join(["".join(line) for line in lines]),
+                                    font=font,
+                                )
+                            )
+                            if h > max_height:
+                                break
+                    if current_line:
+                        lines.append(current_line)
+
+        # Remove empty lines
+        lines = [line for line in lines if "".join(line).strip()]
+
+        trimmed = False
+        while True:
+            bbox = mttb(
+                (0, 0),
+                "\n".join(["".join(line).rstrip() for line in lines]),
+                font=font,
+            )
+            if textsize_from_bbox(bbox)[1] <= max_height:
+                break
+            trimmed = True
+            if len(lines) > 1:
+                lines.pop()
+            else:
+                lines[-1] = lines[-1][: max(0, len(lines[-1]) - 1)]
+                if lines[-1]:
+                    lines[-1][-1] = lines[-1][-1][:-3] + "..."
+                else:
+                    lines[-1] = ["..."]
+                break
+
+        if trimmed and lines:
+            last_line = "".join(lines[-1]).rstrip()
+            while (
+                textsize_from_bbox(mttb((0, 0), last_line + "...", font=font))[0]
+                > max_width
+            ):
+                if len(last_line) > 1:
+                    last_line = last_line[:-1]
+                else:
+                    last_line = "..."
+                    break
+            lines[-1] = list(last_line + "...")
+
+        return "\n".join(["".join(line).rstrip() for line in lines])
+
+    amount_rows, amount_columns = b30_grid(song_count)
+
+    base_width = 2000  # Width for 3 columns
+    WIDTH = int(base_width * (amount_columns / 3))
+
+    HEADER_HEIGHT = 100
+    base_height = 2500  # Height for 10 rows
+    HEIGHT = int(base_height * (amount_rows / 10)) + HEADER_HEIGHT
+
+    SCALE = 1
+    WIDTH *= SCALE
+    HEIGHT *= SCALE
+    HEADER_HEIGHT *= SCALE
+
+    FONT_PATH = "DATA/data/ASSETS/rodinntlg_eb.otf"
+    KITTY_PATH = "DATA/data/ASSETS/kitty.png"
+
+    # Create base image
+    image = Image.new("RGBA", (WIDTH, HEIGHT), "#FFFFFF")
+    draw = ImageDraw.Draw(image)
+
+    # background kitty
+    kitty_image = image_cache.open_image(
+        KITTY_PATH, size=(WIDTH, HEIGHT), resample=Image.LANCZOS, copy=False
+    )
+    image.paste(kitty_image, (0, 0))
+
+    # Top bar and text
+    header_font = load_font(FONT_PATH, int(48 * SCALE))
+    watermark_font = load_font(FONT_PATH, int(30 * SCALE))
+    filtered = " - FCs Only" if fc_only else " - APs Only" if ap_only else ""
+    draw.rectangle([(0, 0), (WIDTH, HEADER_HEIGHT)], fill="#b4ccfa", outline="#00194a")
+    draw.text(
+        (10, int(14 * SCALE)),
+        f"Your best {song_count} chart{'s' if song_count != 1 else ''}" + filtered,
+        fill="black",
+        font=header_font,
+    )
+    draw.text(
+        (10, int(65 * SCALE)),
+        "Generated by Sbotga",
+        fill="black",
+        font=watermark_font,
+    )
+
+    GUTTER_WIDTH = int(60 * SCALE)
+    GUTTER_HEIGHT = int(70 * SCALE)
+    CARD_WIDTH = int((WIDTH - (GUTTER_WIDTH * (amount_columns + 1))) / amount_columns)
+    CARD_HEIGHT = int(
+        (HEIGHT - HEADER_HEIGHT - (GUTTER_HEIGHT * (amount_rows + 1))) / amount_rows
+    )
+    JACKET_SIZE = (CARD_HEIGHT - int(20 * SCALE), CARD_HEIGHT - int(20 * SCALE))
+
+    difficulty_colors = {
+        "append": "DATA/data/ASSETS/append_color.jpg",
+        "hard": "DATA/data/ASSETS/hard_color.jpg",
+        "normal": "DATA/data/ASSETS/normal_color.jpg",
+        "easy": "DATA/data/ASSETS/easy_color.jpg",
+        "master": "DATA/data/ASSETS/master_color.jpg",
+        "expert": "DATA/data/ASSETS/expert_color.jpg",
+    }
+    indicator_images = {
+        "append_ap": "DATA/data/ASSETS/append_ap.png",
+        "append_fc": "DATA/data/ASSETS/append_fc.png",
+        "normal_ap": "DATA/data/ASSETS/normal_ap.png",
+        "normal_fc": "DATA/data/ASSETS/normal_fc.png",
+    }
+
+    # Jackets / paths
+    jackets = [song["path"] for song in songs]
+
+    # Preload indicators once (resized)
+    indicators = {
+        key: image_cache.open_image(path, "RGBA", (72, 72), Image.LANCZOS, copy=False)
+        for key, path in indicator_images.items()
+    }
+
+    # Preload difficulty images sized to CARD_WIDTH x CARD_HEIGHT
+    difficulty_images = {
+        key: image_cache.open_image(
+            path, "RGBA", (CARD_WIDTH, CARD_HEIGHT), Image.LANCZOS, copy=False
+        )
+        for key, path in difficulty_colors.items()
+    }
+
+    # Jackets from the atlas, resized here only if they aren't in it yet (or None)
+    jacket_images = [
+        (
+            jacket_atlas.thumbnail(path, JACKET_SIZE)
+            or image_cache.open_image(
+                path, size=JACKET_SIZE, resample=Image.LANCZOS, copy=False
+            )
+            if path
+            else None
+        )
+        for path in jackets
+    ]
+
+    # Precreate some fonts used inside loop with scale-aware sizes
+    difficulty_font_small = load_font(FONT_PATH, int(22 * SCALE))
+    difficulty_font_label = load_font(FONT_PATH, int(20 * SCALE))
+    song_title_font = load_font(FONT_PATH, int(35 * SCALE))
+    big_header_font = header_font  # alias for ranking draw
+
+    total_difficulty = 0.0
+
+    # iterate once (idx used for jacket_images indexing)
+    for idx, song in enumerate(songs):
+        gridX = idx % amount_columns
+        gridY = idx // amount_columns
+
+        xPos = gridX * CARD_WIDTH + (GUTTER_WIDTH * (gridX + 1))
+        yPos = HEADER_HEIGHT + (gridY * CARD_HEIGHT) + (GUTTER_HEIGHT * (gridY + 1))
+
+        difficulty_number = song["constant"]
+        badge_type = song["difficulty"]
+        ap_fc = song["ap_or_fc"].upper()
+
+        # Difficulty background (use preloaded image)
+        difficulty_img = difficulty_images[badge_type]
+        # Slightly larger copy for stroke/background to preserve original visual
+        difficulty_img_resized = difficulty_img.resize(
+            (CARD_WIDTH + 12 * SCALE, CARD_HEIGHT + 12 * SCALE), Image.LANCZOS
+        )
+        image.paste(
+            difficulty_img_resized, (xPos - int(6 * SCALE), yPos - int(6 * SCALE))
+        )
+
+        # sample safe pixel positions
+        w_s, h_s = difficulty_img.size
+        sample_x = min(5, max(0, w_s - 1))
+        sample_y = min(5, max(0, h_s - 1))
+        tl_color = difficulty_img.getpixel((sample_x, sample_y))
+        br_color = difficulty_img.getpixel(
+            (max(0, CARD_WIDTH - 5), max(0, CARD_HEIGHT - 5))
+        )
+
+        # Create gradient stroke around card (fast)
+        STROKE_SIZE = int(20 * SCALE)
+        grad_w = CARD_WIDTH + STROKE_SIZE
+        grad_h = CARD_HEIGHT + STROKE_SIZE
+        gradient = vertical_gradient((grad_w, grad_h), tl_color, br_color, "RGBA")
+
+        # rounded mask for stroke
+        mask = Image.new("L", (grad_w, grad_h), 0)
+        draw_mask = ImageDraw.Draw(mask)
+        draw_mask.rounded_rectangle(
+            [(0, 0), (grad_w, grad_h)], radius=int(12 * SCALE), fill=255
+        )
+
+        image.paste(gradient, (xPos - int(9 * SCALE), yPos - int(9 * SCALE)), mask)
+
+        # base card
+        draw.rounded_rectangle(
+            [(xPos, yPos), (xPos + CARD_WIDTH, yPos + CARD_HEIGHT)],
+            radius=int(8 * SCALE),
+            fill="white",
+        )
+
+        # jacket placement
+        jacket_x = xPos + int(20 * SCALE)
+        jacket_y = yPos + (CARD_HEIGHT - JACKET_SIZE[1]) // 2
+        if jacket_images[idx]:
+            image.paste(jacket_images[idx], (jacket_x, jacket_y))
+
+        # difficulty badge (top-left)
+        difficulty_badge_x = xPos - int(10 * SCALE)
+        difficulty_badge_y = yPos - int(30 * SCALE)
+        difficulty_badge_width = int(120 * SCALE)
+        difficulty_badge_height = int(50 * SCALE)
+        badge_grad = vertical_gradient(
+            (difficulty_badge_width, difficulty_badge_height),
+            tl_color,
+            br_color,
+            "RGBA",
+        )
+        badge_mask = Image.new(
+            "L", (difficulty_badge_width, difficulty_badge_height), 0
+        )
+        dm = ImageDraw.Draw(badge_mask)
+        dm.rounded_rectangle(
+            [(0, 0), (difficulty_badge_width, difficulty_badge_height)],
+            radius=int(12 * SCALE),
+            fill=255,
+        )
+        image.paste(badge_grad, (difficulty_badge_x, difficulty_badge_y), badge_mask)
+
+        # stroke around badge
+        draw.rounded_rectangle(
+            [
+                (difficulty_badge_x, difficulty_badge_y),
+                (
+                    difficulty_badge_x + difficulty_badge_width,
+                    difficulty_badge_y + difficulty_badge_height,
+                ),
+            ],
+            radius=int(12 * SCALE),
+            outline="#222222",
+            width=int(3 * SCALE),
+        )
+
+        # difficulty number text on badge
+        difficulty_text = f"{math.ceil(difficulty_number * 10) / 10:.1f}"
+        tb = draw.textbbox((0, 0), difficulty_text, font=difficulty_font_small)
+        text_width = tb[2] - tb[0]
+        text_height = tb[3] - tb[1]
+        text_x = difficulty_badge_x + (difficulty_badge_width - text_width) / 2
+        text_y = difficulty_badge_y + (difficulty_badge_height - text_height) / 2
+        draw.text(
+            (text_x, text_y),
+            difficulty_text,
+            fill="white",
+            font=difficulty_font_small,
+        )
+
+        # Title wrapping & drawing
+        song_title = song["name"]
+        max_length_px = CARD_WIDTH - JACKET_SIZE[0] - int(28 * SCALE)
+        wrapped_title = text_wrap(
+            song_title,
+            song_title_font,
+            draw,
+            max_length_px,
+            CARD_HEIGHT - int(50 * SCALE),
+        )
+
+        # difficulty label below title
+        difficulty_label = badge_type.upper()
+        tb_label = draw.textbbox((0, 0), difficulty_label, font=difficulty_font_label)
+        difficulty_height = tb_label[3] - tb_label[1]
+
+        tb_title = draw.textbbox((0, 0), wrapped_title, font=song_title_font)
+        title_height = tb_title[3] - tb_title[1]
+
+        total_text_height = title_height + difficulty_height + int(10 * SCALE)
+        title_y_position = yPos + (CARD_HEIGHT - total_text_height) // 2
+        title_x = xPos + JACKET_SIZE[0] + int(20 * SCALE)
+
+        draw.text(
+            (title_x + int(10 * SCALE), title_y_position),
+            wrapped_title,
+            fill="black",
+            font=song_title_font,
+        )
+        difficulty_y = title_y_position + title_height + int(10 * SCALE)
+        draw.text(
+            (title_x + int(10 * SCALE), difficulty_y),
+            difficulty_label,
+            fill="black",
+            font=difficulty_font_label,
+        )
+
+        # accumulate difficulty for ranking
+        total_difficulty += float(difficulty_number)
+
+        # indicator icon bottom-right
+        indicator_key = (
+            f"{'normal' if badge_type != 'append' else 'append'}_{ap_fc.lower()}"
+        )
+        indicator = indicators[indicator_key]
+        indicator_x = xPos + CARD_WIDTH - int(40 * SCALE)
+        indicator_y = yPos + CARD_HEIGHT - int(40 * SCALE)
+        image.paste(indicator, (indicator_x, indicator_y), indicator)
+
+    # final ranking text
+    overall_ranking = total_difficulty / (song_count or 1)
+    ranking_text = f"Ranking: {overall_ranking:.2f}"
+    ranking_bbox = draw.textbbox((0, 0), ranking_text, font=big_header_font)
+    ranking_width = ranking_bbox[2] - ranking_bbox[0]
+    draw.text(
+        (WIDTH - ranking_width - int(10 * SCALE), int(24 * SCALE)),
+        ranking_text,
+        fill="black",
+        font=big_header_font,
+    )
+
+    obj = BytesIO()
+    image.save(obj, "PNG")
+    obj.seek(0)
+    return obj
@@ -5,8 +5,6 @@ from main import TwitchBot
 
 import datetime
 
-from DATA.helpers.fuzzy_match import fuzzy_match_to_dict_key
-
 
 class EventsCog(commands.Cog):
     def __init__(self, bot: TwitchBot):
@@ -110,9 +108,10 @@ class EventsCog(commands.Cog):
             if type(title) == int:
                 data = self.bot.pjsk.events.get(title)
             else:
-                matched_key = fuzzy_match_to_dict_key(title, self.bot.pjsk.event_maps)
+                index = self.bot.pjsk.event_maps_index
+                matched_key = index.match(title)
                 if matched_key is not None:
-                    data = self.bot.pjsk.events[self.bot.pjsk.event_maps[matched_key]]
+                    data = self.bot.pjsk.events[index.dictionary[matched_key]]
                 else:
                     data = None
             if data:
@@ -1,5 +1,4 @@
-import cutlet
-import re, datetime, time, asyncio, threading, json, os, unicodedata, traceback
+import re, datetime, time, asyncio, threading, json, os, unicodedata, traceback, hashlib
 
 import requests
 
@@ -8,20 +7,70 @@ from DATA.user_data import user_data
 from DATA.game_api import methods
 
 from DATA.helpers.tools import generate_secure_string
+from DATA.helpers import romaji
+from DATA.helpers.romaji import CachedCutlet
+from DATA.helpers.fuzzy_match import FuzzyIndex
+from DATA.helpers.character_index import CharacterIndex
+from DATA.helpers.song_autocomplete import SongAutocomplete
+from DATA.helpers.card_index import CardIndex
+from DATA.helpers.gacha_index import GachaIndex
+from DATA.helpers.availability import Availability
 
 
 class pjsk_data:
     def __init__(self):
         self._defs = {}
 
-        self.katsu = cutlet.Cutlet()
-        self.katsu_foreignless = cutlet.Cutlet()
-        self.katsu_foreignless.use_foreign_spelling = False
+        self.katsu = CachedCutlet()
+        self.katsu_foreignless = CachedCutlet(use_foreign_spelling=False)
 
         self.refreshing = []
         self._refreshed_at = 0
+
+        # Incremental refresh state.
+        # _sections: section name -> (input digests, built value)
+        # _entry_cache: (kind, *key) -> (entry digest, derived value)
+        self._sections = {}
+        self._entry_cache = {}
+
         self.refresh_data()
 
+    @staticmethod
+    def _digest(data) -> str:
+        return hashlib.md5(
+            json.dumps(data, sort_keys=True, ensure_ascii=False, default=str).encode(
+                "utf-8"
+            )
+        ).hexdigest()
+
+    def _section(self, name: str, key: tuple, build, new_sections: dict):
+        """
+        Reuse the previously built section if its input files are unchanged,
+        otherwise rebuild it. Built sections are never mutated afterwards.
+        """
+        previous = self._sections.get(name)
+        if previous and previous[0] == key:
+            value = previous[1]
+        else:
+            print(f"Rebuilding {name}!")
+            value = build()
+        new_sections[name] = (key, value)
+        return value
+
+    def _entry(self, key: tuple, data, build, new_entries: dict):
+        """
+        Reuse the derived value of a single master data entry (card name,
+        romanized titles, ...) if the entry didn't change since last refresh.
+        """
+        digest = self._digest(data)
+        cached = self._entry_cache.get(key)
+        if cached and cached[0] == digest:
+            value = cached[1]
+        else:
+            value = build()
+        new_entries[key] = (digest, value)
+        return value
+
     def refresh_data(self):
         if self.refreshing:
             return
@@ -29,373 +78,560 @@ class pjsk_data:
         self.refreshing.append(thread_code)
         print("Refreshing data")
         try:
-            try:
-                self.music_meta = requests.get(
-                    "https://storage.sekai.best/sekai-best-assets/music_metas.json"
-                ).json()
-            except:
-                self.music_meta = []
-
-            # Functions and Tools
-            def simplify_title(title):
-                text = (
-                    unicodedata.normalize("NFKD", title)
-                    .encode("ascii", "ignore")
-                    .decode("utf-8")
-                )
-                text = text.lower().strip()
-                STAR_LIKE = (
-                    r"[\u2600-\u26FF]"  # Miscellaneous Symbols (includes stars like ★, ☆, ✩, ✪)
-                    r"|[\U0001F300-\U0001F5FF]"  # Miscellaneous Symbols and Pictographs (includes 🌟)
-                )
+            self._refresh_data()
+        finally:
+            if thread_code in self.refreshing:
+                self.refreshing.remove(thread_code)
 
-                text = re.sub(STAR_LIKE, " ", text)
-                return title
+    def _refresh_data(self):
+        """
+        Everything is built into local variables first, reusing unchanged
+        sections and entries from the previous refresh, then swapped in at once.
+        """
+        new_sections = {}
+        new_entries = {}
 
-            # Requests
-            events = methods.pjsk_game_api.get_master_data(
-                "events.json", force=True, deepcopy=True
-            )
-            events_jp = methods.pjsk_game_api_jp.get_master_data(
-                "events.json", force=True, deepcopy=True
-            )
-            self.characters = methods.pjsk_game_api.get_master_data(
-                "characterProfiles.json", force=True, deepcopy=True
-            )
-            self.characters_game = methods.pjsk_game_api.get_master_data(
-                "gameCharacters.json", force=True, deepcopy=True
+        try:
+            music_meta = requests.get(
+                "https://storage.sekai.best/sekai-best-assets/music_metas.json"
+            ).json()
+        except:
+            music_meta = []
+
+        # Functions and Tools
+        def simplify_title(title):
+            text = (
+                unicodedata.normalize("NFKD", title)
+                .encode("ascii", "ignore")
+                .decode("utf-8")
             )
-            self.cc_teams = methods.pjsk_game_api.get_master_data(
-                "cheerfulCarnivalTeams.json", force=True, deepcopy=True
+            text = text.lower().strip()
+            STAR_LIKE = (
+                r"[\u2600-\u26FF]"  # Miscellaneous Symbols (includes stars like ★, ☆, ✩, ✪)
+                r"|[\U0001F300-\U0001F5FF]"  # Miscellaneous Symbols and Pictographs (includes 🌟)
             )
 
-            # Maps
-            self.unit_map = {
-                "all": None,
-                "other": "Other",
-                "none": "No Main Unit",
-                "vocaloid": "VIRTUAL SINGER",
-                "piapro": "VIRTUAL SINGER",
-                "school_refusal": "Nightcord at 25:00",
-                "light_sound": "Leo/need",
-                "light_music_club": "Leo/need",
-                "idol": "MORE MORE JUMP!",
-                "street": "Vivid BAD SQUAD",
-                "theme_park": "Wonderlands×Showtime",
-            }
-            self.event_type_map = {
-                "marathon": "Marathon",
-                "cheerful_carnival": "Cheerful Carnival",
-                "world_bloom": "World Link",
-            }
+            text = re.sub(STAR_LIKE, " ", text)
+            return title
 
-            musics = [
-                api.get_master_data("musics.json", force=True, deepcopy=True)
-                for api in methods.all_apis
-            ]
-            music_difficulties = [
-                api.get_master_data("musicDifficulties.json", force=True, deepcopy=True)
-                for api in methods.all_apis
-            ]
-            music_tags = [
-                api.get_master_data("musicTags.json", force=True, deepcopy=True)
-                for api in methods.all_apis
-            ]
-            all_da_events = [
-                api.get_master_data("events.json", force=True, deepcopy=True)
-                for api in methods.all_apis
-            ]
-
-            for songs in musics:
-                for data in songs:
-                    if data["id"] == 388 and not data["title"].endswith(" [APPEND]"):
-                        data["title"] += " [APPEND]"
-                        break
+        # Requests
+        events = methods.pjsk_game_api.get_master_data(
+            "events.json", force=True, deepcopy=True
+        )
+        events_jp = methods.pjsk_game_api_jp.get_master_data(
+            "events.json", force=True, deepcopy=True
+        )
+        characters = methods.pjsk_game_api.get_master_data(
+            "characterProfiles.json", force=True, deepcopy=True
+        )
+        characters_game = methods.pjsk_game_api.get_master_data(
+            "gameCharacters.json", force=True, deepcopy=True
+        )
+        cc_teams = methods.pjsk_game_api.get_master_data(
+            "cheerfulCarnivalTeams.json", force=True, deepcopy=True
+        )
 
-            if len(self.refreshing) > 1:
-                self.refreshing.remove(thread_code)
-                return
+        # Maps
+        unit_map = {
+            "all": None,
+            "other": "Other",
+            "none": "No Main Unit",
+            "vocaloid": "VIRTUAL SINGER",
+            "piapro": "VIRTUAL SINGER",
+            "school_refusal": "Nightcord at 25:00",
+            "light_sound": "Leo/need",
+            "light_music_club": "Leo/need",
+            "idol": "MORE MORE JUMP!",
+            "street": "Vivid BAD SQUAD",
+            "theme_park": "Wonderlands×Showtime",
+        }
+        event_type_map = {
+            "marathon": "Marathon",
+            "cheerful_carnival": "Cheerful Carnival",
+            "world_bloom": "World Link",
+        }
+
+        musics = [
+            api.get_master_data("musics.json", force=True, deepcopy=True)
+            for api in methods.all_apis
+        ]
+        music_difficulties = [
+            api.get_master_data("musicDifficulties.json", force=True, deepcopy=True)
+            for api in methods.all_apis
+        ]
+        music_tags = [
+            api.get_master_data("musicTags.json", force=True, deepcopy=True)
+            for api in methods.all_apis
+        ]
+        all_da_events = [
+            api.get_master_data("events.json", force=True, deepcopy=True)
+            for api in methods.all_apis
+        ]
+        all_cards = [
+            api.get_master_data("cards.json", force=True, deepcopy=True)
+            for api in methods.all_apis
+        ]
+        all_gachas = [
+            api.get_master_data("gachas.json", force=True, deepcopy=True)
+            for api in methods.all_apis
+        ]
+        all_characters_game = [
+            api.get_master_data("gameCharacters.json", force=True, deepcopy=True)
+            for api in methods.all_apis
+        ]
+
+        for songs in musics:
+            for data in songs:
+                if data["id"] == 388 and not data["title"].endswith(" [APPEND]"):
+                    data["title"] += " [APPEND]"
+                    break
+
+        if len(self.refreshing) > 1:
+            return
 
-            # Cards
-            print("Card mapping!")
-            self.cards = {}
-            self.cards_en_jp = {}
-            card_map_path = "DATA/data/card_map.json"
-            if os.path.exists(card_map_path):
-                with open(card_map_path, "r", encoding="utf8") as f:
-                    try:
-                        cd = json.load(f)
-                        self.cards = cd["cards"]
-                        self.cards_en_jp = cd["cards_en_jp"]
-                    except:
-                        pass
-            temp_chara_data = methods.pjsk_game_api.get_master_data(
-                "gameCharacters.json", force=True, deepcopy=True
+        # Snapshot digests, used to skip sections whose inputs didn't change
+        digests = {
+            "musics": tuple(self._digest(data) for data in musics),
+            "musicDifficulties": tuple(
+                self._digest(data) for data in music_difficulties
+            ),
+            "musicTags": tuple(self._digest(data) for data in music_tags),
+            "events": tuple(self._digest(data) for data in all_da_events),
+            "gameCharacters": self._digest(characters_game),
+            "cards": tuple(self._digest(data) for data in all_cards),
+            "gachas": tuple(self._digest(data) for data in all_gachas),
+            "allGameCharacters": tuple(
+                self._digest(data) for data in all_characters_game
+            ),
+        }
+
+        index_region_map = {0: "en", 1: "jp", 2: "tw", 3: "kr", 4: "cn"}
+
+        # Cards
+        # Always walked, since leak checks depend on the current time.
+        print("Card mapping!")
+        cards = {}
+        cards_en_jp = {}
+        card_map_path = "DATA/data/card_map.json"
+        if os.path.exists(card_map_path):
+            with open(card_map_path, "r", encoding="utf8") as f:
+                try:
+                    cd = json.load(f)
+                    cards = cd["cards"]
+                    cards_en_jp = cd["cards_en_jp"]
+                except:
+                    pass
+        temp_jp_cards = all_cards[1]
+
+        def card_names(card: dict, card_data: list, api) -> tuple:
+            name = methods.Tools.get_card_name(
+                card["id"],
+                False,
+                include_character=True,
+                include_rarity=True,
+                include_attribute=True,
+                use_emojis=False,
+                region=api.app_region,
+                provided_chara_data=characters_game,
+                provided_card_data=card_data,
             )
-            temp_jp_cards = methods.pjsk_game_api_jp.get_master_data(
-                "cards.json", force=True, deepcopy=True
+            romaji = (
+                self.katsu_foreignless.romaji(name).replace(" ]", "]")
+                if api.app_region == "jp"
+                else None
             )
-            for api in methods.all_apis:
-                card_data = api.get_master_data("cards.json", force=True, deepcopy=True)
-                for card in card_data:
-                    if methods.pjsk_game_api_jp.isleak_card(card["id"], temp_jp_cards):
-                        continue
-                    name = methods.Tools.get_card_name(
-                        card["id"],
-                        False,
-                        include_character=True,
-                        include_rarity=True,
-                        include_attribute=True,
-                        use_emojis=False,
-                        region=api.app_region,
-                        provided_chara_data=temp_chara_data,
-                        provided_card_data=card_data,
-                    )
-                    if name not in self.cards:
-                        self.cards[name] = card["id"]
-                    if api.app_region == "en":
-                        self.cards_en_jp[name] = card["id"]
-                    if api.app_region == "jp":
-                        if card["id"] not in self.cards_en_jp.values():
-                            self.cards_en_jp[name] = card["id"]
-                        name = self.katsu_foreignless.romaji(name).replace(" ]", "]")
-                        self.cards[name] = card["id"]
-            with open(card_map_path, "w+", encoding="utf8") as f:
-                json.dump(
-                    {"cards": self.cards, "cards_en_jp": self.cards_en_jp}, f, indent=4
+            return name, romaji
+
+        for api, card_data in zip(methods.all_apis, all_cards):
+            for card in card_data:
+                if methods.pjsk_game_api_jp.isleak_card(card["id"], temp_jp_cards):
+                    continue
+                name, card_romaji = self._entry(
+                    ("card", api.app_region, card["id"]),
+                    [card, digests["gameCharacters"]],
+                    lambda: card_names(card, card_data, api),
+                    new_entries,
                 )
-
-            # Title Maps
+                if name not in cards:
+                    cards[name] = card["id"]
+                if api.app_region == "en":
+                    cards_en_jp[name] = card["id"]
+                if api.app_region == "jp":
+                    if card["id"] not in cards_en_jp.values():
+                        cards_en_jp[name] = card["id"]
+                    cards[card_romaji] = card["id"]
+        with open(card_map_path, "w+", encoding="utf8") as f:
+            json.dump({"cards": cards, "cards_en_jp": cards_en_jp}, f, indent=4)
+
+        # Title Maps
+        def romanize_title(title: str, pronunciation: str) -> tuple:
+            """title map keys, display title keys"""
+            map_keys = []
+            title_keys = []
+            try:
+                map_keys.append(self.katsu.romaji(pronunciation))
+                map_keys.append(self.katsu.romaji(title))
+            except Exception as e:
+                print(e)
+            try:
+                foreignless_pronunciation = self.katsu_foreignless.romaji(pronunciation)
+                map_keys.append(foreignless_pronunciation)
+                foreignless_title = self.katsu_foreignless.romaji(title)
+                map_keys.append(foreignless_title)
+                title_keys.append(foreignless_pronunciation.title())
+                title_keys.append(foreignless_title.title())
+            except Exception as e:
+                print(e)
+            return map_keys, title_keys
+
+        def build_title_maps() -> tuple:
             print("Song title mapping!")
-            self._title_maps = {}
-            self._titles = {}
+            title_maps = {}
+            titles = {}
             for i, songs in enumerate(musics):
                 for data in songs:
                     update = False
                     title = data["title"].strip()
-                    if data["id"] not in self._title_maps.values():
+                    if data["id"] not in title_maps.values():
                         update = True
-                    self._title_maps[title] = data["id"]
+                    title_maps[title] = data["id"]
                     if update:
-                        self._titles[title] = data["id"]
+                        titles[title] = data["id"]
                     if i == 1:  # jp
-                        try:
-                            self._title_maps[
-                                self.katsu.romaji(data["pronunciation"])
-                            ] = data["id"]
-                            self._title_maps[self.katsu.romaji(title)] = data["id"]
-                        except Exception as e:
-                            print(e)
-                        try:
-                            self._title_maps[
-                                self.katsu_foreignless.romaji(data["pronunciation"])
-                            ] = data["id"]
-                            self._title_maps[self.katsu_foreignless.romaji(title)] = (
-                                data["id"]
-                            )
-                            if update:
-                                self._titles[
-                                    self.katsu_foreignless.romaji(
-                                        data["pronunciation"]
-                                    ).title()
-                                ] = data["id"]
-                                self._titles[
-                                    self.katsu_foreignless.romaji(title).title()
-                                ] = data["id"]
-                        except Exception as e:
-                            print(e)
-
-            # Event Maps
+                        map_keys, title_keys = self._entry(
+                            ("title", data["id"]),
+                            [title, data["pronunciation"]],
+                            lambda: romanize_title(title, data["pronunciation"]),
+                            new_entries,
+                        )
+                        for key in map_keys:
+                            title_maps[key] = data["id"]
+                        if update:
+                            for key in title_keys:
+                                titles[key] = data["id"]
+            return title_maps, titles
+
+        # Entries are only registered in new_entries while building, so keep
+        # the previous ones alive if the section is reused.
+        def keep_entries(kind: str):
+            for key, value in self._entry_cache.items():
+                if key[0] == kind and key not in new_entries:
+                    new_entries[key] = value
+
+        base_title_maps, titles = self._section(
+            "titles", digests["musics"], build_title_maps, new_sections
+        )
+        keep_entries("title")
+
+        # Event Maps
+        def romanize_event(title: str) -> list:
+            keys = []
+            try:
+                keys.append(self.katsu.romaji(title))
+            except:
+                try:
+                    keys.append("".join([self.katsu.romaji(char) for char in [*title]]))
+                except:
+                    pass
+            try:
+                keys.append(self.katsu_foreignless.romaji(title))
+            except:
+                try:
+                    keys.append(
+                        "".join(
+                            [self.katsu_foreignless.romaji(char) for char in [*title]]
+                        )
+                    )
+                except:
+                    pass
+            return keys
+
+        def build_event_maps() -> dict:
             print("Event mapping!")
-            self._event_maps = {}
+            event_maps = {}
             for data in events:
                 title = data["name"].lower().strip()
                 simplified_title = simplify_title(title)
-                self._event_maps[title] = data["id"]
+                event_maps[title] = data["id"]
                 if simplified_title != title:
-                    self._event_maps[simplified_title] = data["id"]
+                    event_maps[simplified_title] = data["id"]
             for data in events_jp:
                 title = data["name"].strip()
-                self._event_maps[title] = data["id"]
-                try:
-                    self._event_maps[self.katsu.romaji(title)] = data["id"]
-                except:
-                    try:
-                        new_title = "".join(
-                            [self.katsu.romaji(char) for char in [*title]]
-                        )
-                        self._event_maps[new_title] = data["id"]
-                    except:
-                        pass
-                try:
-                    self._event_maps[self.katsu_foreignless.romaji(title)] = data["id"]
-                except:
-                    try:
-                        new_title = "".join(
-                            [self.katsu_foreignless.romaji(char) for char in [*title]]
-                        )
-                        self._event_maps[new_title] = data["id"]
-                    except:
-                        pass
+                event_maps[title] = data["id"]
+                for key in self._entry(
+                    ("event_map", data["id"]),
+                    title,
+                    lambda: romanize_event(title),
+                    new_entries,
+                ):
+                    event_maps[key] = data["id"]
                 # Check if there are custom titles defined for this data["id"]
                 # if data["id"] in self.custom_title_definitions:
                 #     custom_titles = self.custom_title_definitions[data["id"]]
                 #     for custom_title in custom_titles:
-                #         self._event_maps[custom_title.lower().strip()] = data["id"]
-
-            # Events
-            next_event = False
-            now = datetime.datetime.now(datetime.timezone.utc)
-            start_at = datetime.datetime.fromtimestamp(
-                events[-1]["startAt"] / 1000, datetime.timezone.utc
-            )
-            if start_at > now:
-                next_event = True
-
-            jp_next_event = False
-            now = datetime.datetime.now(datetime.timezone.utc)
-            start_at = datetime.datetime.fromtimestamp(
-                events_jp[-1]["startAt"] / 1000, datetime.timezone.utc
-            )
-            if start_at > now:
-                jp_next_event = True
-
-            self._event_latest = {
-                "en": events[-2] if next_event else events[-1],
-                "jp": events_jp[-2] if jp_next_event else events_jp[-1],
-            }
-            self._event_next = {
-                "en": events[-1] if next_event else None,
-                "jp": events_jp[-1] if jp_next_event else None,
-            }
-            self._events = {}
-            for data in events:
-                data["jp"] = False
-                data.pop("eventRankingRewardRanges", None)
-                self._events[data["id"]] = data
-            for data in events_jp:
-                data["jp"] = True
-                data.pop("eventRankingRewardRanges", None)
-                if data["id"] not in self._events:
-                    self._events[data["id"]] = data
+                #         event_maps[custom_title.lower().strip()] = data["id"]
+            return event_maps
+
+        event_maps = self._section(
+            "event_maps",
+            (digests["events"][0], digests["events"][1]),
+            build_event_maps,
+            new_sections,
+        )
+        keep_entries("event_map")
 
-            index_region_map = {0: "en", 1: "jp", 2: "tw", 3: "kr", 4: "cn"}
+        # Events
+        next_event = False
+        now = datetime.datetime.now(datetime.timezone.utc)
+        start_at = datetime.datetime.fromtimestamp(
+            events[-1]["startAt"] / 1000, datetime.timezone.utc
+        )
+        if start_at > now:
+            next_event = True
 
-            # Event key mapping
+        jp_next_event = False
+        now = datetime.datetime.now(datetime.timezone.utc)
+        start_at = datetime.datetime.fromtimestamp(
+            events_jp[-1]["startAt"] / 1000, datetime.timezone.utc
+        )
+        if start_at > now:
+            jp_next_event = True
+
+        event_latest = {
+            "en": events[-2] if next_event else events[-1],
+            "jp": events_jp[-2] if jp_next_event else events_jp[-1],
+        }
+        event_next = {
+            "en": events[-1] if next_event else None,
+            "jp": events_jp[-1] if jp_next_event else None,
+        }
+        all_events = {}
+        for data in events:
+            data["jp"] = False
+            data.pop("eventRankingRewardRanges", None)
+            all_events[data["id"]] = data
+        for data in events_jp:
+            data["jp"] = True
+            data.pop("eventRankingRewardRanges", None)
+            if data["id"] not in all_events:
+                all_events[data["id"]] = data
+
+        # Event key mapping
+        def build_all_events_raw() -> dict:
             print("Event converter mapping!")
-            self.all_events_raw = {}
+            all_events_raw = {}
             for i, events_raw in enumerate(all_da_events):
                 region = index_region_map[i]
                 for data in events_raw:
                     title = data["name"].lower().strip()
                     add_data = (
                         data
-                        if (
-                            region == "en"
-                            or (data["id"] not in self.all_events_raw.keys())
-                        )
-                        else self.all_events_raw[data["id"]]
+                        if (region == "en" or (data["id"] not in all_events_raw.keys()))
+                        else all_events_raw[data["id"]]
                     )
                     simplified_title = simplify_title(title)
-                    if title not in self.all_events_raw:
-                        self.all_events_raw[title] = add_data
+                    if title not in all_events_raw:
+                        all_events_raw[title] = add_data
                         if simplified_title != title:
-                            self.all_events_raw[simplified_title] = add_data
+                            all_events_raw[simplified_title] = add_data
                     if region == "jp":
-                        name = self.katsu_foreignless.romaji(title)
-                        self.all_events_raw[name] = add_data
-                        name = self.katsu.romaji(title)
-                        self.all_events_raw[name] = data
+                        foreignless_name, name = self._entry(
+                            ("event_raw", data["id"]),
+                            title,
+                            lambda: (
+                                self.katsu_foreignless.romaji(title),
+                                self.katsu.romaji(title),
+                            ),
+                            new_entries,
+                        )
+                        all_events_raw[foreignless_name] = add_data
+                        all_events_raw[name] = data
                     short = data["assetbundleName"].split("_")[1]
-                    if short not in self.all_events_raw:
-                        self.all_events_raw[short] = add_data
-                    if str(data["id"]) not in self.all_events_raw:
-                        self.all_events_raw[str(data["id"])] = add_data
+                    if short not in all_events_raw:
+                        all_events_raw[short] = add_data
+                    if str(data["id"]) not in all_events_raw:
+                        all_events_raw[str(data["id"])] = add_data
+            return all_events_raw
+
+        all_events_raw = self._section(
+            "all_events_raw", digests["events"], build_all_events_raw, new_sections
+        )
+        keep_entries("event_raw")
+        all_events_index = self._section(
+            "all_events_index",
+            digests["events"],
+            lambda: FuzzyIndex(all_events_raw),
+            new_sections,
+        )
+        event_maps_index = self._section(
+            "event_maps_index",
+            (digests["events"][0], digests["events"][1]),
+            lambda: FuzzyIndex(event_maps),
+            new_sections,
+        )
 
-            # Songs
+        # Characters
+        character_index = self._section(
+            "characters",
+            (self._digest(characters), digests["gameCharacters"]),
+            lambda: CharacterIndex(characters, characters_game),
+            new_sections,
+        )
+
+        # Gachas
+        gacha_indexes = self._section(
+            "gachas",
+            (digests["gachas"], digests["cards"], digests["allGameCharacters"]),
+            lambda: {
+                api.app_region: GachaIndex(api.app_region, gachas, card_data, charas)
+                for api, gachas, card_data, charas in zip(
+                    methods.all_apis, all_gachas, all_cards, all_characters_game
+                )
+            },
+            new_sections,
+        )
+
+        # Songs
+        def build_songs() -> tuple:
             print("Song mapping!")
-            self._songs = {}
-            self.all_musics_raw = musics[1].copy()  # jp raw first
+            songs_map = {}
+            all_musics_raw = musics[1].copy()  # jp raw first
             for i, songs in enumerate(musics):
                 for data in songs:
                     data["exclusive"] = index_region_map[i]
-                    if data["id"] not in self._songs:
-                        self._songs[data["id"]] = data
+                    if data["id"] not in songs_map:
+                        songs_map[data["id"]] = data
                         if i != 1:  # exclusive, but not jp exclusive
-                            self.all_musics_raw.append(data)
+                            all_musics_raw.append(data)
                     else:
-                        self._songs[data["id"]]["exclusive"] = False
+                        songs_map[data["id"]]["exclusive"] = False
 
             for tag_data in music_tags:
                 for tag in tag_data:
                     try:
-                        self._songs[tag["musicId"]]["section"] = self._songs[
+                        songs_map[tag["musicId"]]["section"] = songs_map[
                             tag["musicId"]
                         ].get("section", [])
-                        if self.unit_map[tag["musicTag"]]:
+                        if unit_map[tag["musicTag"]]:
                             if (
-                                self.unit_map[tag["musicTag"]]
-                                not in self._songs[tag["musicId"]]["section"]
+                                unit_map[tag["musicTag"]]
+                                not in songs_map[tag["musicId"]]["section"]
                             ):
-                                self._songs[tag["musicId"]]["section"].append(
-                                    self.unit_map[tag["musicTag"]]
+                                songs_map[tag["musicId"]]["section"].append(
+                                    unit_map[tag["musicTag"]]
                                 )
                     except Exception as e:
                         print("".join(traceback.format_exception(e)))
                         continue
+            return songs_map, all_musics_raw
+
+        songs_map, all_musics_raw = self._section(
+            "songs",
+            (digests["musics"], digests["musicTags"]),
+            build_songs,
+            new_sections,
+        )
 
-            # Difficulties
+        # Difficulties
+        def build_difficulties() -> dict:
             print("Difficulty mapping!")
-            self._difficulties = {}
+            difficulties = {}
             for i, songs_difficulties in enumerate(music_difficulties):
                 for data in songs_difficulties:
-                    if data["musicId"] not in self._difficulties:
-                        self._difficulties[data["musicId"]] = {}
-                    if (
-                        data["musicDifficulty"]
-                        not in self._difficulties[data["musicId"]]
-                    ):
+                    if data["musicId"] not in difficulties:
+                        difficulties[data["musicId"]] = {}
+                    if data["musicDifficulty"] not in difficulties[data["musicId"]]:
                         if i != 1:
-                            self._difficulties[data["musicId"]][
+                            difficulties[data["musicId"]][
                                 data["musicDifficulty"]
                             ] = data
                     # special JP handling for rerates and appends
                     if i == 1:
-                        if (
-                            data["musicDifficulty"]
-                            not in self._difficulties[data["musicId"]]
-                        ):
-                            self._difficulties[data["musicId"]][
+                        if data["musicDifficulty"] not in difficulties[data["musicId"]]:
+                            difficulties[data["musicId"]][
                                 data["musicDifficulty"]
                             ] = data
-                            self._difficulties[data["musicId"]][
-                                data["musicDifficulty"]
-                            ]["jpOnly"] = True
+                            difficulties[data["musicId"]][data["musicDifficulty"]][
+                                "jpOnly"
+                            ] = True
                         elif (
-                            self._difficulties[data["musicId"]][
-                                data["musicDifficulty"]
-                            ]["playLevel"]
+                            difficulties[data["musicId"]][data["musicDifficulty"]][
+                                "playLevel"
+                            ]
                             != data["playLevel"]
                         ):
-                            self._difficulties[data["musicId"]][
-                                data["musicDifficulty"]
-                            ]["playLevel"] = [
-                                self._difficulties[data["musicId"]][
-                                    data["musicDifficulty"]
-                                ]["playLevel"],
+                            difficulties[data["musicId"]][data["musicDifficulty"]][
+                                "playLevel"
+                            ] = [
+                                difficulties[data["musicId"]][data["musicDifficulty"]][
+                                    "playLevel"
+                                ],
                                 data["playLevel"],
                             ]
+            return difficulties
 
-            # Set Refresh Time
-            self._refreshed_at = time.time()
-        except Exception as e:
-            raise e
-        self.reload_song_aliases()
+        difficulties = self._section(
+            "difficulties",
+            digests["musicDifficulties"],
+            build_difficulties,
+            new_sections,
+        )
+
+        # Leak checks depend on the current time, so this is always rebuilt
+        availability = Availability(
+            songs_map, difficulties, all_events, all_cards[1], musics, all_da_events
+        )
+
+        title_maps = dict(base_title_maps)
+        self._apply_song_aliases(title_maps, songs_map)
+
+        # Swap everything in with a single dict update, so readers never see
+        # half of an old refresh and half of a new one.
+        vars(self).update(
+            {
+                "music_meta": music_meta,
+                "characters": characters,
+                "characters_game": characters_game,
+                "cc_teams": cc_teams,
+                "unit_map": unit_map,
+                "event_type_map": event_type_map,
+                "cards": cards,
+                "cards_en_jp": cards_en_jp,
+                "card_index": CardIndex(cards_en_jp),
+                "_base_title_maps": base_title_maps,
+                "_title_maps": title_maps,
+                "title_index": FuzzyIndex(title_maps),
+                "_titles": titles,
+                "song_autocomplete": SongAutocomplete(
+                    titles, self.custom_title_definitions
+                ),
+                "_event_maps": event_maps,
+                "event_maps_index": event_maps_index,
+                "_event_latest": event_latest,
+                "_event_next": event_next,
+                "_events": all_events,
+                "all_events_raw": all_events_raw,
+                "all_events_index": all_events_index,
+                "character_index": character_index,
+                "gacha_indexes": gacha_indexes,
+                "_songs": songs_map,
+                "all_musics_raw": all_musics_raw,
+                "_difficulties": difficulties,
+                "availability": availability,
+                "_sections": new_sections,
+                # changes whenever any section's inputs do, for render caches
+                "master_version": self._digest(
+                    {name: key for name, (key, _) in new_sections.items()}
+                ),
+                "_entry_cache": new_entries,
+                "_refreshed_at": time.time(),
+            }
+        )
+        romaji.save()
         print("Done!")
-        self.refreshing.remove(thread_code)
 
     def _check_refresh(self):
-        if self._refreshed_at < time.time() - 3600:  # 3600 seconds = 1 hour
+        if self._refreshed_at < time.time() - 3600 and not self.refreshing:
             threading.Thread(target=self.refresh_data, daemon=True).start()
 
     @property
@@ -522,13 +758,27 @@ class pjsk_data:
                 )
         self.reload_song_aliases()
 
-    def reload_song_aliases(self):
-        for data in self._songs.copy().values():
+    def _apply_song_aliases(self, title_maps: dict, songs: dict):
+        custom_title_definitions = self.custom_title_definitions
+        for data in songs.values():
             # Check if there are custom titles defined for this data["id"]
-            if int(data["id"]) in self.custom_title_definitions:
-                custom_titles = self.custom_title_definitions[int(data["id"])]
+            if int(data["id"]) in custom_title_definitions:
+                custom_titles = custom_title_definitions[int(data["id"])]
                 for custom_title in custom_titles:
-                    self._title_maps[custom_title.lower().strip()] = int(data["id"])
+                    title_maps[custom_title.lower().strip()] = int(data["id"])
+
+    def reload_song_aliases(self):
+        title_maps = dict(self._base_title_maps)
+        self._apply_song_aliases(title_maps, self._songs)
+        vars(self).update(
+            {
+                "_title_maps": title_maps,
+                "title_index": FuzzyIndex(title_maps),
+                "song_autocomplete": SongAutocomplete(
+                    self._titles, self.custom_title_definitions
+                ),
+            }
+        )
 
 
 pjsk = pjsk_data()
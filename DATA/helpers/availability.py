@@ -0,0 +1,198 @@
+"""
+Leak status and server availability of every song, event and card, worked out once per
+master data refresh instead of on every check, plus shuffled candidate lists for picking
+a random non-leaked one.
+
+Leak checks only change when something's publish time passes, so each id is checked
+again only once one of its publish times (in any region) has passed.
+"""
+
+import heapq, itertools, secrets, threading, time
+from typing import NamedTuple
+
+from DATA.game_api import methods
+
+_random = secrets.SystemRandom()
+# versions are taken from one counter so they keep increasing across refreshes too
+_versions = itertools.count()
+
+GUESSABLE_CARD_RARITIES = ("rarity_3", "rarity_4", "rarity_birthday")
+
+
+class SongAvailability(NamedTuple):
+    leak: bool | None  # methods.Tools.isleak
+    all_leak: bool  # leaked on every region (methods.Tools.get_music_regions)
+    regions: list[str]
+    append_regions: list[str]
+
+
+class ShuffleBag:
+    """Items handed out in a random order, reshuffled once every item has been drawn."""
+
+    def __init__(self, items):
+        self.items = list(items)
+        self.position = len(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def draw(self):
+        if self.position >= len(self.items):
+            _random.shuffle(self.items)
+            self.position = 0
+        self.position += 1
+        return self.items[self.position - 1]
+
+
+class Availability:
+    """Built by `pjsk_data` on every refresh, see the module docstring."""
+
+    def __init__(
+        self,
+        songs: dict,
+        difficulties: dict,
+        events: dict,
+        jp_cards: list,
+        musics: list[list],
+        all_events: list[list],
+    ):
+        """
+        songs, difficulties, events: `pjsk_data`'s maps by id. jp_cards: jp cards.json.
+        musics, all_events: musics.json / events.json of every region, for publish times.
+        """
+        self._lock = threading.Lock()
+        self._version = next(_versions)
+        self.difficulties = difficulties
+        self.songs: dict[int, SongAvailability] = {}
+        # id -> (leaked, leaked on en)
+        self.events: dict[int, tuple[bool, bool]] = {}
+        # guessable jp cards (3★ and up), released or not
+        self.cards = {
+            card["id"]: card
+            for card in jp_cards
+            if card["cardRarityType"] in GUESSABLE_CARD_RARITIES
+        }
+        self.released_cards: set[int] = set()
+
+        now = int(time.time() * 1000)
+        # (time, kind, id) of every publish time still to come, earliest first
+        self._changes = []
+        for kind, ids, sources, field in (
+            ("song", songs, musics, "publishedAt"),
+            ("event", events, all_events, "startAt"),
+            ("card", self.cards, [jp_cards], "releaseAt"),
+        ):
+            for source in sources:
+                for entry in source:
+                    if entry["id"] in ids and entry.get(field, 0) > now:
+                        self._changes.append((entry[field], kind, entry["id"]))
+        heapq.heapify(self._changes)
+
+        for music_id in songs:
+            self._update("song", music_id, now)
+        for event_id in events:
+            self._update("event", event_id, now)
+        for card_id in self.cards:
+            self._update("card", card_id, now)
+        # filter -> ShuffleBag, built on first use and dropped whenever a leak changes
+        self._bags: dict[tuple, ShuffleBag] = {}
+
+    def _update(self, kind: str, entry_id: int, now: int) -> None:
+        if kind == "song":
+            self.songs[entry_id] = self._check_song(entry_id)
+        elif kind == "event":
+            self.events[entry_id] = (
+                methods.Tools.isleak_event(entry_id),
+                methods.pjsk_game_api.isleak_event(entry_id),
+            )
+        elif self.cards[entry_id]["releaseAt"] <= now:
+            self.released_cards.add(entry_id)
+        else:
+            self.released_cards.discard(entry_id)
+
+    @staticmethod
+    def _check_song(music_id: int) -> SongAvailability:
+        all_leak, regions = methods.Tools.get_music_regions(music_id)
+        return SongAvailability(
+            methods.Tools.isleak(music_id),
+            all_leak,
+            list(regions),
+            list(methods.Tools.get_music_append_regions(music_id)),
+        )
+
+    def _advance(self) -> None:
+        """Check again the ids with a publish time that has passed."""
+        now = int(time.time() * 1000)
+        if not self._changes or self._changes[0][0] > now:
+            return
+        with self._lock:
+            if not self._changes or self._changes[0][0] > now:
+                return  # another thread got here first
+            while self._changes and self._changes[0][0] <= now:
+                _, kind, entry_id = heapq.heappop(self._changes)
+                self._update(kind, entry_id, now)
+                self._bags = {
+                    key: bag for key, bag in self._bags.items() if key[0] != kind
+                }
+            self._version = next(_versions)
+
+    @property
+    def version(self) -> int:
+        """
+        Increases whenever a publish time passes or the master data is refreshed, for
+        caches of leak dependent data.
+        """
+        self._advance()
+        return self._version
+
+    def song(self, music_id: int) -> SongAvailability:
+        self._advance()
+        availability = self.songs.get(music_id)
+        if availability is None:  # not in the songs map, checked every time
+            availability = self._check_song(music_id)
+        return availability
+
+    def isleak(self, music_id: int) -> bool | None:
+        return self.song(music_id).leak
+
+    def _bag(self, key: tuple, candidates) -> ShuffleBag:
+        bag = self._bags.get(key)
+        if bag is None:
+            bag = self._bags[key] = ShuffleBag(candidates())
+        return bag
+
+    def random_song(self, has_append: bool = False) -> int:
+        """A random song id that isn't leaked. IndexError if there's none."""
+        self._advance()
+        with self._lock:
+            return self._bag(
+                ("song", has_append),
+                lambda: [
+                    music_id
+                    for music_id, song in self.songs.items()
+                    if song.leak is not None and not song.leak
+                    if not has_append
+                    or self.difficulties.get(music_id, {}).get("append")
+                ],
+            ).draw()
+
+    def random_event(self, en_only: bool = False) -> int:
+        """A random event id that isn't leaked (on en too if en_only)."""
+        self._advance()
+        with self._lock:
+            return self._bag(
+                ("event", en_only),
+                lambda: [
+                    event_id
+                    for event_id, (leak, en_leak) in self.events.items()
+                    if leak is not None and not leak
+                    if not en_only or not en_leak
+                ],
+            ).draw()
+
+    def random_card(self) -> dict:
+        """A random released 3★, 4★ or birthday jp card."""
+        self._advance()
+        with self._lock:
+            card_id = self._bag(("card",), lambda: sorted(self.released_cards)).draw()
+        return self.cards[card_id]
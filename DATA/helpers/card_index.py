@@ -0,0 +1,72 @@
+from functools import lru_cache
+
+
+def parse_card_name(name: str):
+    """
+    Parses the card name into components:
+    CHARACTER NAME - 4☆ [Attribute] CARD NAME
+    Returns (character_name, rarity, attribute, card_name).
+    """
+    parts = name.split(" - ")
+    if len(parts) < 2:
+        return None, None, None, None
+
+    character_name = parts[0].lower()
+    card_details = parts[1].lower().split(" ")
+
+    rarity = card_details[0] if card_details else None
+    attribute = (
+        card_details[1].strip("[]")
+        if len(card_details) > 1 and "[" in card_details[1]
+        else None
+    )
+    card_name = " ".join(card_details[2:]) if len(card_details) > 2 else None
+
+    return character_name, rarity, attribute, card_name
+
+
+class CardIndex:
+    """
+    Card names (`pjsk.cards_en_jp`) parsed once per master data refresh, with an
+    inverted index from every character, rarity, attribute and card name token
+    to the cards using it.
+    """
+
+    def __init__(self, cards: dict):
+        # (name, card id), in the original order
+        self.cards = []
+        self.postings: dict[str, set[int]] = {}
+        for name, value in cards.items():
+            character_name, rarity, attribute, card_name = parse_card_name(name)
+            if not character_name:
+                continue
+            position = len(self.cards)
+            self.cards.append((name, value))
+            for field in (character_name, rarity, attribute, card_name):
+                if not field:
+                    continue
+                for token in field.split(" "):
+                    if token:
+                        self.postings.setdefault(token, set()).add(position)
+        self.tokens = list(self.postings.keys())
+        self.matching = lru_cache(maxsize=4096)(self._matching)
+
+    def _matching(self, part: str) -> frozenset[int]:
+        """Cards with a field containing `part` (which has no spaces)."""
+        found = set()
+        for token in self.tokens:
+            if part in token:
+                found |= self.postings[token]
+        return frozenset(found)
+
+    def search(self, parts: list[str], limit: int = 25) -> list[tuple[str, int]]:
+        """(name, card id) of cards where every part is found in one of its fields."""
+        if not parts:
+            return self.cards[:limit]
+        found = None
+        for part in sorted(parts, key=lambda part: -len(part)):
+            matching = self.matching(part)
+            found = set(matching) if found is None else found & matching
+            if not found:
+                return []
+        return [self.cards[position] for position in sorted(found)[:limit]]
@@ -0,0 +1,81 @@
+from DATA.helpers.fuzzy_match import FuzzyIndex
+
+
+def character_name(chara: dict) -> str:
+    """Display name of a gameCharacters.json entry (`Hatsune Miku`, `Hoshino Ichika`, ...)"""
+    if chara.get("firstName") and chara.get("unit") != "piapro":
+        return str(chara["givenName"]) + " " + str(chara["firstName"])
+    if chara.get("firstName"):
+        return str(chara["firstName"]) + " " + str(chara["givenName"])
+    return chara["givenName"]
+
+
+class CharacterIndex:
+    """
+    Every way to refer to a character (names, name permutations, voice actors),
+    built once per master data refresh and shared by converters and autocompletes.
+    """
+
+    def __init__(self, characters: list, characters_game: list):
+        aliases = {}
+
+        voiced = [
+            (value["characterVoice"], characters_game[value["characterId"] - 1])
+            for value in characters
+            if value.get("characterVoice")
+        ]
+        aliases.update({voice: chara for voice, chara in voiced})
+        aliases.update(
+            {
+                voice.split(" ")[0]: chara
+                for voice, chara in voiced
+                if len(voice.split(" ")) == 2
+            }
+        )
+        aliases.update(
+            {
+                voice.split(" ")[1]: chara
+                for voice, chara in voiced
+                if len(voice.split(" ")) == 2
+            }
+        )
+
+        aliases.update({value["givenName"]: value for value in characters_game})
+
+        for value in characters_game:
+            if value.get("firstName"):
+                aliases[str(value["givenName"]) + str(value["firstName"])] = value
+                aliases[str(value["firstName"]) + str(value["givenName"])] = value
+                aliases[str(value["firstName"])] = value
+
+        self.aliases = aliases
+        self.fuzzy = FuzzyIndex(aliases)
+
+        # Autocomplete entries: (name, lowercase name, lowercase name without spaces)
+        def normalized(names: list) -> list:
+            names = list(dict.fromkeys(names))
+            return [
+                (name, name.lower(), name.lower().replace(" ", "")) for name in names
+            ]
+
+        self.names = normalized([character_name(value) for value in characters_game])
+        self.voices = normalized([voice for voice, _ in voiced])
+
+    def match(self, arg: str, sensitivity: float = 0.6) -> dict | None:
+        """Fuzzy match to a gameCharacters.json entry."""
+        res = self.fuzzy.match(arg, sensitivity=sensitivity)
+        return self.aliases[res] if res else None
+
+    def autocomplete(self, current: str, limit: int = 25) -> list[str]:
+        """Character names containing `current`, falling back to voice actor names."""
+        current = current.lower()
+        current_nospace = current.replace(" ", "")
+        for entries in (self.names, self.voices):
+            matches = [
+                name
+                for name, lower, nospace in entries
+                if current in lower or current_nospace in nospace
+            ]
+            if matches:
+                return matches[:limit]
+        return []
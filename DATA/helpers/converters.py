@@ -1,9 +1,5 @@
 from twitchio.ext import commands as twitch_commands
 
-from DATA.helpers.fuzzy_match import (
-    fuzzy_match_to_dict_key,
-    fuzzy_match_to_dict_key_partial,
-)
 from DATA.data.pjsk import Song, pjsk_data
 
 # Notice: stripping the invisible character from extensions like 7TV
@@ -11,48 +7,7 @@ from DATA.data.pjsk import Song, pjsk_data
 
 def CharacterConverter(ctx: twitch_commands.Context, arg: str) -> str | None:
     arg = arg.strip("󠀀")
-    chars = {}
-
-    chars.update(
-        {
-            value["characterVoice"]: ctx.bot.pjsk.characters_game[
-                value["characterId"] - 1
-            ]
-            for value in ctx.bot.pjsk.characters
-            if value.get("characterVoice")
-        }
-    )
-    chars.update(
-        {
-            value["characterVoice"].split(" ")[0]: ctx.bot.pjsk.characters_game[
-                value["characterId"] - 1
-            ]
-            for value in ctx.bot.pjsk.characters
-            if value.get("characterVoice")
-            and len(value.get("characterVoice", "").split(" ")) == 2
-        }
-    )
-    chars.update(
-        {
-            value["characterVoice"].split(" ")[1]: ctx.bot.pjsk.characters_game[
-                value["characterId"] - 1
-            ]
-            for value in ctx.bot.pjsk.characters
-            if value.get("characterVoice")
-            and len(value.get("characterVoice", "").split(" ")) == 2
-        }
-    )
-
-    chars.update({value["givenName"]: value for value in ctx.bot.pjsk.characters_game})
-
-    for value in ctx.bot.pjsk.characters_game:
-        if value.get("firstName"):
-            chars[str(value["givenName"]) + str(value["firstName"])] = value
-            chars[str(value["firstName"]) + str(value["givenName"])] = value
-            chars[str(value["firstName"])] = value
-
-    res = fuzzy_match_to_dict_key(arg, chars, sensitivity=0.7)
-    return chars[res] if res else None
+    return ctx.bot.pjsk.character_index.match(arg, sensitivity=0.7)
 
 
 def SongConverter(ctx: twitch_commands.Context, arg: str) -> Song | None:
@@ -76,11 +31,10 @@ def SongConverter(ctx: twitch_commands.Context, arg: str) -> Song | None:
         if arg in ctx.bot.pjsk.title_maps:
             song = ctx.bot.pjsk.songs[ctx.bot.pjsk.title_maps[arg]]
         else:
-            matched_key = fuzzy_match_to_dict_key(
-                arg, ctx.bot.pjsk.title_maps, sensitivity=0.5
-            )
+            index = ctx.bot.pjsk.title_index
+            matched_key = index.match(arg, sensitivity=0.5)
             if matched_key is not None:
-                song = ctx.bot.pjsk.songs[ctx.bot.pjsk.title_maps[matched_key]]
+                song = ctx.bot.pjsk.songs[index.dictionary[matched_key]]
 
     if not song:
         return song
@@ -91,10 +45,11 @@ def SongConverter(ctx: twitch_commands.Context, arg: str) -> Song | None:
     return Song(song, difficulties)
 
 
-def SongFromPJSK(pjsk: pjsk_data, arg: str, speed: bool = False) -> Song | None:
-    song: None | Song = None
-    if arg == None:
-        return song
+def _song_from_exact(pjsk: pjsk_data, arg: str, speed: bool) -> tuple:
+    """
+    Resolve by ID or exact title. Returns (song data or None, arg to fuzzy match).
+    """
+    song = None
     arg = str(arg).strip("󠀀")
     if arg and arg.isdigit() and arg not in ["39"]:
         arg = int(arg)
@@ -111,10 +66,19 @@ def SongFromPJSK(pjsk: pjsk_data, arg: str, speed: bool = False) -> Song | None:
                 pass
             if arg in pjsk.title_maps:
                 song = pjsk.songs[pjsk.title_maps[arg]]
+    return song, arg
+
+
+def SongFromPJSK(pjsk: pjsk_data, arg: str, speed: bool = False) -> Song | None:
+    song: None | Song = None
+    if arg == None:
+        return song
+    song, arg = _song_from_exact(pjsk, arg, speed)
     if not song:
-        matched_key = fuzzy_match_to_dict_key(arg, pjsk.title_maps, sensitivity=0.5)
+        index = pjsk.title_index
+        matched_key = index.match(arg, sensitivity=0.5)
         if matched_key is not None:
-            song = pjsk.songs[pjsk.title_maps[matched_key]]
+            song = pjsk.songs[index.dictionary[matched_key]]
 
     if not song:
         return song
@@ -125,47 +89,36 @@ def SongFromPJSK(pjsk: pjsk_data, arg: str, speed: bool = False) -> Song | None:
     return Song(song, difficulties)
 
 
+def SongsFromPJSK(
+    pjsk: pjsk_data, args: list[str], speed: bool = False
+) -> list[Song | None]:
+    """
+    Resolve many song queries at once, with one fuzzy matching pass for all of them.
+    Same results as calling SongFromPJSK on each query.
+    """
+    found = [None] * len(args)
+    fuzzy_args = {}  # position -> arg
+    for i, arg in enumerate(args):
+        if arg == None:
+            continue
+        found[i], arg = _song_from_exact(pjsk, arg, speed)
+        if not found[i]:
+            fuzzy_args[i] = str(arg)
+
+    if fuzzy_args:
+        index = pjsk.title_index
+        matched_keys = index.match_many(list(fuzzy_args.values()), sensitivity=0.5)
+        for i, matched_key in zip(fuzzy_args.keys(), matched_keys):
+            if matched_key is not None:
+                found[i] = pjsk.songs[index.dictionary[matched_key]]
+
+    return [
+        Song(song, pjsk.difficulties[song["id"]]) if song else None for song in found
+    ]
+
+
 def CharFromPJSK(pjsk: pjsk_data, arg: str) -> dict | None:
-    chars = {}
-
-    chars.update(
-        {
-            value["characterVoice"]: pjsk.characters_game[value["characterId"] - 1]
-            for value in pjsk.characters
-            if value.get("characterVoice")
-        }
-    )
-    chars.update(
-        {
-            value["characterVoice"].split(" ")[0]: pjsk.characters_game[
-                value["characterId"] - 1
-            ]
-            for value in pjsk.characters
-            if value.get("characterVoice")
-            and len(value.get("characterVoice", "").split(" ")) == 2
-        }
-    )
-    chars.update(
-        {
-            value["characterVoice"].split(" ")[1]: pjsk.characters_game[
-                value["characterId"] - 1
-            ]
-            for value in pjsk.characters
-            if value.get("characterVoice")
-            and len(value.get("characterVoice", "").split(" ")) == 2
-        }
-    )
-
-    chars.update({value["givenName"]: value for value in pjsk.characters_game})
-
-    for value in pjsk.characters_game:
-        if value.get("firstName"):
-            chars[str(value["givenName"]) + str(value["firstName"])] = value
-            chars[str(value["firstName"]) + str(value["givenName"])] = value
-            chars[str(value["firstName"])] = value
-
-    res = fuzzy_match_to_dict_key(arg, chars, sensitivity=0.6)
-    return chars[res] if res else res
+    return pjsk.character_index.match(arg, sensitivity=0.6)
 
 
 def DiffFromPJSK(arg: str) -> str | None:
@@ -193,8 +146,9 @@ def DiffFromPJSK(arg: str) -> str | None:
 
 
 def EventFromPJSK(pjsk: pjsk_data, arg: str) -> dict | None:
-    res = fuzzy_match_to_dict_key_partial(arg, pjsk.all_events_raw, sensitivity=0.5)
-    return pjsk.all_events_raw[res] if res else res
+    index = pjsk.all_events_index
+    res = index.match_partial(arg, sensitivity=0.5)
+    return index.dictionary[res] if res else res
 
 
 def Integer(ctx: twitch_commands.Context, arg: str) -> int | None:
@@ -2,7 +2,6 @@ import discord
 from discord import app_commands
 
 from typing import List
-from itertools import islice
 
 from DATA.data.pjsk import pjsk, pjsk_data
 
@@ -119,51 +118,8 @@ class Autocompletes:
     async def pjsk_char(
         self, interaction: discord.Interaction, current: str
     ) -> List[app_commands.Choice[str]]:
-        full_names = []
-        chars = [value["givenName"] for value in self.pjsk.characters_game]
-        for value in self.pjsk.characters_game:
-            name = (
-                str(value["givenName"]) + " " + str(value["firstName"])
-                if value.get("firstName") and value.get("unit") != "piapro"
-                else (
-                    str(value["firstName"]) + " " + str(value["givenName"])
-                    if value.get("firstName")
-                    else value["givenName"]
-                )
-            )
-            full_names.append(name)
-            if value.get("firstName"):
-                chars.append(str(value["givenName"]) + " " + str(value["firstName"]))
-                chars.append(str(value["firstName"]) + " " + str(value["givenName"]))
-                chars.append(str(value["firstName"]))
-        vas = [
-            value["characterVoice"]
-            for value in self.pjsk.characters
-            if value.get("characterVoice")
-        ]
-        ac = set(
-            [
-                name
-                for name in full_names
-                if (current.lower() in name.lower())
-                or (current.lower().replace(" ", "") in name.lower().replace(" ", ""))
-            ]
-        )
-        if len(ac) == 0:
-            ac = set(
-                [
-                    name
-                    for name in vas
-                    if (current.lower() in name.lower())
-                    or (
-                        current.lower().replace(" ", "")
-                        in name.lower().replace(" ", "")
-                    )
-                ]
-            )
-
-        ac = [app_commands.Choice(name=name, value=name) for name in ac]
-        return ac[:25]
+        ac = self.pjsk.character_index.autocomplete(current)
+        return [app_commands.Choice(name=name, value=name) for name in ac]
 
     async def pjsk_card(
         self, interaction: discord.Interaction, current: str
@@ -203,55 +159,10 @@ class Autocompletes:
         if len(rarities) > 1:
             return [app_commands.Choice(name="Invalid search", value="invalid_search")]
 
-        # Helper to parse card names
-        def parse_card_name(name: str):
-            """
-            Parses the card name into components:
-            CHARACTER NAME - 4☆ [Attribute] CARD NAME
-            Returns (character_name, rarity, attribute, card_name).
-            """
-            parts = name.split(" - ")
-            if len(parts) < 2:
-                return None, None, None, None
-
-            character_name = parts[0].lower()
-            card_details = parts[1].lower().split(" ")
-
-            rarity = card_details[0] if card_details else None
-            attribute = (
-                card_details[1].strip("[]")
-                if len(card_details) > 1 and "[" in card_details[1]
-                else None
-            )
-            card_name = " ".join(card_details[2:]) if len(card_details) > 2 else None
-
-            return character_name, rarity, attribute, card_name
-
-        # Preprocess card data
-        parsed_cards = []
-        for name, value in pjsk.cards_en_jp.items():
-            parsed = parse_card_name(name)
-            if parsed[0]:  # Ensure valid parsing
-                parsed_cards.append((name, value, *parsed))
-
-        # Filter matches
-        matches = []
-        for name, value, character_name, rarity, attribute, card_name in parsed_cards:
-            if all(
-                any(
-                    part in field
-                    for field in (character_name, rarity, attribute, card_name)
-                    if field
-                )
-                for part in replaced_parts
-            ):
-                matches.append(
-                    app_commands.Choice(
-                        name=f"({str(value)}) " + name, value=str(value)
-                    )
-                )
-                if len(matches) >= 25:  # Stop early if we hit the max
-                    break
+        matches = [
+            app_commands.Choice(name=f"({str(value)}) " + name, value=str(value))
+            for name, value in self.pjsk.card_index.search(replaced_parts)
+        ]
 
         # Return results or invalid search
         if not matches:
@@ -264,32 +175,9 @@ class Autocompletes:
         interaction: discord.Interaction,
         current: str,
     ) -> List[app_commands.Choice[str]]:
-        song_titles = list(self.pjsk._titles.keys()) + [
-            str(id) for id in self.pjsk._titles.values()
-        ]
-
-        # Use a generator for efficient filtering
-        matches = (
-            title
-            for title in song_titles
-            if (current.lower() in title.lower())
-            or (current.lower().replace(" ", "") in title.lower().replace(" ", ""))
-        )
-
-        def noid(gen) -> List[str]:
-            """Remove all items that are digits from the generator."""
-            return list(islice((item for item in gen if not item.isdigit()), 25))
-
-        def onlyid(gen) -> List[str]:
-            """Remove all items that are not digits from the generator."""
-            return list(islice((item for item in gen if item.isdigit()), 25))
-
-        # Apply appropriate filter based on `current`
-        filtered_matches = noid(matches) if not current.isdigit() else onlyid(matches)
-
-        # Return the first 25 matches as app_commands.Choice objects
         return [
-            app_commands.Choice(name=title, value=title) for title in filtered_matches
+            app_commands.Choice(name=name, value=value)
+            for name, value in self.pjsk.song_autocomplete.search(current)
         ]
 
 
@@ -4,6 +4,8 @@ import unicodedata
 import re
 from functools import lru_cache
 
+import numpy as np
+
 
 @lru_cache(None)
 def preprocess(text):
@@ -19,6 +21,172 @@ def preprocess(text):
     return text
 
 
+class FuzzyIndex:
+    """
+    Preprocessed keys of a dictionary, built once and reused for every lookup.
+
+    Results are the same as `fuzzy_match_to_dict_key` and
+    `fuzzy_match_to_dict_key_partial` on the same dictionary.
+    """
+
+    def __init__(self, dictionary: dict):
+        self.dictionary = dictionary
+        self.keys = list(dictionary.keys())
+        self.processed = [preprocess(key) for key in self.keys]
+        # preprocessed key -> index of its first original key
+        self.lookup = {}
+        for i, key in enumerate(self.processed):
+            self.lookup.setdefault(key, i)
+        self.lengths = np.array([len(key) for key in self.processed], dtype=np.int32)
+
+    def __bool__(self) -> bool:
+        return bool(self.keys)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _length_candidates(self, length: int, cutoff: float) -> np.ndarray:
+        """
+        Indexes of keys that can reach `cutoff` with fuzz.ratio, in original order.
+        ratio <= 100 * 2 * min(a, b) / (a + b), so keys of a very different
+        length can be skipped without scoring them.
+        """
+        if cutoff <= 0:
+            return np.arange(len(self.keys))
+        factor = cutoff / (200 - cutoff)
+        low = length * factor - 1e-6
+        high = length / factor + 1e-6
+        return np.flatnonzero((self.lengths >= low) & (self.lengths <= high))
+
+    def match(
+        self, input_str: str, sensitivity: float = 0.6, ratio: bool = True
+    ) -> str | None:
+        """
+        Fuzzy match input_str to the closest key.
+
+        Args:
+            input_str (str): The string to match.
+            sensitivity (float): Minimum score threshold for a valid match (0-1).
+            ratio (bool): Use default ratio? If False, uses weighted ratio.
+
+        Returns:
+            str | None: Best match key if score >= sensitivity, otherwise None.
+        """
+        if not self.keys:
+            return None
+        sensitivity = sensitivity * 100
+        input_str = preprocess(input_str)
+
+        exact = self.lookup.get(input_str)
+        if exact is not None and (ratio or input_str):  # WRatio scores "" as 0
+            return self.keys[exact]
+
+        if ratio:
+            candidates = self._length_candidates(len(input_str), sensitivity)
+            if len(candidates) == 0:
+                return None
+            choices = [self.processed[i] for i in candidates]
+        else:
+            candidates = None
+            choices = self.processed
+
+        result = process.extractOne(
+            input_str,
+            choices,
+            scorer=fuzz.ratio if ratio else fuzz.WRatio,
+            processor=None,  # Already preprocessed
+            score_cutoff=sensitivity,
+        )
+        if not result:
+            return None
+        index = result[2] if candidates is None else candidates[result[2]]
+        # map back to the first key with the same preprocessed form
+        return self.keys[self.lookup[self.processed[index]]]
+
+    def match_many(
+        self, inputs: list[str], sensitivity: float = 0.6, ratio: bool = True
+    ) -> list[str | None]:
+        """
+        Fuzzy match many strings at once, scoring them all in a single
+        vectorized `process.cdist` pass.
+
+        Returns the same keys as calling `match` on each input.
+        """
+        results = [None] * len(inputs)
+        if not self.keys or not inputs:
+            return results
+        sensitivity = sensitivity * 100
+
+        queries = []
+        positions = []
+        for i, input_str in enumerate(inputs):
+            input_str = preprocess(input_str)
+            exact = self.lookup.get(input_str)
+            if exact is not None and (ratio or input_str):
+                results[i] = self.keys[exact]
+            else:
+                queries.append(input_str)
+                positions.append(i)
+        if not queries:
+            return results
+
+        scores = process.cdist(
+            queries,
+            self.processed,
+            scorer=fuzz.ratio if ratio else fuzz.WRatio,
+            processor=None,  # Already preprocessed
+            score_cutoff=sensitivity,
+            dtype=np.float64,
+        )
+        best = scores.argmax(axis=1)  # first key on ties, like extractOne
+        for position, row, index in zip(positions, scores, best):
+            if row[index] >= sensitivity:
+                results[position] = self.keys[self.lookup[self.processed[index]]]
+        return results
+
+    def match_partial(self, input_str: str, sensitivity: float = 0.6) -> str | None:
+        """
+        Fuzzy match input_str to the closest key, prioritizing partial matches and small edit distances.
+
+        Args:
+            input_str (str): The string to match.
+            sensitivity (float): Minimum score threshold for a valid match (0-1).
+
+        Returns:
+            str | None: Best match key if score >= sensitivity, otherwise None.
+        """
+        if not self.keys:
+            return None
+        sensitivity = sensitivity * 100
+        input_str = preprocess(input_str)
+
+        similarity = process.cdist(
+            [input_str],
+            self.processed,
+            scorer=fuzz.token_set_ratio,
+            processor=None,
+            dtype=np.float64,
+        )[0]
+        edit_distance = process.cdist(
+            [input_str],
+            self.processed,
+            scorer=Levenshtein.distance,
+            processor=None,
+            dtype=np.int32,
+        )[0]
+
+        # Penalize scores for large edit distances (>5 edits)
+        similarity -= np.maximum(edit_distance - 5, 0) * 5
+
+        valid = np.flatnonzero(similarity >= sensitivity)
+        if len(valid) == 0:
+            return None
+        best = valid[similarity[valid] == similarity[valid].max()]
+        # Favor shorter edit distances if scores are tied, then the first key
+        best = best[np.argmin(edit_distance[best])]
+        return self.keys[best]
+
+
 def fuzzy_match_to_dict_key_partial(
     input_str: str, dictionary: dict, sensitivity: float = 0.6
 ) -> str | None:
@@ -32,36 +200,10 @@ def fuzzy_match_to_dict_key_partial(
 
     Returns:
         str | None: Best match key if score >= sensitivity, otherwise None.
-    """
-    if not dictionary:
-        return None
 
-    sensitivity = sensitivity * 100  # Convert to 0-100 scale
-    input_str = preprocess(input_str)
-    preprocessed_keys = {key: preprocess(key) for key in dictionary.keys()}
-
-    best_match = None
-    best_score = 0
-
-    for original_key, preprocessed_key in preprocessed_keys.items():
-        # Calculate similarity and edit distance
-        similarity = fuzz.token_set_ratio(input_str, preprocessed_key)
-        edit_distance = Levenshtein.distance(input_str, preprocessed_key)
-
-        # Penalize scores for large edit distances (>5 edits)
-        if edit_distance > 5:
-            similarity -= (edit_distance - 5) * 5
-
-        # Favor shorter edit distances if scores are tied
-        if similarity > best_score or (
-            similarity == best_score
-            and edit_distance < Levenshtein.distance(input_str, best_match or "")
-        ):
-            if similarity >= sensitivity:
-                best_match = original_key
-                best_score = similarity
-
-    return best_match
+    Use a `FuzzyIndex` instead when matching against the same dictionary repeatedly.
+    """
+    return FuzzyIndex(dictionary).match_partial(input_str, sensitivity)
 
 
 def fuzzy_match_to_dict_key(
@@ -78,26 +220,7 @@ def fuzzy_match_to_dict_key(
 
     Returns:
         str | None: Best match key if score >= sensitivity, otherwise None.
-    """
-    sensitivity = sensitivity * 100
-    if not dictionary:
-        return None
-
-    # Preprocess input and dictionary keys
-    input_str = preprocess(input_str)
-    keys = [preprocess(key) for key in dictionary.keys()]
-
-    # Perform fuzzy matching
-    result = process.extractOne(
-        input_str,
-        keys,
-        scorer=fuzz.ratio if ratio else fuzz.WRatio,
-        processor=None,  # Already preprocessed
-    )
 
-    if result and result[1] >= sensitivity:
-        # Find the original key from the preprocessed match
-        matched_index = keys.index(result[0])
-        return list(dictionary.keys())[matched_index]
-
-    return None
+    Use a `FuzzyIndex` instead when matching against the same dictionary repeatedly.
+    """
+    return FuzzyIndex(dictionary).match(input_str, sensitivity, ratio)
@@ -0,0 +1,214 @@
+import random
+
+import numpy as np
+
+
+def gacha_character_name(chara: dict, region: str) -> str:
+    """Name of a gameCharacters.json entry as the gacha shows it (family name first in jp)."""
+    try:
+        if region == "jp":
+            return chara["firstName"] + chara["givenName"]
+        return chara["givenName"] + chara["firstName"]
+    except KeyError:
+        return chara["givenName"]
+
+
+class AliasSampler:
+    """
+    Walker's alias method: draws index i with probability weights[i] / sum(weights)
+    with one random index and one random float, after an O(n) setup.
+    """
+
+    def __init__(self, weights: list[float]):
+        n = len(weights)
+        total = sum(weights)
+        if total <= 0:
+            weights, total = [1] * n, n
+        # column i keeps i with chance prob[i], otherwise gives alias[i]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        scaled = [weight * n / total for weight in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1]
+        large = [i for i, p in enumerate(scaled) if p >= 1]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.prob[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] -= 1 - scaled[less]
+            (small if scaled[more] < 1 else large).append(more)
+
+    def __len__(self) -> int:
+        return len(self.prob)
+
+    def sample(self, rng=random) -> int:
+        i = rng.randrange(len(self.prob))
+        return i if rng.random() < self.prob[i] else self.alias[i]
+
+    def sample_many(self, rng: np.random.Generator, size) -> np.ndarray:
+        """`size` draws at once, as an array of indices."""
+        i = rng.integers(0, len(self.prob), size=size)
+        keep = rng.random(size) < np.asarray(self.prob)[i]
+        return np.where(keep, i, np.asarray(self.alias)[i])
+
+
+class GachaPool:
+    """
+    Rarity rates and card pools of one gachas.json entry, with a sampler per rarity:
+    4★ (or birthday) cards by their gachaDetails weight, 3★ and 2★ cards uniformly.
+    """
+
+    def __init__(self, gacha: dict, cards: dict):
+        self.rate4 = 0
+        self.rate3 = 0
+        self.birthday = False
+        for rate in gacha["gachaCardRarityRates"]:
+            if rate["cardRarityType"] in ("rarity_4", "rarity_birthday"):
+                self.rate4 = rate["rate"]
+                self.birthday = rate["cardRarityType"] == "rarity_birthday"
+                break
+        for rate in gacha["gachaCardRarityRates"]:
+            if rate["cardRarityType"] == "rarity_3":
+                self.rate3 = rate["rate"]
+
+        # rarity (2, 3 or 4) -> card ids, and their weights
+        self.cards = {2: [], 3: [], 4: []}
+        self.weights = {2: [], 3: [], 4: []}
+        for detail in gacha["gachaDetails"]:
+            card = cards.get(detail["cardId"])
+            if card is None:
+                continue
+            if card["cardRarityType"] == "rarity_2":
+                rarity, weight = 2, 1
+            elif card["cardRarityType"] == "rarity_3":
+                rarity, weight = 3, 1
+            else:
+                rarity, weight = 4, detail["weight"]
+            self.cards[rarity].append(card["id"])
+            self.weights[rarity].append(weight)
+        self.samplers = {
+            rarity: AliasSampler(weights) for rarity, weights in self.weights.items()
+        }
+        self.rate_up = self._rate_up(gacha)
+
+    def _rate_up(self, gacha: dict) -> list[bool]:
+        """
+        Which of the 4★ cards are rate-up (当期) cards: the gacha's pickups, or if it
+        lists none, the cards with the highest weight if that's above the base weight.
+        """
+        pickups = {pickup["cardId"] for pickup in gacha.get("gachaPickups", [])}
+        if pickups:
+            return [card_id in pickups for card_id in self.cards[4]]
+        weights = self.weights[4]
+        if not weights or max(weights) == min(weights):
+            return [False] * len(weights)
+        return [weight == max(weights) for weight in weights]
+
+    def rates(self, reverse: bool = False) -> tuple[float, float]:
+        """(4★ rate, 3★ rate) in percent. Reversed odds swap the 4★ and 2★ rates."""
+        if reverse:
+            return 100 - self.rate4 - self.rate3, self.rate3
+        return self.rate4, self.rate3
+
+    def draw(self, rarity: int, rng=random) -> int:
+        """A card id of this rarity."""
+        return self.cards[rarity][self.samplers[rarity].sample(rng)]
+
+    def ten_pull(self, reverse: bool = False, rng=random) -> list[int]:
+        """
+        Card ids of a ten pull. The 10th pull is a guaranteed 3★ or better if none of
+        the first nine was a 4★ (not with reversed odds).
+        """
+        rate4, rate3 = self.rates(reverse)
+        guaranteed = not reverse
+        result = []
+        for i in range(1, 11):
+            if i == 10 and guaranteed:
+                roll = rng.randint(0, int(rate4 + rate3) * 2) / 2
+            else:
+                roll = rng.randint(0, 100)
+            if roll < rate4:
+                rarity = 4
+                guaranteed = False
+            elif roll < rate4 + rate3:
+                rarity = 3
+            else:
+                rarity = 2
+            result.append(self.draw(rarity, rng))
+        return result
+
+    def simulate(
+        self, ten_pulls: int, reverse: bool = False, rng: np.random.Generator = None
+    ) -> dict:
+        """
+        Statistics of `ten_pulls` ten pulls, rolled all at once with the same odds and
+        guarantee as `ten_pull`:
+
+        - four_stars, four_star_rate: 4★ cards pulled, and the percentage of pulls
+        - distribution: how many ten pulls had 0, 1, ..., 10 4★ cards
+        - guaranteed, guaranteed_four_stars: ten pulls that got to the guaranteed 10th
+          pull, and how many of those it made a 4★
+        - rate_up: rate-up 4★ cards pulled and the mean / median / 90th percentile
+          number of pulls between them (pulls made one after another), or None if the
+          gacha has no rate-up cards
+        """
+        rng = rng or np.random.default_rng()
+        rate4, rate3 = self.rates(reverse)
+        rolls = rng.integers(0, 101, size=(ten_pulls, 10)).astype(np.float64)
+        guaranteed = np.zeros(ten_pulls, dtype=bool)
+        if not reverse:
+            guaranteed = ~(rolls[:, :9] < rate4).any(axis=1)
+            rolls[guaranteed, 9] = (
+                rng.integers(0, int(rate4 + rate3) * 2 + 1, size=guaranteed.sum()) / 2
+            )
+        fours = rolls < rate4
+        per_ten_pull = fours.sum(axis=1)
+
+        stats = {
+            "ten_pulls": ten_pulls,
+            "pulls": ten_pulls * 10,
+            "four_stars": int(per_ten_pull.sum()),
+            "four_star_rate": float(fours.mean() * 100) if ten_pulls else 0.0,
+            "distribution": np.bincount(per_ten_pull, minlength=11).tolist(),
+            "guaranteed": int(guaranteed.sum()),
+            "guaranteed_four_stars": int((guaranteed & fours[:, 9]).sum()),
+            "rate_up": None,
+        }
+
+        rate_up = np.asarray(self.rate_up, dtype=bool)
+        if rate_up.any():
+            hits = np.zeros(fours.shape, dtype=bool)
+            hits[fours] = rate_up[self.samplers[4].sample_many(rng, fours.sum())]
+            # pulls since the previous rate-up card, for every rate-up card pulled
+            waits = np.diff(np.flatnonzero(hits.ravel()) + 1, prepend=0)
+            stats["rate_up"] = {
+                "hits": len(waits),
+                "mean_pulls": float(waits.mean()) if len(waits) else None,
+                "median_pulls": float(np.median(waits)) if len(waits) else None,
+                "p90_pulls": float(np.percentile(waits, 90)) if len(waits) else None,
+            }
+        return stats
+
+
+class GachaIndex:
+    """
+    One region's gachas, cards and character names by id, built once per master data
+    refresh. A gacha's pool is built the first time it's pulled on.
+    """
+
+    def __init__(self, region: str, gachas: list, cards: list, characters: list):
+        self.region = region
+        self.gachas = {gacha["id"]: gacha for gacha in gachas}
+        self.cards = {card["id"]: card for card in cards}
+        self.character_names = {
+            chara["id"]: gacha_character_name(chara, region) for chara in characters
+        }
+        self._pools: dict[int, GachaPool] = {}
+
+    def pool(self, gacha_id: int) -> GachaPool | None:
+        pool = self._pools.get(gacha_id)
+        if pool is None:
+            gacha = self.gachas.get(gacha_id)
+            if gacha is None:
+                return None
+            pool = self._pools[gacha_id] = GachaPool(gacha, self.cards)
+        return pool
@@ -0,0 +1,62 @@
+from sortedcontainers import SortedList
+
+
+class GuessLeaderboard:
+    """
+    Sorted in-memory leaderboard of one guess type, ordered like the SQL it replaces
+    (`ORDER BY success DESC, id ASC`). Ranks and pages are found by bisection, and
+    scores are updated in place (in O(log n)) whenever a user's guess stats change.
+    """
+
+    def __init__(self, rows=()):
+        """rows: (users.id, discord_id, score)"""
+        # (-score, users.id, discord_id), sorted
+        self.entries = SortedList(
+            (-score, row_id, discord_id) for row_id, discord_id, score in rows
+        )
+        # users.id -> its entry
+        self.keys = {entry[1]: entry for entry in self.entries}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def set(self, row_id: int, discord_id: int, score: int) -> None:
+        """Add a user or update their score."""
+        entry = (-score, row_id, discord_id)
+        old = self.keys.get(row_id)
+        if old == entry:
+            return
+        if old:
+            self.entries.remove(old)
+        self.entries.add(entry)
+        self.keys[row_id] = entry
+
+    def rank(self, row_id: int) -> int:
+        """1-based rank of a user, or 0 if they aren't on the leaderboard."""
+        entry = self.keys.get(row_id)
+        if not entry:
+            return 0
+        return self.entries.bisect_left(entry) + 1
+
+    @staticmethod
+    def _record(entry: tuple) -> dict:
+        score, row_id, discord_id = entry
+        return {
+            "id": row_id,
+            "discord_id": discord_id,
+            "success": str(-score),
+            "score": -score,
+        }
+
+    def page(self, page: int, per_page: int = 25) -> list[dict]:
+        start = (page - 1) * per_page
+        return [
+            self._record(entry)
+            for entry in self.entries.islice(start, start + per_page)
+        ]
+
+    def at(self, rank: int) -> dict | None:
+        """The user at a 1-based rank."""
+        if 1 <= rank <= len(self.entries):
+            return self._record(self.entries[rank - 1])
+        return None
@@ -0,0 +1,93 @@
+"""
+Shared in-memory cache of decoded images, for assets that are opened over and over
+(jackets, cards, charts, frames and icons).
+
+The bot and every render worker each have their own copy of the cache, so the memory
+budget is split between them.
+"""
+
+import os, threading
+from collections import OrderedDict
+from io import BytesIO
+
+from PIL import Image
+
+from DATA.helpers.unblock import render_workers
+
+total_bytes = 768 * 1024 * 1024  # decoded pixel data kept in memory, all processes
+max_bytes = total_bytes // (render_workers + 1)  # per process
+
+_lock = threading.Lock()
+# (path, mtime, mode, size, resample) -> decoded image, least recently used first
+_images: OrderedDict[tuple, Image.Image] = OrderedDict()
+_bytes = 0
+
+metrics = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def _nbytes(img: Image.Image) -> int:
+    return img.width * img.height * len(img.getbands())
+
+
+def open_image(
+    path: str | BytesIO,
+    mode: str = None,
+    size: tuple[int, int] = None,
+    resample: int = None,
+    copy: bool = True,
+) -> Image.Image:
+    """
+    `Image.open(path)`, then `.resize(size, resample)` and `.convert(mode)` if given.
+
+    Decoded results are cached by path, modification time, mode, size and resample.
+    Pass `copy=False` only if the image won't be modified (pasting it somewhere else,
+    `np.array`, `split`, ...); otherwise a copy is returned.
+    """
+    global _bytes
+    if not isinstance(path, str):
+        return _load(path, mode, size, resample)
+
+    key = (path, os.path.getmtime(path), mode, size, resample)
+    with _lock:
+        img = _images.get(key)
+        if img is not None:
+            _images.move_to_end(key)
+            metrics["hits"] += 1
+            return img.copy() if copy else img
+        metrics["misses"] += 1
+
+    img = _load(path, mode, size, resample)
+    nbytes = _nbytes(img)
+    if nbytes <= max_bytes:
+        with _lock:
+            if key not in _images:
+                _images[key] = img
+                _bytes += nbytes
+            while _bytes > max_bytes:
+                _, evicted = _images.popitem(last=False)
+                _bytes -= _nbytes(evicted)
+                metrics["evictions"] += 1
+    return img.copy() if copy else img
+
+
+def _load(path, mode, size, resample) -> Image.Image:
+    img = Image.open(path)
+    img.load()
+    if size:
+        img = img.resize(size) if resample is None else img.resize(size, resample)
+    if mode and img.mode != mode:
+        img = img.convert(mode)
+    return img
+
+
+def stats() -> dict:
+    """Hit/miss/eviction counts, plus the number and total size of cached images."""
+    with _lock:
+        return {**metrics, "entries": len(_images), "bytes": _bytes}
+
+
+def clear() -> None:
+    global _bytes
+    with _lock:
+        _images.clear()
+        _bytes = 0
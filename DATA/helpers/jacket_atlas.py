@@ -0,0 +1,167 @@
+"""
+Packed atlas of song jackets pre-resized to the sizes the renders paste them at, so a
+B30 render reads its thumbnails out of one memory-mapped file instead of decoding and
+LANCZOS-resizing every jacket.
+
+There's one atlas per size: `{w}x{h}.json` names the file holding the RGBA thumbnails
+back to back (`{w}x{h}.{generation}.atlas`) and maps each jacket path to [byte offset,
+mtime, file size] (the last two to notice replaced jackets). Only the bot process adds
+jackets (`update`), render workers just read them (`thumbnail`).
+"""
+
+import json, os, threading
+
+import numpy as np
+from PIL import Image
+
+jacket_atlas_path = "DATA/data/jacket_atlas"
+
+max_dead_ratio = 0.25  # compact once this much of an atlas is replaced thumbnails
+
+_lock = threading.Lock()  # one writer at a time
+# (w, h) -> (index mtime, index, memory-mapped atlas)
+_atlases: dict[tuple[int, int], tuple[int, dict, np.memmap]] = {}
+
+
+def _index_file(size: tuple[int, int]) -> str:
+    return os.path.join(jacket_atlas_path, f"{size[0]}x{size[1]}.json")
+
+
+def _atlas_file(size: tuple[int, int], generation: int) -> str:
+    return os.path.join(jacket_atlas_path, f"{size[0]}x{size[1]}.{generation}.atlas")
+
+
+def _source(path: str) -> list[int]:
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _open(size: tuple[int, int]) -> tuple[dict, np.memmap | None]:
+    """The index and mapped pixels of an atlas, mapped again whenever the index changes."""
+    index_file = _index_file(size)
+    try:
+        mtime = os.stat(index_file).st_mtime_ns
+    except OSError:
+        return {}, None
+    cached = _atlases.get(size)
+    if cached and cached[0] == mtime:
+        return cached[1], cached[2]
+    try:
+        with open(index_file, "r", encoding="utf8") as f:
+            index = json.load(f)
+        # thumbnails are written before the index that points at them
+        pixels = np.memmap(
+            _atlas_file(size, index["generation"]), dtype=np.uint8, mode="r"
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}, None
+    _atlases[size] = (mtime, index, pixels)
+    return index, pixels
+
+
+def thumbnail(path: str, size: tuple[int, int]) -> Image.Image | None:
+    """
+    The jacket at path resized to size (RGBA, read-only), or None if the atlas of that
+    size doesn't have it or the jacket changed since it was added.
+    """
+    size = tuple(size)
+    index, pixels = _open(size)
+    entry = index.get("jackets", {}).get(path)
+    if entry is None:
+        return None
+    offset, mtime, file_size = entry
+    try:
+        if _source(path) != [mtime, file_size]:
+            return None
+    except OSError:
+        return None
+    data = pixels[offset : offset + size[0] * size[1] * 4]
+    return Image.frombuffer("RGBA", size, data, "raw", "RGBA", 0, 1)
+
+
+def _compact(size: tuple[int, int], index: dict) -> dict:
+    """
+    Copy the live thumbnails into the atlas' next generation. Workers keep reading the
+    old file (its index points at it) until the new index replaces it.
+    """
+    thumbnail_bytes = size[0] * size[1] * 4
+    generation = index["generation"] + 1
+    jackets = {}
+    with open(_atlas_file(size, index["generation"]), "rb") as old, open(
+        _atlas_file(size, generation), "wb"
+    ) as new:
+        for path, (offset, *source) in sorted(
+            index["jackets"].items(), key=lambda item: item[1][0]
+        ):
+            old.seek(offset)
+            jackets[path] = [new.tell(), *source]
+            new.write(old.read(thumbnail_bytes))
+    return {"generation": generation, "jackets": jackets}
+
+
+def update(paths, size: tuple[int, int]) -> int:
+    """
+    Add the jackets missing from the atlas of this size, or changed since they were
+    added. Returns how many were added.
+
+    Thumbnails are only ever appended (a changed jacket gets a new one), so workers
+    reading the atlas meanwhile never see a half written thumbnail. Once replaced
+    thumbnails take up more than max_dead_ratio of the file, the live ones are copied
+    into a new file and the old one is deleted.
+    """
+    size = tuple(size)
+    thumbnail_bytes = size[0] * size[1] * 4
+    with _lock:
+        index = _open(size)[0]
+        if "jackets" in index:
+            index = {
+                "generation": index["generation"],
+                "jackets": dict(index["jackets"]),
+            }
+        else:
+            index = {"generation": 0, "jackets": {}}
+        jackets = index["jackets"]
+        missing = []
+        for path in dict.fromkeys(paths):
+            if not path:
+                continue
+            try:
+                source = _source(path)
+            except OSError:
+                continue
+            entry = jackets.get(path)
+            if entry is None or entry[1:] != source:
+                missing.append((path, source))
+        if not missing:
+            return 0
+
+        os.makedirs(jacket_atlas_path, exist_ok=True)
+        generation = index["generation"]
+        atlas_file = _atlas_file(size, generation)
+        added = 0
+        with open(atlas_file, "ab") as f:
+            offset = f.seek(0, os.SEEK_END)
+            for path, source in missing:
+                try:
+                    img = Image.open(path)
+                    img.load()
+                    # same result as image_cache.open_image(path, size=size, resample=LANCZOS)
+                    img = img.resize(size, Image.LANCZOS).convert("RGBA")
+                except (OSError, ValueError):
+                    continue
+                offset += f.write(img.tobytes())
+                jackets[path] = [offset - thumbnail_bytes, *source]
+                added += 1
+
+        dead = offset - len(jackets) * thumbnail_bytes
+        if dead > offset * max_dead_ratio:
+            index = _compact(size, index)
+
+        index_file = _index_file(size)
+        tmp = f"{index_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf8") as f:
+            json.dump(index, f)
+        os.replace(tmp, index_file)
+        if index["generation"] != generation:
+            os.remove(atlas_file)  # workers that mapped it keep their mapping
+        return added
@@ -0,0 +1,211 @@
+"""
+Indexes over master data files, so lookups by id, by a foreign key (characterId,
+musicId, ...) or by time don't scan the whole list on every command.
+
+`index(api, file)` builds a file's index the first time it's used and rebuilds it once
+`api.get_master_data(file)` hands out a different list, i.e. after master data reloads.
+"""
+
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
+# (status, field, offset in ms): an event is "going" from startAt, "counting" from
+# aggregateAt until 10 minutes later, then "ended"
+EVENT_PHASES = (
+    ("going", "startAt", 0),
+    ("counting", "aggregateAt", 0),
+    ("ended", "aggregateAt", 600000),
+)
+
+
+class IntervalIndex:
+    """
+    Entries with a start and end time (unix ms), sorted by start, answering which are
+    running at a time, which is next or previous, and when any of that changes.
+
+    phases: (status, field, offset) in time order, the status of an entry from
+    `entry[field] + offset` on (see EVENT_PHASES).
+    """
+
+    def __init__(
+        self,
+        data: list,
+        start: str = "startAt",
+        end: str = "closedAt",
+        phases: tuple = (),
+    ):
+        self.start = start
+        self.end = end
+        self.phases = phases
+        self.entries = sorted(
+            (entry for entry in data if start in entry and end in entry),
+            key=lambda entry: entry[start],
+        )
+        self.starts = [entry[start] for entry in self.entries]
+        # latest end among the entries up to i, to know when to stop looking back
+        self.max_ends = list(accumulate((entry[end] for entry in self.entries), max))
+        self.by_end = sorted(self.entries, key=lambda entry: entry[end])
+        self.ends = [entry[end] for entry in self.by_end]
+
+        # id(entry) -> times its phases start at
+        self.phase_times = {
+            id(entry): [
+                entry[field] + offset if field in entry else None
+                for _, field, offset in phases
+            ]
+            for entry in self.entries
+        }
+        # every time an answer can change
+        boundaries = set(self.starts) | set(self.ends)
+        for times in self.phase_times.values():
+            boundaries.update(time for time in times if time is not None)
+        self.boundaries = sorted(boundaries)
+
+        # (valid from, valid until, current entry)
+        self._current = (0, 0, None)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def overlapping(self, window_start: int, window_end: int) -> list[dict]:
+        """Entries running at some point between window_start and window_end, by start."""
+        found = []
+        i = bisect_left(self.starts, window_end) - 1
+        while i >= 0 and self.max_ends[i] > window_start:
+            if self.entries[i][self.end] > window_start:
+                found.append(self.entries[i])
+            i -= 1
+        found.reverse()
+        return found
+
+    def active(self, now: int) -> list[dict]:
+        """Entries with `start < now < end`, by start."""
+        return [
+            entry for entry in self.overlapping(now, now + 1) if entry[self.start] < now
+        ]
+
+    def current(self, now: int) -> dict | None:
+        """The latest started of the active entries, cached until the next boundary."""
+        valid_from, valid_until, entry = self._current
+        if valid_from <= now < valid_until:
+            return entry
+        active = self.active(now)
+        entry = active[-1] if active else None
+        i = bisect_right(self.boundaries, now)
+        if i and self.boundaries[i - 1] == now:
+            # on a boundary itself (starts and ends are exclusive)
+            self._current = (now, now + 1, entry)
+        else:
+            self._current = (
+                self.boundaries[i - 1] + 1 if i else float("-inf"),
+                self.boundaries[i] if i < len(self.boundaries) else float("inf"),
+                entry,
+            )
+        return entry
+
+    def next(self, now: int) -> dict | None:
+        """The first entry starting after now."""
+        i = bisect_right(self.starts, now)
+        return self.entries[i] if i < len(self.entries) else None
+
+    def previous(self, now: int) -> dict | None:
+        """The entry that most recently ended (at or before now)."""
+        i = bisect_right(self.ends, now)
+        return self.by_end[i - 1] if i else None
+
+    def status(self, entry: dict, now: int) -> str | None:
+        """Status of an entry at now, from phases. None before its first phase."""
+        status = None
+        for (name, _, _), time in zip(self.phases, self.phase_times[id(entry)]):
+            if time is not None and time < now:
+                status = name
+        return status
+
+    def changes_at(self, now: int) -> int | None:
+        """
+        The next time (after now) an entry starts, ends or changes phase, so answers
+        can be kept until then. None if nothing changes anymore.
+        """
+        i = bisect_right(self.boundaries, now)
+        return self.boundaries[i] if i < len(self.boundaries) else None
+
+
+class MasterIndex:
+    """One master data file (a list of entries), indexed by its primary key."""
+
+    def __init__(self, data: list, key: str = "id"):
+        self.data = data
+        self.key = key
+        self._by_key = {entry[key]: entry for entry in data if key in entry}
+        # field -> value -> entries, and name -> derived value, built on first use
+        self._fields: dict[str, dict] = {}
+        self._derived: dict = {}
+        self._intervals: dict[tuple, IntervalIndex] = {}
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def get(self, value, default=None) -> dict | None:
+        """The entry with this primary key."""
+        return self._by_key.get(value, default)
+
+    def where(self, field: str, value) -> list[dict]:
+        """Entries with `entry[field] == value`, in file order."""
+        by_value = self._fields.get(field)
+        if by_value is None:
+            by_value = {}
+            for entry in self.data:
+                if field in entry:
+                    by_value.setdefault(entry[field], []).append(entry)
+            self._fields[field] = by_value
+        return by_value.get(value, [])
+
+    def first(self, field: str, value) -> dict | None:
+        entries = self.where(field, value)
+        return entries[0] if entries else None
+
+    def derived(self, name: str, build):
+        """`build(self.data)`, built once per reload of the file."""
+        if name not in self._derived:
+            self._derived[name] = build(self.data)
+        return self._derived[name]
+
+    def intervals(
+        self, start: str = "startAt", end: str = "closedAt", phases: tuple = ()
+    ) -> IntervalIndex:
+        """The entries as an IntervalIndex, built once per reload of the file."""
+        key = (start, end, phases)
+        intervals = self._intervals.get(key)
+        if intervals is None:
+            intervals = self._intervals[key] = IntervalIndex(
+                self.data, start, end, phases
+            )
+        return intervals
+
+
+# (region, file, key) -> index of the list get_master_data returned for it
+_indexes: dict[tuple, MasterIndex] = {}
+
+
+def index(api, file: str, key: str = "id") -> MasterIndex:
+    """
+    The index of `api.get_master_data(file)`. get_master_data hands out the same list
+    until the file is reloaded, so a different list means the index is stale.
+    """
+    data = api.get_master_data(file)
+    cache_key = (api.app_region, file, key)
+    current = _indexes.get(cache_key)
+    if current is None or current.data is not data:
+        # two threads may both rebuild it, either result is fine
+        current = _indexes[cache_key] = MasterIndex(data, key)
+    return current
+
+
+def events(api) -> IntervalIndex:
+    """A region's events.json by time, with event statuses."""
+    return index(api, "events.json").intervals(phases=EVENT_PHASES)
+
+
+def rank_match_seasons(api) -> IntervalIndex:
+    """A region's rankMatchSeasons.json by time."""
+    return index(api, "rankMatchSeasons.json").intervals()
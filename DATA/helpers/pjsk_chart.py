@@ -2,28 +2,103 @@ import numpy as np
 from PIL import Image
 from io import BytesIO
 
+import os, json, hashlib, threading
+from functools import lru_cache
 
-def mirror(file: str | BytesIO) -> BytesIO:
-    img = Image.open(file)
-    width, height = img.size
 
-    lane_start_x = 80  # Start of lanes
-    lane_width = 192  # Width of each lane
-    lane_spacing = 272  # Distance between lanes
-    lane_height = height - 287  # 287px of info, the chart info
+lane_start_x = 80  # Start of lanes
+lane_width = 192  # Width of each lane
+lane_spacing = 272  # Distance between lanes
+info_height = 287  # 287px of info, the chart info
 
-    img_array = np.array(img)
+chart_strips_path = "DATA/data/chart_strips"
+mirrored_charts_path = "DATA/data/mirrored_charts"
 
-    # for each lane, mirror
+
+def lane_positions(width: int) -> list[int]:
+    """x of every lane that fits in a chart of this width."""
+    positions = []
     for i in range(round((width - lane_start_x) / lane_spacing)):
         lane_x = lane_start_x + (i * lane_spacing)
         if lane_x + lane_width > width:
             break  # Prevent out-of-bounds errors
+        positions.append(lane_x)
+    return positions
+
+
+def lane_strips(file: str | BytesIO) -> tuple[np.ndarray, dict] | tuple[None, None]:
+    """
+    The lanes of a chart PNG as a read-only (lane, y, x, RGB) array memory-mapped
+    from a preprocessed .npy, plus the chart geometry (width, height, lane_height, lanes).
+
+    Charts are split into lanes once and rebuilt when the PNG changes. Charts that
+    aren't files on disk return (None, None).
+    """
+    if not isinstance(file, str):
+        return None, None
+    stat = os.stat(file)
+    name = hashlib.md5(os.path.abspath(file).encode()).hexdigest()
+    strips_file = os.path.join(chart_strips_path, name + ".npy")
+    meta_file = os.path.join(chart_strips_path, name + ".json")
+
+    try:
+        with open(meta_file, "r", encoding="utf8") as f:
+            meta = json.load(f)
+        if meta["mtime"] == stat.st_mtime_ns and meta["size"] == stat.st_size:
+            return np.load(strips_file, mmap_mode="r"), meta
+    except (OSError, ValueError, KeyError):
+        pass
+
+    img_array = np.array(Image.open(file).convert("RGB"))
+    height, width = img_array.shape[:2]
+    lane_height = height - info_height
+    lanes = lane_positions(width)
+    strips = np.stack(
+        [img_array[:lane_height, lane_x : lane_x + lane_width] for lane_x in lanes]
+    )
+    meta = {
+        "mtime": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "width": width,
+        "height": height,
+        "lane_height": lane_height,
+        "lanes": lanes,
+    }
+
+    # Strips first, then the metadata that marks them valid
+    os.makedirs(chart_strips_path, exist_ok=True)
+    tmp = f".{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(strips_file + tmp, "wb") as f:
+        np.save(f, strips)
+    os.replace(strips_file + tmp, strips_file)
+    with open(meta_file + tmp, "w", encoding="utf8") as f:
+        json.dump(meta, f)
+    os.replace(meta_file + tmp, meta_file)
+
+    return np.load(strips_file, mmap_mode="r"), meta
+
 
-        # flip lane horizontally
-        img_array[:lane_height, lane_x : lane_x + lane_width] = np.fliplr(
-            img_array[:lane_height, lane_x : lane_x + lane_width]
-        )
+@lru_cache(maxsize=64)
+def _mirror_columns(width: int) -> np.ndarray:
+    """Column order of a mirrored chart: every lane reversed in place."""
+    columns = np.arange(width)
+    for lane_x in lane_positions(width):
+        lane = slice(lane_x, lane_x + lane_width)
+        columns[lane] = columns[lane][::-1]
+    return columns
+
+
+def mirror(file: str | BytesIO) -> BytesIO:
+    # not through image_cache, mirrored_chart only mirrors each chart once
+    img = Image.open(file)
+    width, height = img.size
+
+    lane_height = height - info_height
+
+    img_array = np.array(img)
+
+    # flip every lane horizontally in one reindex
+    img_array[:lane_height] = img_array[:lane_height, _mirror_columns(width)]
 
     output = Image.fromarray(img_array)
 
@@ -31,3 +106,36 @@ def mirror(file: str | BytesIO) -> BytesIO:
     output.save(result, format="png")
     result.seek(0)
     return result
+
+
+def mirrored_chart(
+    file: str | BytesIO, music_id: int, difficulty: str, region: str
+) -> str | BytesIO:
+    """
+    Path to the mirrored version of a chart, mirrored once and kept on disk until
+    the source chart changes. Charts that aren't files on disk are just mirrored.
+    """
+    if not isinstance(file, str):
+        return mirror(file)
+    prefix = f"{region}_{music_id}_{difficulty}_"
+    path = os.path.join(
+        mirrored_charts_path, f"{prefix}{os.stat(file).st_mtime_ns}.png"
+    )
+    if os.path.exists(path):
+        return path
+
+    os.makedirs(mirrored_charts_path, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(mirror(file).getbuffer())
+    os.replace(tmp, path)
+
+    # mirrors of older versions of this chart
+    for name in os.listdir(mirrored_charts_path):
+        if name.startswith(prefix) and name.endswith(".png"):
+            if os.path.join(mirrored_charts_path, name) != path:
+                try:
+                    os.remove(os.path.join(mirrored_charts_path, name))
+                except OSError:
+                    pass
+    return path
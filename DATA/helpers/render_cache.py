@@ -0,0 +1,211 @@
+"""
+Content-addressed cache of rendered images (B30, progress, summary), in memory with
+spillover to disk, keyed by a hash of everything the render depends on.
+
+The memory tier is only used from the event loop, the disk tier only from threads.
+"""
+
+import asyncio, hashlib, json, os, threading
+from collections import OrderedDict
+from io import BytesIO
+from typing import Awaitable, Callable
+
+render_cache_path = "DATA/data/render_cache"
+
+render_version = 2  # bump when a cached render's drawing code changes
+max_memory_bytes = 64 * 1024 * 1024
+max_disk_bytes = 1024 * 1024 * 1024
+
+# key -> PNG bytes, least recently used first
+_memory: OrderedDict[str, bytes] = OrderedDict()
+_memory_bytes = 0
+# key -> file size, least recently used first. Loaded from the folder on first use.
+_disk: OrderedDict[str, int] | None = None
+_disk_bytes = 0
+_disk_lock = threading.Lock()
+# key -> render in progress, so identical requests share one render
+_pending: dict[str, asyncio.Future] = {}
+
+metrics = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "shared": 0}
+
+
+def key(*parts) -> str:
+    """Cache key of the render inputs (anything json serializable)."""
+    data = json.dumps([render_version, *parts], sort_keys=True, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def _path(key: str) -> str:
+    return os.path.join(render_cache_path, key + ".png")
+
+
+def _load_disk() -> None:
+    global _disk, _disk_bytes
+    _disk = OrderedDict()
+    _disk_bytes = 0
+    if not os.path.exists(render_cache_path):
+        return
+    files = []
+    for name in os.listdir(render_cache_path):
+        if not name.endswith(".png"):
+            continue
+        try:
+            stat = os.stat(os.path.join(render_cache_path, name))
+        except OSError:
+            continue
+        files.append((stat.st_mtime, name[:-4], stat.st_size))
+    for _, file_key, size in sorted(files):
+        _disk[file_key] = size
+        _disk_bytes += size
+
+
+def _remember(key: str, data: bytes) -> list[tuple[str, bytes]]:
+    """Keep a render in memory. Returns the least recently used ones it pushed out."""
+    global _memory_bytes
+    if key in _memory:
+        _memory.move_to_end(key)
+        return []
+    _memory[key] = data
+    _memory_bytes += len(data)
+    evicted = []
+    while _memory_bytes > max_memory_bytes and len(_memory) > 1:
+        old_key, old_data = _memory.popitem(last=False)
+        _memory_bytes -= len(old_data)
+        evicted.append((old_key, old_data))
+    return evicted
+
+
+def _spill(entries: list[tuple[str, bytes]]) -> None:
+    """Write renders pushed out of memory to disk. Blocks, run it in a thread."""
+    global _disk_bytes
+    with _disk_lock:
+        if _disk is None:
+            _load_disk()
+        os.makedirs(render_cache_path, exist_ok=True)
+        for key, data in entries:
+            if key in _disk:
+                _disk.move_to_end(key)
+                continue
+            if len(data) > max_disk_bytes:
+                continue
+            try:
+                with open(_path(key) + ".tmp", "wb") as f:
+                    f.write(data)
+                os.replace(_path(key) + ".tmp", _path(key))
+            except OSError:
+                continue
+            _disk[key] = len(data)
+            _disk_bytes += len(data)
+        while _disk_bytes > max_disk_bytes:
+            old_key, size = _disk.popitem(last=False)
+            _disk_bytes -= size
+            try:
+                os.remove(_path(old_key))
+            except OSError:
+                pass
+
+
+def _read(key: str) -> bytes | None:
+    """The disk copy of a render, if there's one. Blocks, run it in a thread."""
+    global _disk_bytes
+    with _disk_lock:
+        if _disk is None:
+            _load_disk()
+        if key not in _disk:
+            return None
+        try:
+            with open(_path(key), "rb") as f:
+                data = f.read()
+            os.utime(_path(key))
+        except OSError:
+            _disk_bytes -= _disk.pop(key)
+            return None
+        _disk.move_to_end(key)
+        return data
+
+
+async def _keep(key: str, data: bytes) -> None:
+    """Keep a render in memory, spilling the least recently used ones to disk."""
+    evicted = _remember(key, data)
+    if evicted:
+        await asyncio.to_thread(_spill, evicted)
+
+
+async def get(key: str) -> BytesIO | None:
+    data = _memory.get(key)
+    if data is not None:
+        _memory.move_to_end(key)
+        metrics["memory_hits"] += 1
+        return BytesIO(data)
+
+    data = await asyncio.to_thread(_read, key)
+    if data is None:
+        return None
+    # back into memory, the disk copy stays until it's evicted
+    metrics["disk_hits"] += 1
+    await _keep(key, data)
+    return BytesIO(data)
+
+
+async def put(key: str, image: BytesIO) -> None:
+    data = image.getvalue()
+    if data:
+        await _keep(key, data)
+
+
+async def cached(key: str, render: Callable[[], Awaitable[BytesIO]]) -> BytesIO:
+    """
+    The cached render for key, or `await render()` (cached afterwards). Concurrent calls
+    with the same key wait for the same render.
+    """
+    image = await get(key)
+    if image is not None:
+        return image
+
+    pending = _pending.get(key)
+    if pending is not None:
+        metrics["shared"] += 1
+        try:
+            data = await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            if pending.cancelled():  # whoever was rendering gave up, render it here
+                return await cached(key, render)
+            raise
+        return BytesIO(data)
+
+    metrics["misses"] += 1
+    future = asyncio.get_running_loop().create_future()
+    _pending[key] = future
+    try:
+        image = await render()
+        data = image.getvalue()
+        future.set_result(data)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # retrieved, whether or not anyone else was waiting
+        raise
+    finally:
+        _pending.pop(key, None)
+    if data:
+        await _keep(key, data)
+    return BytesIO(data)
+
+
+def stats() -> dict:
+    return {
+        **metrics,
+        "memory_entries": len(_memory),
+        "memory_bytes": _memory_bytes,
+        "disk_entries": len(_disk or ()),
+        "disk_bytes": _disk_bytes,
+    }
+
+
+def clear() -> None:
+    """Forget the renders kept in memory (the disk copies stay)."""
+    global _memory_bytes
+    _memory.clear()
+    _memory_bytes = 0
@@ -0,0 +1,69 @@
+"""
+Disk-backed cache for cutlet romaji transliteration.
+
+Lookups only touch memory, the cache is written to disk by `save`, which the master data
+refresh calls from its thread once it's done.
+"""
+
+import json, os, threading
+from collections import OrderedDict
+
+import cutlet
+
+romaji_cache_path = "DATA/data/cached_romaji.json"
+
+max_entries = 50000  # per mode
+
+_lock = threading.Lock()
+_dirty = False
+
+if not os.path.exists(romaji_cache_path):
+    romaji_cache = {}
+else:
+    try:
+        with open(romaji_cache_path, "r", encoding="utf8") as f:
+            romaji_cache = {
+                mode: OrderedDict(values) for mode, values in json.load(f).items()
+            }
+    except:
+        romaji_cache = {}
+
+
+def save() -> None:
+    """Write the cache to disk if it changed. Blocks, keep it off the event loop."""
+    global _dirty
+    if not _dirty:
+        return
+    with _lock:
+        data = {mode: dict(values) for mode, values in romaji_cache.items()}
+        _dirty = False
+    with open(romaji_cache_path + ".tmp", "w", encoding="utf8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(romaji_cache_path + ".tmp", romaji_cache_path)
+
+
+class CachedCutlet:
+    """
+    Drop-in for `cutlet.Cutlet` where `romaji` results are cached by
+    (mode, input string) and persisted across restarts.
+    """
+
+    def __init__(self, use_foreign_spelling: bool = True):
+        self.katsu = cutlet.Cutlet()
+        self.katsu.use_foreign_spelling = use_foreign_spelling
+        self.mode = "katsu" if use_foreign_spelling else "katsu_foreignless"
+        self.cache: OrderedDict = romaji_cache.setdefault(self.mode, OrderedDict())
+
+    def romaji(self, text: str) -> str:
+        global _dirty
+        with _lock:
+            if text in self.cache:
+                self.cache.move_to_end(text)
+                return self.cache[text]
+        result = self.katsu.romaji(text)
+        with _lock:
+            self.cache[text] = result
+            while len(self.cache) > max_entries:
+                self.cache.popitem(last=False)
+            _dirty = True
+        return result
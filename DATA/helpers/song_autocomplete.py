@@ -0,0 +1,104 @@
+from itertools import islice
+
+
+class SongAutocomplete:
+    """
+    Song title search for autocompletes, built once per master data refresh.
+
+    Titles are normalized up front and indexed by every 1-3 character substring,
+    so a keystroke only looks at titles that can actually contain the input.
+    """
+
+    def __init__(self, titles: dict, aliases: dict | None = None):
+        """
+        titles: display title -> song id (`pjsk._titles`)
+        aliases: song id -> list of custom aliases (`pjsk.custom_title_definitions`)
+        """
+        # (choice name, choice value, lowercase name, lowercase name without spaces, is alias)
+        self.entries = []
+        first_titles = {}
+        for title, song_id in titles.items():
+            first_titles.setdefault(song_id, title)
+            self._add(title, title, title, False)
+        for song_id, song_aliases in (aliases or {}).items():
+            title = first_titles.get(song_id)
+            if not title:
+                continue
+            for alias in song_aliases:
+                self._add(f"{title} ({alias})"[:100], title, alias, True)
+
+        self.ids = list(dict.fromkeys(str(song_id) for song_id in titles.values()))
+
+        self.grams: dict[str, set[int]] = {}
+        for i, (_, _, _, nospace, _) in enumerate(self.entries):
+            for n in range(1, 4):
+                for start in range(len(nospace) - n + 1):
+                    self.grams.setdefault(nospace[start : start + n], set()).add(i)
+
+    def _add(self, name: str, value: str, searched: str, alias: bool):
+        lower = searched.lower()
+        self.entries.append((name, value, lower, lower.replace(" ", ""), alias))
+
+    def _candidates(self, query: str) -> set[int]:
+        if len(query) <= 3:
+            return self.grams.get(query, set())
+        trigrams = sorted(
+            (self.grams.get(query[i : i + 3], set()) for i in range(len(query) - 2)),
+            key=len,
+        )
+        candidates = set(trigrams[0])
+        for trigram in trigrams[1:]:
+            candidates &= trigram
+            if not candidates:
+                break
+        return candidates
+
+    def search(self, current: str, limit: int = 25) -> list[tuple[str, str]]:
+        """
+        (name, value) of the best matching titles. Exact matches come first, then
+        prefix matches, word prefix matches, and any other substring matches.
+        IDs are suggested instead when `current` is a number.
+        """
+        if current.isdigit():
+            return [
+                (song_id, song_id)
+                for song_id in islice((i for i in self.ids if current in i), limit)
+            ]
+
+        lower = current.lower().strip()
+        query = lower.replace(" ", "")
+        if not query:
+            return [
+                (name, value)
+                for name, value, _, _, alias in islice(
+                    (entry for entry in self.entries if not entry[4]), limit
+                )
+            ]
+
+        ranked = []
+        for i in self._candidates(query):
+            name, value, entry_lower, nospace, alias = self.entries[i]
+            if query not in nospace or name.isdigit():
+                continue
+            if nospace == query:
+                tier = 0
+            elif nospace.startswith(query):
+                tier = 1
+            elif (" " + entry_lower).find(" " + lower) != -1:
+                tier = 2
+            else:
+                tier = 3
+            ranked.append((tier, alias, i))
+        ranked.sort()
+
+        results = []
+        seen = set()
+        for _, _, i in ranked:
+            name, value = self.entries[i][:2]
+            if name in seen:
+                continue
+            seen.add(name)
+            results.append((name, value))
+            if len(results) >= limit:
+                break
+        return results
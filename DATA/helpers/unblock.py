@@ -2,9 +2,12 @@
 Run blocking operations safely.
 """
 
-import asyncio
+import asyncio, os, signal
 from typing import Callable, Any
 from concurrent.futures import ThreadPoolExecutor
+import multiprocessing
+from multiprocessing import reduction
+from multiprocessing.connection import Connection
 import threading
 
 executor = ThreadPoolExecutor(max_workers=64)
@@ -43,3 +46,235 @@ async def to_process_with_timeout(
         raise TimeoutError(
             f"Function {func.__name__} timed out after {timeout} seconds"
         )
+
+
+render_workers = max(1, min(4, (os.cpu_count() or 2) - 1))
+render_queue_size = 32  # renders waiting for a worker before new ones are refused
+
+
+class RenderQueueFull(Exception):
+    """Too many renders are already waiting for a render worker."""
+
+
+def _render_worker_main(conn, warmups: list[Callable]) -> None:
+    for warmup in warmups:
+        try:
+            warmup()
+        except Exception:
+            pass
+    while True:
+        try:
+            func, args, kwargs = conn.recv()
+        except (EOFError, OSError):
+            return
+        try:
+            result = (True, func(*args, **kwargs))
+        except Exception as e:
+            result = (False, e)
+        try:
+            conn.send(result)
+        except Exception as e:  # unpicklable result or exception
+            conn.send((False, RuntimeError(f"{type(e).__name__}: {e}")))
+
+
+def _render_parent_main(conn, bot_conn, warmups: list[Callable]) -> None:
+    """
+    Fork a render worker whenever asked, then send back its end of a pipe and its pid.
+    This process never starts a thread, so its forks can't inherit a held lock.
+    """
+    bot_conn.close()  # so the pipe closes once the bot's end does
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)  # exited workers are reaped by the OS
+    while True:
+        try:
+            conn.recv()
+        except (EOFError, OSError):
+            return
+        parent_conn, child_conn = multiprocessing.Pipe()
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+            conn.close()
+            parent_conn.close()
+            try:
+                _render_worker_main(child_conn, warmups)
+            finally:
+                os._exit(0)
+        child_conn.close()
+        reduction.send_handle(conn, parent_conn.fileno(), None)
+        parent_conn.close()
+        conn.send(pid)
+
+
+class _RenderWorker:
+    """One long lived render process, fed jobs over a pipe."""
+
+    def __init__(self, conn: Connection, pid: int):
+        self.conn = conn
+        self.pid = pid
+
+    def run(self, func: Callable, args: tuple, kwargs: dict) -> tuple[bool, Any]:
+        """(True, result) or (False, the exception the job raised)"""
+        self.conn.send((func, args, kwargs))
+        return self.conn.recv()
+
+    def kill(self) -> None:
+        try:
+            os.kill(self.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        self.conn.close()
+
+
+class RenderPool:
+    """
+    Warm worker processes for CPU heavy image renders, so they don't hold the GIL
+    the event loop needs.
+
+    Jobs must be picklable: a module level function and plain data arguments.
+    Workers aren't forked from the bot, whose threads may be holding locks (caches,
+    logging) a forked copy would never release, but from a parent process that
+    `start` forks before the bot starts any thread. Register the warmups (fonts,
+    static assets) before that, every worker runs them before its first job.
+
+    Workers are started on first use. A job that runs past its timeout (or whose
+    caller gives up on it) has its worker killed and replaced, in the executor rather
+    than on the event loop. At most `queue_size` jobs wait for a free worker, past
+    that `RenderQueueFull` is raised instead of queueing.
+    """
+
+    def __init__(self, workers: int, queue_size: int):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.warmups: list[Callable] = []
+        self.parent: multiprocessing.Process | None = None
+        self.parent_conn: Connection | None = None
+        self.parent_lock = threading.Lock()
+        self.idle: asyncio.Queue | None = None
+        self.starting: asyncio.Future | None = None
+        self.waiting = 0
+
+    def add_warmup(self, func: Callable) -> None:
+        """Run func in every render worker when it starts."""
+        if func not in self.warmups:
+            self.warmups.append(func)
+
+    def start(self) -> None:
+        """Fork the workers' parent process. Call it before any thread is started."""
+        if self.parent is not None:
+            return
+        self.parent_conn, child_conn = multiprocessing.Pipe()
+        self.parent = _render_context.Process(
+            target=_render_parent_main,
+            args=(child_conn, self.parent_conn, list(self.warmups)),
+            daemon=True,
+        )
+        self.parent.start()
+        child_conn.close()
+
+    def _new_worker(self) -> _RenderWorker:
+        with self.parent_lock:
+            if self.parent is None:  # start wasn't called, fork it from here after all
+                self.start()
+            self.parent_conn.send(None)
+            conn = Connection(reduction.recv_handle(self.parent_conn))
+            return _RenderWorker(conn, self.parent_conn.recv())
+
+    def _restart(self, worker: _RenderWorker | None) -> _RenderWorker:
+        if worker is not None:
+            worker.kill()
+        return self._new_worker()
+
+    async def _start_workers(self) -> None:
+        loop = asyncio.get_running_loop()
+        workers = await asyncio.gather(
+            *(
+                loop.run_in_executor(executor, self._new_worker)
+                for _ in range(self.workers)
+            )
+        )
+        self.idle = asyncio.Queue()
+        for worker in workers:
+            self.idle.put_nowait(worker)
+
+    async def run(
+        self, func: Callable, *args: Any, timeout: int = 20, **kwargs: Any
+    ) -> Any:
+        if self.idle is None:
+            if self.starting is None or self.starting.done():
+                self.starting = asyncio.ensure_future(self._start_workers())
+            await asyncio.shield(self.starting)
+        if self.idle.empty() and self.waiting >= self.queue_size:
+            raise RenderQueueFull(
+                "Too many images are being generated right now, try again in a few seconds."
+            )
+        self.waiting += 1
+        try:
+            worker = await self.idle.get()
+        finally:
+            self.waiting -= 1
+
+        loop = asyncio.get_running_loop()
+        finished = False
+        try:
+            ok, result = await asyncio.wait_for(
+                loop.run_in_executor(executor, worker.run, func, args, kwargs),
+                timeout,
+            )
+            finished = True
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Function {func.__name__} timed out after {timeout} seconds"
+            )
+        finally:
+            if finished:
+                self.idle.put_nowait(worker)
+            else:  # timed out, cancelled or the worker died mid job
+                self._replace(worker)
+        if not ok:
+            raise result
+        return result
+
+    def _replace(self, worker: _RenderWorker | None) -> None:
+        """Kill worker and start a new one in the executor, queued once it's ready."""
+        loop = asyncio.get_running_loop()
+        idle = self.idle
+        future = loop.run_in_executor(executor, self._restart, worker)
+
+        def replaced(future: asyncio.Future) -> None:
+            if future.exception() is not None:
+                print(f"Couldn't start a render worker: {future.exception()!r}")
+                if self.idle is idle:
+                    loop.call_later(5, self._replace, None)
+            elif self.idle is idle:
+                idle.put_nowait(future.result())
+            else:  # shut down meanwhile
+                future.result().kill()
+
+        future.add_done_callback(replaced)
+
+    def shutdown(self) -> None:
+        if self.idle is not None:
+            while not self.idle.empty():
+                self.idle.get_nowait().kill()
+            self.idle = None
+        if self.parent is not None:
+            self.parent_conn.close()  # the parent exits once its pipe closes
+            self.parent.join()
+            self.parent = None
+
+
+_render_context = multiprocessing.get_context("fork")
+render_pool = RenderPool(render_workers, render_queue_size)
+
+
+async def to_render_process(
+    func: Callable, *args: Any, timeout: int = 20, **kwargs: Any
+) -> Any:
+    """
+    Runs a picklable render job on the render process pool with a timeout option.
+
+    Raises:
+    - TimeoutError: If the job does not complete within the timeout. Its worker is killed.
+    - RenderQueueFull: If too many jobs are already waiting for a worker.
+    """
+    return await render_pool.run(func, *args, timeout=timeout, **kwargs)
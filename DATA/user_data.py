@@ -1,4 +1,6 @@
-import time, json, datetime, math
+import time, json, datetime, math, copy, asyncio
+
+from collections import OrderedDict
 
 from typing import List, Dict, Any
 
@@ -6,6 +8,7 @@ import asyncpg
 
 from DATA.helpers.caseinsensitivedict import CaseInsensitiveDict
 from DATA.helpers.user_cache import get_user_name_from_id
+from DATA.helpers.guess_leaderboard import GuessLeaderboard
 
 
 class USER_DATA:
@@ -110,11 +113,16 @@ class USER_DATA:
 
         async with self.db.acquire() as conn:
             # Update the 'blacklisted' field to True for the user
-            await conn.execute(
-                "UPDATE users SET blacklisted = $1 WHERE twitch_id = $2",
+            discord_ids = await conn.fetch(
+                "UPDATE users SET blacklisted = $1 WHERE twitch_id = $2 RETURNING discord_id",
                 True,
                 twitch_id,
             )
+        if self.discord:
+            # the row may also belong to a Discord user
+            for row in discord_ids:
+                if row["discord_id"] is not None:
+                    self.discord.invalidate_profile(row["discord_id"])
 
         return user
 
@@ -160,11 +168,16 @@ class USER_DATA:
 
         async with self.db.acquire() as conn:
             # Update the 'blacklisted' field to False for the user
-            await conn.execute(
-                "UPDATE users SET blacklisted = $1 WHERE twitch_id = $2",
+            discord_ids = await conn.fetch(
+                "UPDATE users SET blacklisted = $1 WHERE twitch_id = $2 RETURNING discord_id",
                 False,
                 twitch_id,
             )
+        if self.discord:
+            # the row may also belong to a Discord user
+            for row in discord_ids:
+                if row["discord_id"] is not None:
+                    self.discord.invalidate_profile(row["discord_id"])
 
         return user
 
@@ -578,23 +591,132 @@ class USER_DATA:
                 "mirror_charts_by_default": False,
                 "default_difficulty": "master",
             }
+            self.GUESS_STAT_DEFAULTS = {
+                "fail": 0,
+                "success": 0,
+                "ragequit": 0,
+                "hint": 0,
+            }
 
-        async def verify_discord_user(self, user_id: int):
+            # discord_id -> (time cached, users row), least recently used first.
+            # Assumes this process is the only writer of users (every write here updates
+            # or invalidates the cached row), anything else is picked up after the TTL.
+            self.profiles: OrderedDict[int, tuple[float, dict]] = OrderedDict()
+            self.profile_ttl = 60  # seconds
+            self.max_profiles = 10000
+
+            # guess type -> leaderboard, loaded on first use
+            self.leaderboards: dict[str, GuessLeaderboard] = {}
+            self._leaderboard_loads: dict[str, asyncio.Future] = {}
+            # score changes made while a leaderboard is loading, applied once loaded
+            self._leaderboard_pending: dict[str, dict[int, tuple[int, int]]] = {}
+
+        def _cache_profile(self, user_id: int, row, cached_at: float = None) -> dict:
+            """Store a users row (JSONB columns decoded) as the user's cached profile."""
+            if row is None:
+                self.profiles.pop(user_id, None)
+                return None
+            profile = dict(row)
+            for column in ("displays", "guess_stats", "settings", "achievements"):
+                if isinstance(profile.get(column), str):
+                    profile[column] = json.loads(profile[column])
+            self.profiles[user_id] = (cached_at or time.monotonic(), profile)
+            self.profiles.move_to_end(user_id)
+            while len(self.profiles) > self.max_profiles:
+                self.profiles.popitem(last=False)
+            return profile
+
+        def invalidate_profile(self, user_id: int = None) -> None:
+            """Forget a cached profile (or all of them), e.g. after editing users elsewhere."""
+            if user_id is None:
+                self.profiles.clear()
+            else:
+                self.profiles.pop(user_id, None)
+
+        async def get_profile(self, user_id: int) -> dict:
+            """
+            The user's row in users, created if missing. Served from memory while cached,
+            and kept up to date by every write in this class. Don't mutate it.
+            """
+            cached = self.profiles.get(user_id)
+            if cached and cached[0] + self.profile_ttl > time.monotonic():
+                self.profiles.move_to_end(user_id)
+                return cached[1]
+            started = time.monotonic()
             async with self.db.acquire() as conn:
                 row = await conn.fetchrow(
                     "SELECT * FROM users WHERE discord_id = $1", user_id
                 )
-                if row:
-                    pass
-                else:
+                if not row:
                     # If user does not exist, insert a new user with the display data
-                    await conn.execute(
+                    row = await conn.fetchrow(
                         """
                         INSERT INTO users (discord_id) 
                         VALUES ($1)
+                        RETURNING *
                         """,
                         user_id,
                     )
+            cached = self.profiles.get(user_id)
+            if cached and cached[0] >= started:
+                # Written while we were reading, that row is newer
+                return cached[1]
+            return self._cache_profile(user_id, row, started)
+
+        async def verify_discord_user(self, user_id: int):
+            await self.get_profile(user_id)
+
+        async def _load_leaderboard(self, guess_type: str) -> GuessLeaderboard:
+            pending = self._leaderboard_pending.setdefault(guess_type, {})
+            try:
+                rows = await self.db.fetch(
+                    """
+                    SELECT id, discord_id,
+                        COALESCE(CAST(guess_stats->$1->>'success' AS INT), 0) AS score
+                    FROM users
+                    WHERE guess_stats ? $1
+                    """,
+                    guess_type,
+                )
+                leaderboard = GuessLeaderboard(
+                    (row["id"], row["discord_id"], row["score"]) for row in rows
+                )
+                for row_id, (discord_id, score) in pending.items():
+                    leaderboard.set(row_id, discord_id, score)
+                self.leaderboards[guess_type] = leaderboard
+                return leaderboard
+            finally:
+                self._leaderboard_pending.pop(guess_type, None)
+                self._leaderboard_loads.pop(guess_type, None)
+
+        async def get_leaderboard(self, guess_type: str) -> GuessLeaderboard:
+            """The guess_type leaderboard, loaded from the database once and then kept up to date."""
+            leaderboard = self.leaderboards.get(guess_type)
+            if leaderboard is not None:
+                return leaderboard
+            if guess_type not in self._leaderboard_loads:
+                self._leaderboard_loads[guess_type] = asyncio.ensure_future(
+                    self._load_leaderboard(guess_type)
+                )
+            return await asyncio.shield(self._leaderboard_loads[guess_type])
+
+        def _update_leaderboard(self, profile: dict, guess_type: str) -> None:
+            """Move a user on the guess_type leaderboard after their stats changed."""
+            if not profile or not profile["guess_stats"]:
+                return
+            stats = profile["guess_stats"].get(guess_type)
+            if stats is None:
+                return
+            score = int(stats.get("success") or 0)
+            if guess_type in self.leaderboards:
+                self.leaderboards[guess_type].set(
+                    profile["id"], profile["discord_id"], score
+                )
+            elif guess_type in self._leaderboard_pending:
+                self._leaderboard_pending[guess_type][profile["id"]] = (
+                    profile["discord_id"],
+                    score,
+                )
 
         async def verify_discord_guild(self, guild_id: int):
             async with self.db.acquire() as conn:
@@ -616,73 +738,59 @@ class USER_DATA:
         async def update_pjsk_id(self, user_id: int, pjsk_id: int, region: str):
             await self.verify_discord_user(user_id)
             async with self.db.acquire() as conn:
-                await conn.execute(
+                row = await conn.fetchrow(
                     f"""
                     UPDATE users
                     SET pjsk_id_{region} = $1
                     WHERE discord_id = $2
+                    RETURNING *
                     """,
                     pjsk_id,
                     user_id,
                 )
+            self._cache_profile(user_id, row)
 
         async def remove_pjsk_id(self, user_id: int, region: str):
             await self.verify_discord_user(user_id)
             async with self.db.acquire() as conn:
-                await conn.execute(
+                row = await conn.fetchrow(
                     f"""
                     UPDATE users
                     SET pjsk_id_{region} = $1
                     WHERE discord_id = $2
+                    RETURNING *
                     """,
                     None,
                     user_id,
                 )
+            self._cache_profile(user_id, row)
 
         async def set_banned(self, user_id: int, blacklisted: bool) -> None:
             await self.verify_discord_user(user_id)
             async with self.db.acquire() as conn:
-                await conn.execute(
+                row = await conn.fetchrow(
                     """
                     UPDATE users
                     SET blacklisted = $1
                     WHERE discord_id = $2
+                    RETURNING *
                     """,
                     blacklisted,
                     user_id,
                 )
+            self._cache_profile(user_id, row)
 
         async def get_banned(self, user_id: int) -> bool:
-            await self.verify_discord_user(user_id)
-            async with self.db.acquire() as conn:
-                result = await conn.fetchrow(
-                    f"""
-                    SELECT blacklisted
-                    FROM users
-                    WHERE discord_id = $1
-                    """,
-                    user_id,
-                )
-                return (
-                    result["blacklisted"] if result and result["blacklisted"] else False
-                )
+            result = await self.get_profile(user_id)
+            return result["blacklisted"] if result and result["blacklisted"] else False
 
         async def get_pjsk_id(self, user_id: int, region: str) -> int | None:
-            await self.verify_discord_user(user_id)
-            async with self.db.acquire() as conn:
-                result = await conn.fetchrow(
-                    f"""
-                    SELECT pjsk_id_{region}
-                    FROM users
-                    WHERE discord_id = $1
-                    """,
-                    user_id,
-                )
-                return (
-                    result["pjsk_id_" + region]
-                    if result and result["pjsk_id_" + region]
-                    else None
-                )
+            result = await self.get_profile(user_id)
+            return (
+                result["pjsk_id_" + region]
+                if result and result["pjsk_id_" + region]
+                else None
+            )
 
         async def get_discord_user_id_from_pjsk_id(
             self, pjsk_id: int, region: str
@@ -700,89 +808,53 @@ class USER_DATA:
                 return result["discord_id"] if result else None
 
         async def get_guesses(self, user_id: int, key: str = None) -> dict:
-            await self.verify_discord_user(user_id)
-            async with self.db.acquire() as conn:
-                result = await conn.fetchrow(
-                    f"""
-                    SELECT guess_stats
-                    FROM users
-                    WHERE discord_id = $1
-                    """,
-                    user_id,
-                )
-                stuff = (
-                    json.loads(result["guess_stats"])
-                    if result and result["guess_stats"]
-                    else {}
-                )
-                return (
-                    stuff.get(key, {"fail": 0, "success": 0, "ragequit": 0, "hint": 0})
-                    if key
-                    else stuff
-                )
+            result = await self.get_profile(user_id)
+            stuff = copy.deepcopy(result["guess_stats"]) if result else None
+            stuff = stuff or {}
+            return stuff.get(key, dict(self.GUESS_STAT_DEFAULTS)) if key else stuff
 
         async def get_settings(self, user_id: int, key: str = None) -> dict | Any:
-            await self.verify_discord_user(user_id)
-            async with self.db.acquire() as conn:
-                assert key in self.SETTING_DEFAULTS or key == None
-                if key:
-                    key = key.lower().strip()
-                result = await conn.fetchrow(
-                    f"""
-                    SELECT settings
-                    FROM users
-                    WHERE discord_id = $1
-                    """,
-                    user_id,
-                )
-                stuff = (
-                    json.loads(result["settings"])
-                    if result and result["settings"]
-                    else {}
-                )
-                return (
-                    stuff.get(key, self.SETTING_DEFAULTS[key])
-                    if key
-                    else {
-                        key: stuff.get(key, value)
-                        for key, value in self.SETTING_DEFAULTS.items()
-                    }
-                )
+            assert key in self.SETTING_DEFAULTS or key == None
+            if key:
+                key = key.lower().strip()
+            result = await self.get_profile(user_id)
+            stuff = (result["settings"] if result else None) or {}
+            return (
+                stuff.get(key, self.SETTING_DEFAULTS[key])
+                if key
+                else {
+                    key: stuff.get(key, value)
+                    for key, value in self.SETTING_DEFAULTS.items()
+                }
+            )
 
         async def change_settings(self, user_id: int, key: str, value) -> dict:
             await self.verify_discord_user(user_id)
+            key = key.lower().strip()
+            assert key in self.SETTING_DEFAULTS
             async with self.db.acquire() as conn:
-                key = key.lower().strip()
-                assert key in self.SETTING_DEFAULTS
-                result = await conn.fetchrow(
-                    f"""
-                    SELECT settings
-                    FROM users
-                    WHERE discord_id = $1
-                    """,
-                    user_id,
-                )
-                stuff = (
-                    json.loads(result["settings"])
-                    if result and result["settings"]
-                    else {}
-                )
-                stuff[key] = value
-
-                for key, value in stuff.copy().items():
-                    if key not in self.SETTING_DEFAULTS.keys():
-                        stuff.pop(key, 0)
-
-                await conn.execute(
+                # Set the key and drop unknown settings in one statement
+                row = await conn.fetchrow(
                     """
                     UPDATE users
-                    SET settings = $1
-                    WHERE discord_id = $2
+                    SET settings = (
+                        SELECT COALESCE(jsonb_object_agg(k, v), '{}'::jsonb)
+                        FROM jsonb_each(
+                            COALESCE(settings, '{}'::jsonb)
+                            || jsonb_build_object($2::text, $3::jsonb)
+                        ) AS setting(k, v)
+                        WHERE k = ANY($4::text[])
+                    )
+                    WHERE discord_id = $1
+                    RETURNING *
                     """,
-                    json.dumps(stuff),
                     user_id,
+                    key,
+                    json.dumps(value),
+                    list(self.SETTING_DEFAULTS.keys()),
                 )
-                return stuff
+            profile = self._cache_profile(user_id, row)
+            return dict(profile["settings"]) if profile else {key: value}
 
         async def add_guesses(
             self, user_id: int, key: str, stat: str, return_all: bool = False
@@ -790,117 +862,70 @@ class USER_DATA:
             await self.verify_discord_user(user_id)
 
             async with self.db.acquire() as conn:
-                # Fetch the current guess_stats from the database
-                result = await conn.fetchrow(
-                    """
-                    SELECT guess_stats
-                    FROM users
-                    WHERE discord_id = $1
-                    """,
-                    user_id,
-                )
-
-                # If no result, initialize an empty dict
-                guess_stats = (
-                    json.loads(result["guess_stats"])
-                    if result and result["guess_stats"]
-                    else {}
-                )
-
-                # Check if the key exists, if not, create it with default values
-                if key not in guess_stats:
-                    guess_stats[key] = {
-                        "fail": 0,
-                        "success": 0,
-                        "ragequit": 0,
-                        "hint": 0,
-                    }
-
-                # Increment the specified stat for the key
-                if stat in guess_stats[key]:
-                    guess_stats[key][stat] += 1  # Or any other logic for incrementing
-
-                # Update the guess_stats column with the modified data
-                await conn.execute(
+                # Create the key with default values if needed and increment the
+                # stat server side, so parallel guesses can't lose increments
+                row = await conn.fetchrow(
                     """
                     UPDATE users
-                    SET guess_stats = $1
-                    WHERE discord_id = $2
+                    SET guess_stats = jsonb_set(
+                        COALESCE(guess_stats, '{}'::jsonb),
+                        ARRAY[$2::text],
+                        $4::jsonb
+                        || COALESCE(guess_stats->($2::text), '{}'::jsonb)
+                        || CASE WHEN $3::text IS NULL THEN '{}'::jsonb
+                        ELSE jsonb_build_object(
+                            $3::text,
+                            COALESCE((guess_stats->($2::text)->>($3::text))::int, 0) + 1
+                        ) END
+                    )
+                    WHERE discord_id = $1
+                    RETURNING *
                     """,
-                    json.dumps(guess_stats),
                     user_id,
+                    key,
+                    stat if stat in self.GUESS_STAT_DEFAULTS else None,
+                    json.dumps(self.GUESS_STAT_DEFAULTS),
                 )
-
-                if return_all:
-                    data = {
-                        "fail": 0,
-                        "success": 0,
-                        "ragequit": 0,
-                        "hint": 0,
-                    }
-                    for value in guess_stats.values():
-                        data["fail"] += value["fail"]
-                        data["success"] += value["success"]
-                        data["ragequit"] += value["ragequit"]
-                        data["hint"] += value["hint"]
-                    return data
-                return guess_stats[key]
+            profile = self._cache_profile(user_id, row)
+            self._update_leaderboard(profile, key)
+            guess_stats = (profile["guess_stats"] if profile else None) or {}
+
+            if return_all:
+                data = dict(self.GUESS_STAT_DEFAULTS)
+                for value in guess_stats.values():
+                    for name in data:
+                        data[name] += value.get(name, 0)
+                return data
+            return dict(guess_stats.get(key, self.GUESS_STAT_DEFAULTS))
 
         async def reset_guesses(self, user_id: int, key: str, stat: str = None) -> dict:
             await self.verify_discord_user(user_id)
+            assert stat in [None, "fail", "success", "ragequit", "hint"]
 
             async with self.db.acquire() as conn:
-                # Fetch the current guess_stats from the database
-                result = await conn.fetchrow(
-                    """
-                    SELECT guess_stats
-                    FROM users
-                    WHERE discord_id = $1
-                    """,
-                    user_id,
-                )
-
-                # If no result, initialize an empty dict
-                guess_stats = (
-                    json.loads(result["guess_stats"])
-                    if result and result["guess_stats"]
-                    else {}
-                )
-
-                # Check if the key exists, if not, create it with default values
-                if key not in guess_stats:
-                    guess_stats[key] = {
-                        "fail": 0,
-                        "success": 0,
-                        "ragequit": 0,
-                        "hint": 0,
-                    }
-
-                assert stat in [None, "fail", "success", "ragequit", "hint"]
-
-                if stat:
-                    if stat in guess_stats[key]:
-                        guess_stats[key][stat] = 0
-                    else:
-                        guess_stats[key] = {
-                            "fail": 0,
-                            "success": 0,
-                            "ragequit": 0,
-                            "hint": 0,
-                        }
-
-                # Update the guess_stats column with the modified data
-                await conn.execute(
+                # Create the key with default values if needed, then zero the stat
+                row = await conn.fetchrow(
                     """
                     UPDATE users
-                    SET guess_stats = $1
-                    WHERE discord_id = $2
+                    SET guess_stats = jsonb_set(
+                        COALESCE(guess_stats, '{}'::jsonb),
+                        ARRAY[$2::text],
+                        $3::jsonb
+                        || COALESCE(guess_stats->($2::text), '{}'::jsonb)
+                        || $4::jsonb
+                    )
+                    WHERE discord_id = $1
+                    RETURNING *
                     """,
-                    json.dumps(guess_stats),
                     user_id,
+                    key,
+                    json.dumps(self.GUESS_STAT_DEFAULTS),
+                    json.dumps({stat: 0} if stat else {}),
                 )
-
-                return guess_stats[key]
+            profile = self._cache_profile(user_id, row)
+            self._update_leaderboard(profile, key)
+            guess_stats = (profile["guess_stats"] if profile else None) or {}
+            return dict(guess_stats.get(key, self.GUESS_STAT_DEFAULTS))
 
         async def get_guesses_position(self, guess_type: str, user_id: int):
             """
@@ -908,46 +933,18 @@ class USER_DATA:
             """
             per_page = 25
 
-            # Construct the query for getting the leaderboard position and stats in a single query
-            query = f"""
-            WITH user_stats AS (
-                SELECT 
-                    discord_id,
-                    COALESCE(CAST(guess_stats->'{guess_type}'->>'success' AS INT), 0) AS success,
-                    COALESCE(CAST(guess_stats->'{guess_type}'->>'fail' AS INT), 0) AS fail
-                FROM users
-                WHERE discord_id = $1
-            ),
-            leaderboard AS (
-                SELECT 
-                    discord_id,
-                    CAST(guess_stats->'{guess_type}'->>'success' AS INT) AS score,
-                    ROW_NUMBER() OVER (
-                        ORDER BY CAST(guess_stats->'{guess_type}'->>'success' AS INT) DESC, id
-                    ) AS rank
-                FROM users
-                WHERE guess_stats ? $2
-            )
-            SELECT 
-                COALESCE(user_stats.success + user_stats.fail, 0) AS total_guesses,
-                COALESCE(leaderboard.rank, 0) AS user_position
-            FROM user_stats
-            LEFT JOIN leaderboard ON leaderboard.discord_id = user_stats.discord_id
-            """
-
-            user_result = await self.db.fetchrow(query, user_id, guess_type)
+            leaderboard = await self.get_leaderboard(guess_type)
+            profile = await self.get_profile(user_id)
+            guess_stats = (profile["guess_stats"] if profile else None) or {}
+            stats = guess_stats.get(guess_type, {})
 
-            if user_result:
-                total_guesses = user_result["total_guesses"]
-                if total_guesses == 0:
-                    user_position = 0
-                    user_page = 0
-                else:
-                    user_position = user_result["user_position"]
-                    user_page = (user_position + per_page - 1) // per_page
-            else:
+            total_guesses = stats.get("success", 0) + stats.get("fail", 0)
+            if total_guesses == 0:
                 user_position = 0
                 user_page = 0
+            else:
+                user_position = leaderboard.rank(profile["id"])
+                user_page = (user_position + per_page - 1) // per_page
 
             return user_position, user_page
 
@@ -959,65 +956,32 @@ class USER_DATA:
             """
             per_page = 25
 
-            # Fetch total number of users with the specified guess_type
-            total_result = await self.db.fetchval(
-                """
-                SELECT COUNT(*)
-                FROM users
-                WHERE guess_stats ? $1
-                """,
-                guess_type,
-            )
+            leaderboard = await self.get_leaderboard(guess_type)
             total_pages = (
-                total_result + per_page - 1
+                len(leaderboard) + per_page - 1
             ) // per_page  # Calculate total pages
 
             # Validate page number against total_pages
             if page > total_pages and total_pages > 0:
                 page = total_pages  # Adjust to the last valid page
 
-            # Fetch leaderboard data for the current page
-            leaderboard = await self.db.fetch(
-                f"""
-                SELECT id, discord_id, 
-                    guess_stats->'{guess_type}'->>'success' AS success,
-                    CAST(guess_stats->'{guess_type}'->>'success' AS INT) AS score
-                FROM users
-                WHERE guess_stats ? $1
-                ORDER BY score DESC, id ASC
-                LIMIT $2 OFFSET $3
-                """,
-                guess_type,
-                per_page,
-                (page - 1) * per_page,
-            )
-
             user_position, user_page = await self.get_guesses_position(
                 guess_type, user_id
             )
 
-            return leaderboard, user_position, user_page, total_pages
+            return (
+                leaderboard.page(page, per_page),
+                user_position,
+                user_page,
+                total_pages,
+            )
 
         async def get_guesses_at_rank(self, guess_type: str, rank: int):
             """
             Fetch the user at a specific rank for the given guess_type.
             """
-            # Fetch leaderboard data for the user at the specific rank
-            leaderboard_at_rank = await self.db.fetchrow(
-                f"""
-                SELECT id, discord_id, 
-                    guess_stats->'{guess_type}'->>'success' AS success,
-                    CAST(guess_stats->'{guess_type}'->>'success' AS INT) AS score
-                FROM users
-                WHERE guess_stats ? $1
-                ORDER BY score DESC, id ASC
-                OFFSET $2 LIMIT 1
-                """,
-                guess_type,
-                (rank - 1),  # OFFSET is zero-based
-            )
-
-            return leaderboard_at_rank
+            leaderboard = await self.get_leaderboard(guess_type)
+            return leaderboard.at(rank)
 
         async def add_currency(self, user_id: int, amount: int) -> int:
             """Add (or subtract) currency and return the new balance."""
@@ -1028,83 +992,57 @@ class USER_DATA:
                     UPDATE users
                     SET currency = currency + $1
                     WHERE discord_id = $2
-                    RETURNING currency;
+                    RETURNING *;
                     """,
                     amount,
                     user_id,
                 )
-                return result["currency"] if result else 0
+            self._cache_profile(user_id, result)
+            return result["currency"] if result else 0
 
         async def get_currency(self, user_id: int) -> int:
             """Get the user's current currency balance."""
-            await self.verify_discord_user(user_id)
-            async with self.db.acquire() as conn:
-                result = await conn.fetchrow(
-                    """
-                    SELECT currency
-                    FROM users
-                    WHERE discord_id = $1;
-                    """,
-                    user_id,
-                )
-                return result["currency"] if result else 0
+            result = await self.get_profile(user_id)
+            return result["currency"] if result else 0
 
         async def add_achievement(
             self, user_id: int, achievement_id: str, rank: int, rewards: list
         ):
             """Add an achievement with a specific rank and rewards."""
             await self.verify_discord_user(user_id)
+            granted = {
+                "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                "rewards": rewards,
+            }
             async with self.db.acquire() as conn:
-                result = await conn.fetchrow(
-                    """
-                    SELECT achievements FROM users WHERE discord_id = $1;
-                    """,
-                    user_id,
-                )
-
-                achievements = (
-                    json.loads(result["achievements"])
-                    if result and result["achievements"]
-                    else {}
-                )
-
-                # Ensure the structure exists
-                if achievement_id not in achievements:
-                    achievements[achievement_id] = {"granted": {}}
-
-                # Add the rank entry
-                if str(rank) not in achievements[achievement_id]["granted"]:
-                    achievements[achievement_id]["granted"][str(rank)] = {
-                        "date": datetime.datetime.now(
-                            datetime.timezone.utc
-                        ).isoformat(),
-                        "rewards": rewards,
-                    }
-
-                # Update the database
-                await conn.execute(
+                # Add the rank entry, keeping the existing one if already granted
+                row = await conn.fetchrow(
                     """
-                    UPDATE users SET achievements = $1 WHERE discord_id = $2;
+                    UPDATE users
+                    SET achievements = jsonb_set(
+                        COALESCE(achievements, '{}'::jsonb),
+                        ARRAY[$2::text],
+                        COALESCE(achievements->($2::text), '{}'::jsonb)
+                        || jsonb_build_object(
+                            'granted',
+                            jsonb_build_object($3::text, $4::jsonb)
+                            || COALESCE(achievements->($2::text)->'granted', '{}'::jsonb)
+                        )
+                    )
+                    WHERE discord_id = $1
+                    RETURNING *;
                     """,
-                    json.dumps(achievements),
                     user_id,
+                    achievement_id,
+                    str(rank),
+                    json.dumps(granted),
                 )
+            self._cache_profile(user_id, row)
 
         async def get_achievements(self, user_id: int) -> dict:
             """Retrieve the user's achievements."""
-            await self.verify_discord_user(user_id)
-            async with self.db.acquire() as conn:
-                result = await conn.fetchrow(
-                    """
-                    SELECT achievements FROM users WHERE discord_id = $1;
-                    """,
-                    user_id,
-                )
-                return (
-                    json.loads(result["achievements"])
-                    if result and result["achievements"]
-                    else {}
-                )
+            result = await self.get_profile(user_id)
+            return copy.deepcopy(result["achievements"] if result else None) or {}
 
         async def remove_achievement(
             self, user_id: int, achievement_id: str, rank: int = None
@@ -1112,69 +1050,52 @@ class USER_DATA:
             """Remove a specific rank of an achievement."""
             await self.verify_discord_user(user_id)
             async with self.db.acquire() as conn:
-                result = await conn.fetchrow(
-                    """
-                    SELECT achievements FROM users WHERE discord_id = $1;
-                    """,
-                    user_id,
-                )
-
-                achievements = (
-                    json.loads(result["achievements"])
-                    if result and result["achievements"]
-                    else {}
-                )
-
-                # Remove the specified rank
                 if rank:
-                    if (
-                        achievement_id in achievements
-                        and str(rank) in achievements[achievement_id]["granted"]
-                    ):
-                        del achievements[achievement_id]["granted"][str(rank)]
-
-                        # If no more ranks remain, remove the achievement entry
-                        if not achievements[achievement_id]["granted"]:
-                            del achievements[achievement_id]
+                    # Remove the specified rank, and the achievement entry if no more ranks remain
+                    row = await conn.fetchrow(
+                        """
+                        UPDATE users
+                        SET achievements = CASE
+                            WHEN achievements->($2::text)->'granted' ? ($3::text)
+                            AND (achievements->($2::text)->'granted') - ($3::text) = '{}'::jsonb
+                            THEN achievements - ($2::text)
+                            ELSE achievements #- ARRAY[$2::text, 'granted', $3::text]
+                        END
+                        WHERE discord_id = $1
+                        RETURNING *;
+                        """,
+                        user_id,
+                        achievement_id,
+                        str(rank),
+                    )
                 else:
-                    del achievements[achievement_id]
-
-                # Update the database
-                await conn.execute(
-                    """
-                    UPDATE users SET achievements = $1 WHERE discord_id = $2;
-                    """,
-                    json.dumps(achievements),
-                    user_id,
-                )
+                    row = await conn.fetchrow(
+                        """
+                        UPDATE users
+                        SET achievements = achievements - ($2::text)
+                        WHERE discord_id = $1
+                        RETURNING *;
+                        """,
+                        user_id,
+                        achievement_id,
+                    )
+            self._cache_profile(user_id, row)
 
         async def has_achievement(self, user_id: int, achievement_id: str) -> int:
             """Check if the user has a specific achievement, returning rank."""
-            await self.verify_discord_user(user_id)
-            async with self.db.acquire() as conn:
-                result = await conn.fetchrow(
-                    """
-                    SELECT achievements FROM users WHERE discord_id = $1;
-                    """,
-                    user_id,
-                )
-
-                achievements = (
-                    json.loads(result["achievements"])
-                    if result and result["achievements"]
-                    else {}
-                )
+            result = await self.get_profile(user_id)
+            achievements = (result["achievements"] if result else None) or {}
 
-                # Check if the achievement exists
-                if achievement_id not in achievements:
-                    return 0
+            # Check if the achievement exists
+            if achievement_id not in achievements:
+                return 0
 
-                granted = achievements[achievement_id]["granted"]
+            granted = achievements[achievement_id]["granted"]
 
-                # Get the highest rank (key) in granted
-                highest_rank = max(int(rank) for rank in granted.keys())
+            # Get the highest rank (key) in granted
+            highest_rank = max(int(rank) for rank in granted.keys())
 
-                return highest_rank
+            return highest_rank
 
         async def toggle_guessing(self, guild_id: int, enabled: bool) -> int:
             """Toggle guessing on/off in a Discord gulid"""
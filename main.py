@@ -19,6 +19,12 @@ from discord import app_commands
 
 from fastapi import WebSocket
 
+from COGS import render_jobs  # registers the render workers' warmups
+from DATA.helpers.unblock import render_pool
+
+# render workers are forked from this, so before anything has started a thread
+render_pool.start()
+
 from COGS.discord_translations import SbotgaTranslator
 
 from DATA.helpers.logging import LOGGING
@@ -303,6 +309,7 @@ class DiscordBot(discord_commands.Bot):
         self.cache.constants = {}
         self.cache.constants_override = {}
         self.cache.constants_updated = 0
+        self.cache.constants_version = ""  # digest of the constants, for render caches
         self.cache.guess_channels = (
             {}
         )  #: Dict[int, Dict[str, Union[[int, str, Dict[str, str]]]] = {}